@@ -629,12 +629,14 @@ def test_smartswitch_configupdater_check_admin_state():
     admin_state = 0
     with patch.object(module, 'set_admin_state_gracefully') as mock_set_admin_state_gracefully:
         config_updater.module_config_update(name, admin_state)
+        assert config_updater.transition_executor.wait_idle(5)
         mock_set_admin_state_gracefully.assert_called_once_with(admin_state)
 
     # Test setting admin state to up
     admin_state = 1
     with patch.object(module, 'set_admin_state_gracefully') as mock_set_admin_state_gracefully:
         config_updater.module_config_update(name, admin_state)
+        assert config_updater.transition_executor.wait_idle(5)
         mock_set_admin_state_gracefully.assert_called_once_with(admin_state)
 
 
@@ -1650,7 +1652,7 @@ def test_set_initial_dpu_admin_state_exception():
 
 
 def test_set_initial_dpu_admin_state_threading():
-    """Test that set_initial_dpu_admin_state creates and waits for threads correctly"""
+    """Test that set_initial_dpu_admin_state submits transitions and waits for them to finish"""
     chassis = MockSmartSwitchChassis()
 
     # DPU0 details
@@ -1679,8 +1681,8 @@ def test_set_initial_dpu_admin_state_threading():
     daemon_chassisd.platform_chassis = chassis
     daemon_chassisd.smartswitch = True
 
-    # Mock thread
-    mock_thread = MagicMock()
+    # Mock transition executor
+    mock_executor = MagicMock()
 
     # Mock the necessary methods
     with patch.object(module_updater, 'get_module_admin_status', return_value=ModuleBase.MODULE_STATUS_EMPTY), \
@@ -1688,23 +1690,118 @@ def test_set_initial_dpu_admin_state_threading():
          patch.object(daemon_chassisd, 'submit_dpu_callback') as mock_submit_callback, \
          patch.object(module, 'clear_module_state_transition') as mock_clear_transition, \
          patch.object(module, 'clear_module_gnoi_halt_in_progress') as mock_clear_gnoi, \
-         patch('threading.Thread', return_value=mock_thread) as mock_thread_class:
+         patch('chassisd.DpuTransitionExecutor', return_value=mock_executor) as mock_executor_class:
 
         # Run the function
         daemon_chassisd.set_initial_dpu_admin_state()
 
-        # Verify thread was created with correct arguments
-        mock_thread_class.assert_called_once()
-        call_args = mock_thread_class.call_args
-        assert call_args[1]['target'] == daemon_chassisd.submit_dpu_callback
-        assert call_args[1]['args'] == (0, MODULE_ADMIN_DOWN)
+        # Verify executor was created with the DPU callback
+        mock_executor_class.assert_called_once()
+        call_args = mock_executor_class.call_args
+        assert call_args[0][1] == daemon_chassisd.submit_dpu_callback
 
-        # Verify thread was started and joined
-        mock_thread.start.assert_called_once()
-        mock_thread.join.assert_called_once()
+        # Verify transition was submitted and waited for
+        mock_executor.submit.assert_called_once_with(name, 0, MODULE_ADMIN_DOWN)
+        mock_executor.wait_idle.assert_called_once()
 
-        # Verify daemon flag was set
-        assert mock_thread.daemon == True
+
+def test_dpu_transition_executor_concurrent():
+    """Test that independent DPU transitions run concurrently up to the limit"""
+    import threading
+
+    release = threading.Event()
+    lock = threading.Lock()
+    running = []
+    max_running = [0]
+
+    def handler(module_index, admin_state):
+        with lock:
+            running.append(module_index)
+            max_running[0] = max(max_running[0], len(running))
+        release.wait(5)
+        with lock:
+            running.remove(module_index)
+
+    timing_table = MagicMock()
+    executor = DpuTransitionExecutor(SYSLOG_IDENTIFIER, handler, 2, timing_table)
+    for index in range(4):
+        executor.submit("DPU{}".format(index), index, MODULE_ADMIN_DOWN)
+
+    time.sleep(0.2)
+    assert len(executor.in_flight) == 2
+    assert len(executor.pending) == 2
+
+    release.set()
+    assert executor.wait_idle(5)
+    assert max_running[0] == 2
+    assert timing_table.set.call_count == 4
+
+    key, fvs = timing_table.set.call_args[0]
+    assert fvs.fv_dict[ADMIN_TRANSITION_STATE] == 'down'
+    assert float(fvs.fv_dict[ADMIN_TRANSITION_DURATION]) >= 0
+
+
+def test_dpu_transition_executor_serialize_and_coalesce():
+    """Test that transitions on the same DPU are serialized and superseded requests dropped"""
+    import threading
+
+    release = threading.Event()
+    calls = []
+
+    def handler(module_index, admin_state):
+        calls.append((module_index, admin_state))
+        release.wait(5)
+
+    executor = DpuTransitionExecutor(SYSLOG_IDENTIFIER, handler, 4)
+    executor.submit("DPU0", 0, MODULE_ADMIN_DOWN)
+    time.sleep(0.1)
+
+    # Same state as the in-flight transition is ignored
+    executor.submit("DPU0", 0, MODULE_ADMIN_DOWN)
+    assert "DPU0" not in executor.pending
+
+    # A queued request reverted to the in-flight state is dropped
+    executor.submit("DPU0", 0, MODULE_ADMIN_UP)
+    executor.submit("DPU0", 0, MODULE_ADMIN_DOWN)
+    assert "DPU0" not in executor.pending
+
+    # Only the latest of the queued requests is kept
+    executor.submit("DPU0", 0, MODULE_ADMIN_UP)
+    assert executor.pending["DPU0"] == (0, MODULE_ADMIN_UP)
+    assert executor.in_flight == {"DPU0": MODULE_ADMIN_DOWN}
+
+    release.set()
+    assert executor.wait_idle(5)
+    assert calls == [(0, MODULE_ADMIN_DOWN), (0, MODULE_ADMIN_UP)]
+
+
+def test_dpu_transition_executor_handler_exception():
+    """Test that a failing transition does not block the DPU"""
+    handler = MagicMock(side_effect=[Exception("failed"), True])
+    executor = DpuTransitionExecutor(SYSLOG_IDENTIFIER, handler, 1)
+
+    with patch.object(executor, 'log_error') as mock_log_error:
+        executor.submit("DPU0", 0, MODULE_ADMIN_DOWN)
+        assert executor.wait_idle(5)
+        mock_log_error.assert_called_once()
+
+    executor.submit("DPU0", 0, MODULE_ADMIN_UP)
+    assert executor.wait_idle(5)
+    assert handler.call_count == 2
+
+
+def test_get_dpu_max_parallel_transitions():
+    with patch("os.path.isfile", return_value=False):
+        assert get_dpu_max_parallel_transitions(8) == 8
+        assert get_dpu_max_parallel_transitions(0) == 1
+
+    with patch("os.path.isfile", return_value=True), \
+         patch("builtins.open", mock_open(read_data=json.dumps({"dpu_max_parallel_transitions": 3}))):
+        assert get_dpu_max_parallel_transitions(8) == 3
+
+    with patch("os.path.isfile", return_value=True), \
+         patch("builtins.open", mock_open(read_data="invalid json")):
+        assert get_dpu_max_parallel_transitions(8) == 8
 
 
 def test_daemon_run_supervisor_invalid_slot():
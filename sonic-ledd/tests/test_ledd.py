@@ -311,4 +311,128 @@ def test_port_does_not_exist(mock_daemon_ledd_class):
     mock_daemon_ledd.fp_ports.getPort.assert_not_called()
     mock_daemon_ledd.fp_ports.updatePortState.assert_not_called()
     mock_daemon_ledd.log_notice.assert_not_called()
-    mock_daemon_ledd.fp_ports.updatePortLed.assert_not_called()
\ No newline at end of file
+    mock_daemon_ledd.fp_ports.updatePortLed.assert_not_called()
+
+def test_front_panel_ports_update_port_leds():
+    ports = {"Ethernet0": ledd.Port("Ethernet0", 0, ledd.Port.PORT_DOWN, 0, "front-panel"),
+             "Ethernet4": ledd.Port("Ethernet4", 1, ledd.Port.PORT_DOWN, 0, "front-panel")}
+    led_states = {"Ethernet0": ledd.Port.PORT_UP, "Ethernet4": ledd.Port.PORT_DOWN}
+
+    # LEDs are updated one by one without bulk API
+    led_control = mock.Mock(spec=["port_link_state_change"])
+    fp_ports = ledd.FrontPanelPorts([], [], ports, led_control)
+    fp_ports.updatePortLeds(led_states)
+    assert led_control.port_link_state_change.call_args_list == [
+        mock.call("Ethernet0", ledd.Port.PORT_UP), mock.call("Ethernet4", ledd.Port.PORT_DOWN)]
+    assert fp_ports.getPortLedState("Ethernet0") == ledd.Port.PORT_UP
+    assert fp_ports.getPortLedState("Ethernet4") == ledd.Port.PORT_DOWN
+
+    # Bulk API
+    led_control = mock.Mock(spec=["port_link_state_change", "port_link_state_change_bulk"])
+    fp_ports = ledd.FrontPanelPorts([], [], ports, led_control)
+    fp_ports.updatePortLeds(led_states)
+    led_control.port_link_state_change_bulk.assert_called_once_with(led_states)
+    led_control.port_link_state_change.assert_not_called()
+
+    fp_ports.updatePortLeds({})
+    assert led_control.port_link_state_change_bulk.call_count == 1
+
+    led_control.port_link_state_change_bulk.side_effect = Exception
+    with pytest.raises(SystemExit) as pytest_wrapped_e:
+        fp_ports.updatePortLeds(led_states)
+    assert pytest_wrapped_e.value.code == ledd.LEDUTIL_RUNTIME_ERROR
+
+
+@mock.patch("ledd.swsscommon.CastSelectableToRedisSelectObj")
+def test_get_port_table_events(mock_cast_selectable):
+    """
+    Test PortStateObserver.getPortTableEvents drains the notifications of all namespaces
+    and keeps the last state of each port.
+    """
+    mock_cast_selectable.side_effect = lambda selectable: selectable
+
+    def mock_selectable(namespace, events):
+        selectable = mock.Mock()
+        selectable.getDbConnector.return_value.getNamespace.return_value = namespace
+        selectable.pop.side_effect = events + [("", "", ())]
+        return selectable
+
+    asic0 = mock_selectable("asic0", [
+        ("Ethernet0", "SET", [("oper_status", ledd.Port.PORT_DOWN)]),
+        ("Ethernet4", "SET", [("oper_status", ledd.Port.PORT_DOWN)]),
+        ("PortInitDone", "SET", [("lanes", "0")]),
+        ("Ethernet0", "SET", [("oper_status", ledd.Port.PORT_UP)]),
+    ])
+    asic1 = mock_selectable("asic1", [
+        ("Ethernet128", "SET", [("oper_status", ledd.Port.PORT_DOWN)]),
+        ("Ethernet132", "SET", [("admin_status", ledd.Port.PORT_UP)]),
+        ("Ethernet128", "DEL", []),
+    ])
+
+    observer = ledd.PortStateObserver()
+    observer.tables = {"asic0": asic0, "asic1": asic1}
+    observer.getSelectEvent = mock.Mock(side_effect=[(swsscommon.Select.OBJECT, asic1),
+                                                     (swsscommon.Select.TIMEOUT, None)])
+
+    assert observer.getPortTableEvents(asic0) == {"Ethernet0": ledd.Port.PORT_UP,
+                                                  "Ethernet4": ledd.Port.PORT_DOWN,
+                                                  "Ethernet128": ledd.Port.PORT_DOWN}
+    assert observer.getSelectEvent.call_args_list == [mock.call(0), mock.call(0)]
+
+    # Batch size is bounded
+    asic0.pop.side_effect = [("Ethernet0", "SET", [("oper_status", ledd.Port.PORT_DOWN)])] * 3
+    observer.getSelectEvent = mock.Mock(return_value=(swsscommon.Select.OBJECT, asic0))
+    with mock.patch("ledd.MAX_BATCH_EVENTS", 2):
+        assert observer.getPortTableEvents(asic0) == {"Ethernet0": ledd.Port.PORT_DOWN}
+    assert asic0.pop.call_count == 5 + 2
+
+
+@mock.patch('swsscommon.swsscommon.Select.addSelectable', mock.MagicMock())
+@mock.patch("ledd.DaemonLedd.load_platform_util")
+@mock.patch("ledd.multi_asic.get_front_end_namespaces")
+@mock.patch("ledd.DaemonLedd.findFrontPanelPorts")
+def test_daemon_ledd_run_batch(mock_find_front_panel_ports, mock_get_namespaces, mock_load_platform_util):
+    """
+    Test that DaemonLedd.run() coalesces a flap storm into one LED update per front panel port.
+    """
+    mock_get_namespaces.return_value = ['']
+    led_control = mock.Mock(spec=["port_link_state_change", "port_link_state_change_bulk"])
+    mock_load_platform_util.return_value = led_control
+
+    # Ethernet0 and Ethernet2 are the 2 subports of the front panel port 0
+    fp_list = [set() for _ in range(ledd.MAX_FRONT_PANEL_PORTS)]
+    fp_list[0] = {"Ethernet0", "Ethernet2"}
+    fp_list[1] = {"Ethernet4"}
+    up_subports = [0] * ledd.MAX_FRONT_PANEL_PORTS
+    up_subports[0] = 2
+    up_subports[1] = 1
+    lmap = {"Ethernet0": ledd.Port("Ethernet0", 0, ledd.Port.PORT_UP, 1, "front-panel"),
+            "Ethernet2": ledd.Port("Ethernet2", 0, ledd.Port.PORT_UP, 2, "front-panel"),
+            "Ethernet4": ledd.Port("Ethernet4", 1, ledd.Port.PORT_UP, 0, "front-panel")}
+    mock_find_front_panel_ports.return_value = (fp_list, up_subports, lmap)
+
+    daemon_ledd = ledd.DaemonLedd()
+    assert led_control.port_link_state_change.call_count == 2
+
+    daemon_ledd.portObserver.getSelectEvent = mock.Mock(return_value=(swsscommon.Select.OBJECT, mock.Mock()))
+    daemon_ledd.portObserver.getPortTableEvents = mock.Mock(return_value={
+        "Ethernet0": ledd.Port.PORT_DOWN,
+        "Ethernet2": ledd.Port.PORT_DOWN,
+        "Ethernet4": ledd.Port.PORT_UP,
+        "Ethernet8": ledd.Port.PORT_DOWN,
+    })
+    assert daemon_ledd.run() == 0
+    led_control.port_link_state_change_bulk.assert_called_once()
+    led_states = led_control.port_link_state_change_bulk.call_args[0][0]
+    assert len(led_states) == 1
+    assert list(led_states.values()) == [ledd.Port.PORT_DOWN]
+    assert up_subports[0] == 0
+
+    # One subport coming back up does not change the LED
+    daemon_ledd.portObserver.getPortTableEvents.return_value = {"Ethernet0": ledd.Port.PORT_UP}
+    assert daemon_ledd.run() == 0
+    assert led_control.port_link_state_change_bulk.call_count == 1
+
+    daemon_ledd.portObserver.getPortTableEvents.return_value = {"Ethernet2": ledd.Port.PORT_UP}
+    assert daemon_ledd.run() == 0
+    led_control.port_link_state_change_bulk.assert_called_with({"Ethernet2": ledd.Port.PORT_UP})
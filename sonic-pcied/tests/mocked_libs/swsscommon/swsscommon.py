@@ -4,6 +4,9 @@
 
 STATE_DB = ''
 
+SET_COMMAND = 'SET'
+DEL_COMMAND = 'DEL'
+
 
 class Table:
     def __init__(self, db, table_name):
@@ -56,6 +59,25 @@ class FieldValuePairs:
     def __str__(self):
         return repr(self.fv_dict)
 
+class Select:
+    OBJECT = 0
+    ERROR = 2
+    TIMEOUT = 1
+
+    def addSelectable(self, selectable):
+        pass
+
+    def removeSelectable(self, selectable):
+        pass
+
+    def select(self, timeout=-1, interrupt_on_signal=False):
+        return self.TIMEOUT, None
+
+
+class SubscriberStateTable(Table):
+    def pop(self):
+        return None
+
 class ConfigDBConnector:
     pass
 
@@ -192,15 +192,21 @@ class TestDaemonPcied(object):
     @mock.patch('pcied.load_platform_pcieutil', mock.MagicMock())
     def test_is_dpu_in_detaching_mode(self):
         daemon_pcied = pcied.DaemonPcied(SYSLOG_IDENTIFIER)
-        daemon_pcied.detach_info = mock.MagicMock()
-        daemon_pcied.detach_info.getKeys = mock.MagicMock(return_value=['DPU_0', 'DPU_1'])
-        # Mock the get() method to return tuple of (exists, field_value_pairs)
-        daemon_pcied.detach_info.get = mock.MagicMock(
-            side_effect=lambda key: {
-                'DPU_0': (True, [('bus_info', '0000:03:00.1'), ('dpu_state', 'detaching')]),
-                'DPU_1': (True, [('bus_info', '0000:03:00.2'), ('dpu_state', 'attached')])
-            }.get(key, (False, []))
-        )
+        notifications = [
+            ('DPU_0', 'SET', (('bus_info', '0000:03:00.1'), ('dpu_state', 'detaching'))),
+            ('DPU_1', 'SET', (('bus_info', '0000:03:00.2'), ('dpu_state', 'attached'))),
+        ]
+        mock_sel = mock.MagicMock()
+        mock_sel.select.side_effect = lambda timeout: (pcied.swsscommon.Select.OBJECT if notifications else pcied.swsscommon.Select.TIMEOUT, None)
+        mock_sub = mock.MagicMock()
+        mock_sub.pop.side_effect = lambda: notifications.pop(0)
+
+        # Test when detach_info has no entries
+        assert daemon_pcied.is_dpu_in_detaching_mode('0000:03:00.1') == False
+
+        with mock.patch('pcied.swsscommon.Select', mock.MagicMock(return_value=mock_sel, OBJECT=0, TIMEOUT=1)), \
+                mock.patch('pcied.swsscommon.SubscriberStateTable', mock.MagicMock(return_value=mock_sub)):
+            daemon_pcied.update_detach_info()
 
         # Test when the device is in detaching mode
         assert daemon_pcied.is_dpu_in_detaching_mode('0000:03:00.1') == True
@@ -211,15 +217,43 @@ class TestDaemonPcied(object):
         # Test when the device does not exist in detach_info
         assert daemon_pcied.is_dpu_in_detaching_mode('0000:03:00.3') == False
 
-        # Test when detach_info is None
-        daemon_pcied.detach_info = None
+        # The subscription is created once, later notifications update the cache
+        notifications.append(('DPU_1', 'SET', (('bus_info', '0000:03:00.2'), ('dpu_state', 'detaching'))))
+        notifications.append(('DPU_0', 'DEL', ()))
+        daemon_pcied.update_detach_info()
         assert daemon_pcied.is_dpu_in_detaching_mode('0000:03:00.1') == False
+        assert daemon_pcied.is_dpu_in_detaching_mode('0000:03:00.2') == True
+        assert mock_sub.pop.call_count == 4
 
-        # Test when detach_info has no keys
-        daemon_pcied.detach_info = mock.MagicMock()
-        daemon_pcied.detach_info.getKeys.return_value = []
+    @mock.patch('pcied.load_platform_pcieutil', mock.MagicMock())
+    def test_update_detach_info_exception(self):
+        daemon_pcied = pcied.DaemonPcied(SYSLOG_IDENTIFIER)
+        daemon_pcied.log_error = mock.MagicMock()
+        with mock.patch('pcied.swsscommon.SubscriberStateTable', mock.MagicMock(side_effect=Exception('Test Exception'))):
+            daemon_pcied.update_detach_info()
+        daemon_pcied.log_error.assert_called_once_with("Exception while reading PCIE_DETACH_INFO: Test Exception")
         assert daemon_pcied.is_dpu_in_detaching_mode('0000:03:00.1') == False
 
+    @mock.patch('pcied.device_info.is_smartswitch', mock.MagicMock(return_value=True))
+    @mock.patch('pcied.load_platform_pcieutil', mock.MagicMock())
+    def test_check_pcie_devices_reads_detach_info_once(self):
+        daemon_pcied = pcied.DaemonPcied(SYSLOG_IDENTIFIER)
+        daemon_pcied.update_pcie_devices_status_db = mock.MagicMock()
+        daemon_pcied.update_detach_info = mock.MagicMock()
+        daemon_pcied.detaching_devices = {'0000:03:00.1'}
+        daemon_pcied.log_warning = mock.MagicMock()
+        pcied.platform_pcieutil.get_pcie_check = mock.MagicMock(
+            return_value=[
+                {"result": "Failed", "bus": "03", "dev": "00", "fn": "1", "name": "PCIe Device 1"},
+                {"result": "Failed", "bus": "03", "dev": "00", "fn": "2", "name": "PCIe Device 2"},
+            ]
+        )
+
+        daemon_pcied.check_pcie_devices()
+        daemon_pcied.update_detach_info.assert_called_once()
+        daemon_pcied.log_warning.assert_called_once_with("PCIe Device: PCIe Device 2 Not Found")
+        daemon_pcied.update_pcie_devices_status_db.assert_called_once_with(1)
+
     @mock.patch('pcied.device_info.is_smartswitch', mock.MagicMock(return_value=False))
     @mock.patch('pcied.DaemonPcied.is_dpu_in_detaching_mode', mock.MagicMock(return_value=False))
     @mock.patch('pcied.load_platform_pcieutil', mock.MagicMock())
@@ -396,6 +430,155 @@ class TestDaemonPcied(object):
         )
 
 
+    @mock.patch('pcied.load_platform_pcieutil', mock.MagicMock())
+    @mock.patch('pcied.PCIED_FULL_RESCAN_SECS', 600)
+    def test_get_pcie_check_baseline(self):
+        daemon_pcied = pcied.DaemonPcied(SYSLOG_IDENTIFIER)
+        daemon_pcied.hotplug_monitor = mock.MagicMock()
+        daemon_pcied.hotplug_monitor.has_pci_event.return_value = False
+        pcied.platform_pcieutil.get_pcie_check = mock.MagicMock(
+            return_value=[
+                {"result": "Passed", "bus": "03", "dev": "00", "fn": "1", "name": "PCIe Device 1"},
+                {"result": "Failed", "bus": "0a", "dev": "00", "fn": "0", "name": "PCIe Device 2"},
+            ]
+        )
+        present = {pcied.get_device_sysfs_path(3, 0, 1)}
+
+        with mock.patch('pcied.os.path.exists', side_effect=lambda path: path in present):
+            with mock.patch('pcied.time.monotonic', return_value=100):
+                result = daemon_pcied.get_pcie_check()
+            assert pcied.platform_pcieutil.get_pcie_check.call_count == 1
+            assert daemon_pcied.pcie_baseline == {pcied.get_device_sysfs_path(3, 0, 1): True,
+                                                  pcied.get_device_sysfs_path(10, 0, 0): False}
+
+            # No change, the last result is reused
+            with mock.patch('pcied.time.monotonic', return_value=160):
+                assert daemon_pcied.get_pcie_check() == result
+            assert pcied.platform_pcieutil.get_pcie_check.call_count == 1
+
+            # Hotplug event
+            daemon_pcied.hotplug_monitor.has_pci_event.return_value = True
+            with mock.patch('pcied.time.monotonic', return_value=220):
+                daemon_pcied.get_pcie_check()
+            assert pcied.platform_pcieutil.get_pcie_check.call_count == 2
+            daemon_pcied.hotplug_monitor.has_pci_event.return_value = False
+
+            # Device appeared without a hotplug event
+            present.add(pcied.get_device_sysfs_path(10, 0, 0))
+            with mock.patch('pcied.time.monotonic', return_value=280):
+                daemon_pcied.get_pcie_check()
+            assert pcied.platform_pcieutil.get_pcie_check.call_count == 3
+
+            # Device still reported as failed by the platform, no further full check
+            with mock.patch('pcied.time.monotonic', return_value=340):
+                daemon_pcied.get_pcie_check()
+            assert pcied.platform_pcieutil.get_pcie_check.call_count == 3
+
+            # Safety interval
+            with mock.patch('pcied.time.monotonic', return_value=280 + pcied.PCIED_FULL_RESCAN_SECS):
+                daemon_pcied.get_pcie_check()
+            assert pcied.platform_pcieutil.get_pcie_check.call_count == 4
+
+        # Failed full check is retried on the next cycle
+        pcied.platform_pcieutil.get_pcie_check = mock.MagicMock(return_value=None)
+        daemon_pcied.hotplug_monitor.has_pci_event.return_value = True
+        daemon_pcied.check_pcie_devices()
+        assert daemon_pcied.pcie_baseline is None
+        daemon_pcied.hotplug_monitor.has_pci_event.return_value = False
+        daemon_pcied.check_pcie_devices()
+        assert pcied.platform_pcieutil.get_pcie_check.call_count == 2
+
+    @mock.patch('pcied.load_platform_pcieutil', mock.MagicMock())
+    def test_update_aer_to_statedb_changed_fields(self):
+        daemon_pcied = pcied.DaemonPcied(SYSLOG_IDENTIFIER)
+        daemon_pcied.device_table = mock.MagicMock()
+        daemon_pcied.device_name = "03:00.1"
+
+        daemon_pcied.aer_stats = {'correctable': {'RxErr': '0', 'BadTLP': '0', 'TOTAL_ERR_COR': '0'},
+                                  'fatal': {'DLP': '0'}, 'non_fatal': {}}
+        with mock.patch('pcied.time.monotonic', return_value=100):
+            daemon_pcied.update_aer_to_statedb()
+        # No rate before the second sample
+        daemon_pcied.device_table.set.assert_called_once()
+        assert daemon_pcied.device_table.set.call_args[0][0] == "03:00.1"
+
+        # Only changed counters and rates are written, the rates under their own key
+        daemon_pcied.device_table.set.reset_mock()
+        daemon_pcied.aer_stats = {'correctable': {'RxErr': '4', 'BadTLP': '1', 'TOTAL_ERR_COR': '5'},
+                                  'fatal': {'DLP': '0'}, 'non_fatal': {}}
+        with mock.patch('pcied.time.monotonic', return_value=110):
+            daemon_pcied.update_aer_to_statedb()
+        assert daemon_pcied.device_table.set.call_args_list == [
+            mock.call("03:00.1", pcied.swsscommon.FieldValuePairs([
+                ('correctable|RxErr', '4'),
+                ('correctable|BadTLP', '1'),
+                ('correctable|TOTAL_ERR_COR', '5'),
+            ])),
+            mock.call("03:00.1|RATE", pcied.swsscommon.FieldValuePairs([
+                ('correctable', '0.500'),
+                ('fatal', '0.000'),
+                ('non_fatal', '0.000'),
+            ])),
+        ]
+
+        # Nothing changed but the rate dropping back to zero
+        daemon_pcied.device_table.set.reset_mock()
+        with mock.patch('pcied.time.monotonic', return_value=120):
+            daemon_pcied.update_aer_to_statedb()
+        daemon_pcied.device_table.set.assert_called_once_with("03:00.1|RATE", pcied.swsscommon.FieldValuePairs([
+            ('correctable', '0.000'),
+        ]))
+
+        daemon_pcied.device_table.set.reset_mock()
+        with mock.patch('pcied.time.monotonic', return_value=130):
+            daemon_pcied.update_aer_to_statedb()
+        daemon_pcied.device_table.set.assert_not_called()
+
+        # Everything is rewritten once the device was not found
+        daemon_pcied.clear_device_cache(3, 0, 1)
+        with mock.patch('pcied.time.monotonic', return_value=140):
+            daemon_pcied.update_aer_to_statedb()
+        assert len(daemon_pcied.device_table.set.call_args[0][1].fv_dict) == 4
+
+    @mock.patch('pcied.load_platform_pcieutil', mock.MagicMock())
+    def test_run_polls_aer_between_checks(self):
+        daemon_pcied = pcied.DaemonPcied(SYSLOG_IDENTIFIER)
+        daemon_pcied.hotplug_monitor = mock.MagicMock()
+        daemon_pcied.hotplug_monitor.has_pci_event.return_value = False
+        daemon_pcied.aer_collector = mock.MagicMock()
+        daemon_pcied.aer_collector.get_pcie_aer_stats.return_value = pcie_aer_stats_no_err
+        daemon_pcied.stop_event.wait = mock.MagicMock(return_value=False)
+        daemon_pcied.update_pcie_devices_status_db = mock.MagicMock()
+        daemon_pcied.device_table = mock.MagicMock()
+        pcied.platform_pcieutil.get_pcie_check = mock.MagicMock(
+            return_value=[
+                {"result": "Passed", "bus": "03", "dev": "00", "fn": "1", "name": "PCIe Device 1"},
+            ]
+        )
+
+        with mock.patch('pcied.read_id_file', mock.MagicMock(return_value='1714')), \
+                mock.patch('pcied.time.monotonic', return_value=100):
+            assert daemon_pcied.run() == True
+        assert pcied.platform_pcieutil.get_pcie_check.call_count == 1
+        assert daemon_pcied.present_devices == [(3, 0, 1)]
+        assert daemon_pcied.aer_collector.get_pcie_aer_stats.call_count == 1
+
+        # AER is polled from the collector until the next device check
+        with mock.patch('pcied.time.monotonic', return_value=110):
+            assert daemon_pcied.run() == True
+        assert pcied.platform_pcieutil.get_pcie_check.call_count == 1
+        assert daemon_pcied.aer_collector.get_pcie_aer_stats.call_count == 2
+        daemon_pcied.aer_collector.get_pcie_aer_stats.assert_called_with(bus=3, dev=0, func=1)
+        pcied.platform_pcieutil.get_pcie_aer_stats.assert_not_called()
+
+        with mock.patch('pcied.read_id_file', mock.MagicMock(return_value='1714')), \
+                mock.patch('pcied.time.monotonic', return_value=100 + pcied.PCIED_MAIN_THREAD_SLEEP_SECS):
+            assert daemon_pcied.run() == True
+        # Every device check is a full check by default
+        assert pcied.platform_pcieutil.get_pcie_check.call_count == 2
+        assert daemon_pcied.update_pcie_devices_status_db.call_count == 2
+        assert daemon_pcied.aer_collector.get_pcie_aer_stats.call_count == 3
+
     @mock.patch('pcied.load_platform_pcieutil', mock.MagicMock())
     @mock.patch('pcied.daemon_base.db_connect', mock.MagicMock())
     @mock.patch('pcied.sys.exit')
@@ -1,4 +1,5 @@
 import os
+import socket
 import sys
 import pytest
 
@@ -102,3 +103,78 @@ def test_load_platform_pcieutil():
 
             mock_log.log_notice.assert_called_once()
             assert mock_log.log_error.call_count == 2
+
+def test_is_default_aer_stats():
+    from sonic_platform_base.sonic_pcie.pcie_common import PcieUtil
+
+    class PlatformPcie(PcieUtil):
+        pass
+
+    class PlatformPcieAer(PcieUtil):
+        def get_pcie_aer_stats(self, domain=0, bus=0, dev=0, func=0):
+            return {}
+
+    with patch('pcied.platform_pcieutil', PlatformPcie('/tmp')):
+        assert pcied.is_default_aer_stats()
+    with patch('pcied.platform_pcieutil', PlatformPcieAer('/tmp')):
+        assert not pcied.is_default_aer_stats()
+    with patch('pcied.platform_pcieutil', MagicMock()):
+        assert not pcied.is_default_aer_stats()
+
+
+def test_aer_stats_collector(tmp_path):
+    dev_path = tmp_path / '0000:03:00.1'
+    dev_path.mkdir()
+    (dev_path / 'aer_dev_correctable').write_text('RxErr 0\nBadTLP 1\nTOTAL_ERR_COR 1\n')
+    (dev_path / 'aer_dev_fatal').write_text('DLP 0\nTOTAL_ERR_FATAL 0\n')
+
+    collector = pcied.AerStatsCollector()
+    with patch('pcied.PCI_DEVICES_SYSFS_PATH', str(tmp_path)):
+        aer_stats = collector.get_pcie_aer_stats(bus=3, dev=0, func=1)
+        assert aer_stats == {'correctable': {'RxErr': '0', 'BadTLP': '1', 'TOTAL_ERR_COR': '1'},
+                             'fatal': {'DLP': '0', 'TOTAL_ERR_FATAL': '0'},
+                             'non_fatal': {}}
+        assert len(collector.fds) == 2
+
+        # Counter files are kept open and re-read from the start
+        (dev_path / 'aer_dev_correctable').write_text('RxErr 2\nBadTLP 1\nTOTAL_ERR_COR 3\n')
+        fds = dict(collector.fds)
+        aer_stats = collector.get_pcie_aer_stats(bus=3, dev=0, func=1)
+        assert aer_stats['correctable'] == {'RxErr': '2', 'BadTLP': '1', 'TOTAL_ERR_COR': '3'}
+        assert collector.fds == fds
+
+        # Read error closes the file
+        with patch('pcied.os.pread', side_effect=OSError('No such device')):
+            aer_stats = collector.get_pcie_aer_stats(bus=3, dev=0, func=1)
+        assert aer_stats == {'correctable': {}, 'fatal': {}, 'non_fatal': {}}
+        assert not collector.fds
+
+        collector.get_pcie_aer_stats(bus=3, dev=0, func=1)
+        assert len(collector.fds) == 2
+        collector.close_device(bus=3, dev=0, func=1)
+        assert not collector.fds
+
+def test_pcie_hotplug_monitor():
+    with patch('pcied.socket.socket', side_effect=OSError('Protocol not supported')), \
+            patch('pcied.log') as mock_log:
+        monitor = pcied.PcieHotplugMonitor()
+        assert monitor.sock is None
+        assert mock_log.log_warning.call_count == 1
+    assert not monitor.has_pci_event()
+
+    monitor.sock, peer = socket.socketpair(socket.AF_UNIX, socket.SOCK_DGRAM)
+    monitor.sock.setblocking(False)
+    assert not monitor.has_pci_event()
+
+    peer.send(b'add@/devices/platform/serial8250\0ACTION=add\0SUBSYSTEM=platform\0')
+    assert not monitor.has_pci_event()
+
+    peer.send(b'remove@/devices/pci0000:00/0000:00:1c.0/0000:03:00.1\0ACTION=remove\0SUBSYSTEM=pci\0')
+    peer.send(b'add@/devices/platform/serial8250\0ACTION=add\0SUBSYSTEM=platform\0')
+    assert monitor.has_pci_event()
+    # The events were drained
+    assert not monitor.has_pci_event()
+
+    monitor.close()
+    peer.close()
+    assert monitor.sock is None
@@ -792,9 +792,10 @@ class TestDaemonPsud(object):
         mock_psu_tbl = mock.MagicMock()
         mock_fan_tbl = mock.MagicMock()
         mock_phy_entity_tbl = mock.MagicMock()
+        mock_psu_stats_tbl = mock.MagicMock()
 
         # Return different mock tables for each Table() call
-        mock_table.side_effect = [mock_chassis_tbl, mock_psu_tbl, mock_fan_tbl, mock_phy_entity_tbl]
+        mock_table.side_effect = [mock_chassis_tbl, mock_psu_tbl, mock_fan_tbl, mock_phy_entity_tbl, mock_psu_stats_tbl]
 
         # Simulate RuntimeError when setting PSU number
         mock_chassis_tbl.set.side_effect = RuntimeError("BUSY Redis is busy running a script")
@@ -880,7 +881,8 @@ class TestDaemonPsud(object):
         mock_psu_tbl = mock.MagicMock()
         mock_fan_tbl = mock.MagicMock()
         mock_phy_entity_tbl = mock.MagicMock()
-        mock_table.side_effect = [mock_chassis_tbl, mock_psu_tbl, mock_fan_tbl, mock_phy_entity_tbl]
+        mock_psu_stats_tbl = mock.MagicMock()
+        mock_table.side_effect = [mock_chassis_tbl, mock_psu_tbl, mock_fan_tbl, mock_phy_entity_tbl, mock_psu_stats_tbl]
 
         daemon_psud = psud.DaemonPsud(SYSLOG_IDENTIFIER)
         assert daemon_psud.all_power_entity_names == []
@@ -900,7 +902,8 @@ class TestDaemonPsud(object):
         mock_psu_tbl = mock.MagicMock()
         mock_fan_tbl = mock.MagicMock()
         mock_phy_entity_tbl = mock.MagicMock()
-        mock_table.side_effect = [mock_chassis_tbl, mock_psu_tbl, mock_fan_tbl, mock_phy_entity_tbl]
+        mock_psu_stats_tbl = mock.MagicMock()
+        mock_table.side_effect = [mock_chassis_tbl, mock_psu_tbl, mock_fan_tbl, mock_phy_entity_tbl, mock_psu_stats_tbl]
 
         daemon_psud = psud.DaemonPsud(SYSLOG_IDENTIFIER)
         key_chassis = MockChassis()
@@ -962,3 +965,193 @@ class TestDaemonPsud(object):
         status = daemon_psud.psu_status_dict['PSU 1']
         assert status.check_psu_power_threshold
         assert status.power_exceeded_threshold
+
+    @mock.patch('psud.datetime')
+    def test_static_info_read_on_slow_cadence(self, mock_datetime):
+        mock_now = mock.MagicMock()
+        mock_now.timestamp.return_value = self._FIXED_PSU_TS
+        mock_datetime.now.return_value = mock_now
+
+        psu = MockPsu('PSU 1', 0, True, 'Fake Model', '12345678', '1234')
+        psu.get_model = mock.MagicMock(return_value='Fake Model')
+        psu.get_temperature_high_threshold = mock.MagicMock(return_value=50.0)
+        psu.get_psu_power_critical_threshold = mock.MagicMock(wraps=psu.get_psu_power_critical_threshold)
+        psud.platform_chassis = MockChassis()
+        psud.platform_chassis._psu_list = [psu]
+
+        daemon_psud = psud.DaemonPsud(SYSLOG_IDENTIFIER)
+        daemon_psud.psu_tbl = mock.MagicMock()
+        daemon_psud._update_single_psu_data(psu)
+        assert psu.get_model.call_count == 1
+        assert psu.get_temperature_high_threshold.call_count == 1
+        assert psu.get_psu_power_critical_threshold.call_count == 1
+
+        # Fast cadence, only volatile readings and power thresholds are read
+        daemon_psud.first_run = False
+        daemon_psud.slow_update = False
+        psu.set_power(110.0)
+        daemon_psud._update_single_psu_data(psu)
+        assert psu.get_model.call_count == 1
+        assert psu.get_temperature_high_threshold.call_count == 1
+        assert psu.get_psu_power_critical_threshold.call_count == 2
+        daemon_psud.psu_tbl.set.assert_called_with('PSU 1', self._construct_expected_fvp(110.0))
+
+        # Power good change re-reads static information
+        psu.set_status(False)
+        daemon_psud._update_single_psu_data(psu)
+        assert psu.get_model.call_count == 2
+
+        # Presence change re-reads static information
+        psu.set_presence(False)
+        daemon_psud._update_single_psu_data(psu)
+        assert psu.get_model.call_count == 3
+        assert psu.get_temperature_high_threshold.call_count == 2
+
+        # Slow cadence
+        daemon_psud.slow_update = True
+        daemon_psud._update_single_psu_data(psu)
+        assert psu.get_model.call_count == 4
+
+    @mock.patch('psud.datetime')
+    def test_unchanged_psu_info_not_rewritten(self, mock_datetime):
+        mock_now = mock.MagicMock()
+        mock_now.timestamp.return_value = self._FIXED_PSU_TS
+        mock_datetime.now.return_value = mock_now
+
+        psu = MockPsu('PSU 1', 0, True, 'Fake Model', '12345678', '1234')
+        psud.platform_chassis = MockChassis()
+        psud.platform_chassis._psu_list = [psu]
+
+        daemon_psud = psud.DaemonPsud(SYSLOG_IDENTIFIER)
+        daemon_psud.psu_tbl = mock.MagicMock()
+        daemon_psud._update_single_psu_data(psu)
+        assert daemon_psud.psu_tbl.set.call_count == 1
+
+        daemon_psud.first_run = False
+        daemon_psud.slow_update = False
+        daemon_psud._update_single_psu_data(psu)
+        assert daemon_psud.psu_tbl.set.call_count == 1
+
+        psu.set_power(101.0)
+        daemon_psud._update_single_psu_data(psu)
+        assert daemon_psud.psu_tbl.set.call_count == 2
+
+        # The row is rewritten on the slow cadence even if unchanged
+        daemon_psud.slow_update = True
+        daemon_psud._update_single_psu_data(psu)
+        assert daemon_psud.psu_tbl.set.call_count == 3
+
+        # A failed write is retried on the next run
+        daemon_psud.slow_update = False
+        daemon_psud.log_error = mock.MagicMock()
+        daemon_psud.psu_tbl.set.side_effect = RuntimeError("BUSY Redis is busy running a script")
+        psu.set_power(102.0)
+        daemon_psud._update_single_psu_data(psu)
+        daemon_psud.psu_tbl.set.side_effect = None
+        daemon_psud._update_single_psu_data(psu)
+        assert daemon_psud.psu_tbl.set.call_count == 5
+
+    def test_update_led_color_change_only(self):
+        mock_psu = MockPsu("PSU 1", 0, True, True)
+        mock_fan = MockFan("PSU 1 Test Fan 1", MockFan.FAN_DIRECTION_INTAKE)
+        mock_psu._fan_list = [mock_fan]
+        psud.platform_chassis = MockChassis()
+
+        daemon_psud = psud.DaemonPsud(SYSLOG_IDENTIFIER)
+        daemon_psud.psu_tbl = mock.MagicMock()
+        daemon_psud.fan_tbl = mock.MagicMock()
+        daemon_psud.psu_status_dict['PSU 1'] = psud.PsuStatus(mock.MagicMock(), mock_psu, 'PSU 1')
+
+        daemon_psud._update_led_color()
+        daemon_psud._update_led_color()
+        assert daemon_psud.psu_tbl.set.call_count == 1
+        assert daemon_psud.fan_tbl.set.call_count == 1
+
+        mock_psu.set_status_led(MockPsu.STATUS_LED_COLOR_GREEN)
+        daemon_psud._update_led_color()
+        assert daemon_psud.psu_tbl.set.call_count == 2
+        assert daemon_psud.fan_tbl.set.call_count == 1
+
+    def test_run_slow_update(self):
+        psud.platform_chassis = MockChassis()
+        daemon_psud = psud.DaemonPsud(SYSLOG_IDENTIFIER)
+        daemon_psud.stop_event.wait = mock.MagicMock(return_value=False)
+        daemon_psud._update_psu_entity_info = mock.MagicMock()
+        daemon_psud.update_psu_data = mock.MagicMock()
+        daemon_psud.update_pdb_data = mock.MagicMock()
+        daemon_psud._update_led_color = mock.MagicMock()
+        daemon_psud.update_psu_chassis_info = mock.MagicMock()
+        daemon_psud.psu_led_status['PSU 1'] = 'green'
+
+        daemon_psud.run()
+        assert daemon_psud.slow_update
+        assert daemon_psud._update_psu_entity_info.call_count == 1
+        assert not daemon_psud.psu_led_status
+
+        daemon_psud.psu_led_status['PSU 1'] = 'green'
+        daemon_psud.run()
+        assert not daemon_psud.slow_update
+        assert daemon_psud._update_psu_entity_info.call_count == 1
+        assert daemon_psud.psu_led_status == {'PSU 1': 'green'}
+
+        daemon_psud.next_slow_update = 0
+        daemon_psud.run()
+        assert daemon_psud.slow_update
+        assert daemon_psud._update_psu_entity_info.call_count == 2
+
+    def test_update_psu_stats(self):
+        psu = MockPsu('PSU 1', 0, True, 'Fake Model', '12345678', '1234')
+        absent_psu = MockPsu('PSU 2', 1, False, 'Fake Model', '12345678', '1234')
+        psud.platform_chassis = MockChassis()
+        psud.platform_chassis._psu_list = [psu, absent_psu]
+
+        daemon_psud = psud.DaemonPsud(SYSLOG_IDENTIFIER)
+        daemon_psud.psu_tbl = mock.MagicMock()
+        daemon_psud.psu_stats_tbl = mock.MagicMock()
+        daemon_psud.update_psu_data()
+        daemon_psud._update_chassis_power_history()
+        psu.set_power(120.0)
+        daemon_psud.update_psu_data()
+        daemon_psud._update_chassis_power_history()
+
+        daemon_psud._update_psu_stats()
+        calls = dict((call[0][0], dict(call[0][1].fv_dict)) for call in daemon_psud.psu_stats_tbl.set.call_args_list)
+        assert calls['PSU 1']['power_min'] == '100.0'
+        assert calls['PSU 1']['power_max'] == '120.0'
+        assert calls['PSU 1']['temp_avg'] == '30.0'
+        assert calls['PSU 1'][psud.PSU_STATS_SAMPLES_FIELD] == '2'
+        assert calls[psud.CHASSIS_INFO_KEY]['power_avg'] == '110.0'
+        # No samples for an absent PSU
+        daemon_psud.psu_stats_tbl._del.assert_called_once_with('PSU 2')
+
+        # History is restarted when the PSU is removed
+        psu.set_presence(False)
+        daemon_psud.update_psu_data()
+        assert len(daemon_psud.psu_status_dict['PSU 1'].history.get('power')) == 0
+
+    @mock.patch('psud.datetime')
+    def test_power_threshold_use_average(self, mock_datetime):
+        mock_now = mock.MagicMock()
+        mock_now.timestamp.return_value = self._FIXED_PSU_TS
+        mock_datetime.now.return_value = mock_now
+
+        psu = MockPsu('PSU 1', 0, True, 'Fake Model', '12345678', '1234')
+        psu.get_psu_power_critical_threshold = mock.MagicMock(return_value=130.0)
+        psu.get_psu_power_warning_suppress_threshold = mock.MagicMock(return_value=120.0)
+        psud.platform_chassis = MockChassis()
+        psud.platform_chassis._psu_list = [psu]
+
+        daemon_psud = psud.DaemonPsud(SYSLOG_IDENTIFIER, power_threshold_use_average=True)
+        daemon_psud.psu_tbl = mock.MagicMock()
+        daemon_psud._update_single_psu_data(psu)
+        daemon_psud.first_run = False
+        assert daemon_psud.psu_status_dict['PSU 1'].check_psu_power_threshold
+
+        # A single spike above the critical threshold does not raise the alarm
+        psu.set_power(150.0)
+        daemon_psud._update_single_psu_data(psu)
+        assert not daemon_psud.psu_status_dict['PSU 1'].power_exceeded_threshold
+
+        # Average of 100, 150, 150 exceeds the critical threshold
+        daemon_psud._update_single_psu_data(psu)
+        assert daemon_psud.psu_status_dict['PSU 1'].power_exceeded_threshold
@@ -39,17 +39,25 @@ sys.path.insert(0, mocked_libs_path)
 load_source('swsscommon', os.path.join(mocked_libs_path, 'swsscommon', 'swsscommon.py'))
 import swsscommon as mock_swsscommon
 
-# Patch Table.set so it accepts real swsscommon.FieldValuePairs (no .fv_dict) from production code
-_original_table_set = mock_swsscommon.Table.set
+# Patch Table.set so it accepts real swsscommon.FieldValuePairs (no .fv_dict) from production code,
+# and merges fields into an existing entry like the real Table.set does
 def _patched_table_set(self, key, fvs):
     if hasattr(fvs, 'fv_dict'):
-        return _original_table_set(self, key, fvs)
-    try:
-        self.mock_dict[key] = dict(fvs)
-    except (TypeError, ValueError):
-        self.mock_dict[key] = dict(list(fvs))
+        fv_dict = fvs.fv_dict
+    else:
+        try:
+            fv_dict = dict(fvs)
+        except (TypeError, ValueError):
+            fv_dict = dict(list(fvs))
+    self.mock_dict.setdefault(key, {}).update(fv_dict)
 mock_swsscommon.Table.set = _patched_table_set
 
+# Patch Table.hdel so it only removes the given field, like the real Table.hdel does
+def _patched_table_hdel(self, key, field):
+    if key in self.mock_dict:
+        self.mock_dict[key].pop(field, None)
+mock_swsscommon.Table.hdel = _patched_table_hdel
+
 # Add path to the file under test so that we can load it
 modules_path = os.path.dirname(tests_path)
 scripts_path = os.path.join(modules_path, "scripts")
@@ -475,3 +483,108 @@ class TestPsuChassisInfo(object):
         chassis_info.run_power_budget(chassis_tbl)
         fvs = chassis_tbl.get(CHASSIS_INFO_POWER_KEY_TEMPLATE.format(1))
         assert float(fvs[CHASSIS_INFO_TOTAL_POWER_SUPPLIED_FIELD]) == 0.0
+
+    def test_run_power_budget_reads_max_power_on_change(self):
+        chassis = MockChassis()
+        psu1 = MockPsu("PSU 1", 0, True, True)
+        psu1.set_maximum_supplied_power(510.0)
+        psu1.get_maximum_supplied_power = mock.MagicMock(return_value=510.0)
+        chassis._psu_list.append(psu1)
+
+        module1 = MockModule("Module 1", 0, True, True)
+        module1.get_maximum_consumed_power = mock.MagicMock(return_value=700.0)
+        chassis._module_list.append(module1)
+
+        state_db = daemon_base.db_connect("STATE_DB")
+        chassis_tbl = mock_swsscommon.Table(state_db, CHASSIS_INFO_TABLE)
+        chassis_info = psud.PsuChassisInfo(SYSLOG_IDENTIFIER, chassis)
+        chassis_info.run_power_budget(chassis_tbl)
+        assert psu1.get_maximum_supplied_power.call_count == 1
+        assert module1.get_maximum_consumed_power.call_count == 1
+
+        # Nothing changed, maximum power is not read again
+        chassis_info.run_power_budget(chassis_tbl)
+        assert psu1.get_maximum_supplied_power.call_count == 1
+        assert module1.get_maximum_consumed_power.call_count == 1
+
+        # Power good status changed, maximum supplied power is not read while power is bad
+        psu1.set_status(False)
+        chassis_info.run_power_budget(chassis_tbl)
+        assert psu1.get_maximum_supplied_power.call_count == 1
+        assert chassis_info.total_supplied_power == 0.0
+
+        psu1.set_status(True)
+        chassis_info.run_power_budget(chassis_tbl)
+        assert psu1.get_maximum_supplied_power.call_count == 2
+        assert chassis_info.total_supplied_power == 510.0
+
+        # Presence changed
+        module1.set_presence(False)
+        chassis_info.run_power_budget(chassis_tbl)
+        module1.set_presence(True)
+        chassis_info.run_power_budget(chassis_tbl)
+        assert module1.get_maximum_consumed_power.call_count == 2
+        assert chassis_info.total_consumed_power == 700.0
+
+        # Refresh re-reads all present entities
+        chassis_info.run_power_budget(chassis_tbl, refresh=True)
+        assert psu1.get_maximum_supplied_power.call_count == 3
+        assert module1.get_maximum_consumed_power.call_count == 3
+
+    def test_run_power_budget_writes_changed_fields(self):
+        chassis = MockChassis()
+        psu1 = MockPsu("PSU 1", 0, True, True)
+        psu1.set_maximum_supplied_power(510.0)
+        chassis._psu_list.append(psu1)
+
+        psu2 = MockPsu("PSU 2", 1, True, True)
+        psu2.set_maximum_supplied_power(800.0)
+        chassis._psu_list.append(psu2)
+
+        chassis_tbl = mock.MagicMock()
+        chassis_info = psud.PsuChassisInfo(SYSLOG_IDENTIFIER, chassis)
+        chassis_info.run_power_budget(chassis_tbl)
+        assert chassis_tbl.set.call_count == 1
+        fvs = chassis_tbl.set.call_args[0][1]
+        assert fvs[CHASSIS_INFO_POWER_SUPPLIER_FIELD.format('PSU 1')] == '510.0'
+        assert fvs[CHASSIS_INFO_POWER_SUPPLIER_FIELD.format('PSU 2')] == '800.0'
+        assert fvs[CHASSIS_INFO_TOTAL_POWER_SUPPLIED_FIELD] == '1310.0'
+        assert fvs[CHASSIS_INFO_TOTAL_POWER_CONSUMED_FIELD] == '0.0'
+
+        # Nothing changed, nothing written
+        chassis_tbl.reset_mock()
+        chassis_info.run_power_budget(chassis_tbl)
+        chassis_tbl.set.assert_not_called()
+        chassis_tbl.hdel.assert_not_called()
+
+        # Only the changed supplier and the total are written
+        psu2.set_status(False)
+        chassis_info.run_power_budget(chassis_tbl)
+        assert chassis_tbl.set.call_count == 1
+        assert chassis_tbl.set.call_args[0][1].fv_dict == {
+            CHASSIS_INFO_POWER_SUPPLIER_FIELD.format('PSU 2'): '0.0',
+            CHASSIS_INFO_TOTAL_POWER_SUPPLIED_FIELD: '510.0'
+        }
+
+        # Absent supplier is deleted once
+        chassis_tbl.reset_mock()
+        psu1.set_presence(False)
+        chassis_info.run_power_budget(chassis_tbl)
+        chassis_info.run_power_budget(chassis_tbl)
+        chassis_tbl.hdel.assert_called_once_with(CHASSIS_INFO_POWER_KEY_TEMPLATE.format(1),
+                                                 CHASSIS_INFO_POWER_SUPPLIER_FIELD.format('PSU 1'))
+        assert chassis_tbl.set.call_count == 1
+        assert chassis_tbl.set.call_args[0][1].fv_dict == {CHASSIS_INFO_TOTAL_POWER_SUPPLIED_FIELD: '0.0'}
+
+        # A failed write is retried on the next run
+        chassis_tbl.reset_mock()
+        chassis_tbl.set.side_effect = RuntimeError("BUSY Redis is busy running a script")
+        psu1.set_presence(True)
+        chassis_info.run_power_budget(chassis_tbl)
+        chassis_tbl.set.side_effect = None
+        chassis_info.run_power_budget(chassis_tbl)
+        assert chassis_tbl.set.call_count == 2
+        assert chassis_tbl.set.call_args[0][1].fv_dict == {
+            CHASSIS_INFO_POWER_SUPPLIER_FIELD.format('PSU 1'): '510.0',
+            CHASSIS_INFO_TOTAL_POWER_SUPPLIED_FIELD: '510.0'
+        }
@@ -596,6 +596,66 @@ def test_sum_system_power_from_other_psus_and_pdbs():
     assert psud._sum_system_power_from_other_psus_and_pdbs(ch3, psu0, 2.0) == 2.0
 
 
+def test_telemetry_ring_buffer():
+    buf = psud.TelemetryRingBuffer(4)
+    assert len(buf) == 0
+    assert buf.latest() is None
+    assert buf.average() is None
+    assert buf.stats() is None
+
+    for value in [1.0, 2.0, 3.0]:
+        buf.append(value)
+    assert len(buf) == 3
+    assert buf.latest() == 3.0
+    assert buf.average() == 2.0
+
+    # Oldest samples are overwritten once the buffer is full
+    for value in [4.0, 5.0, 6.0]:
+        buf.append(value)
+    assert len(buf) == 4
+    assert buf.latest() == 6.0
+    assert buf.stats() == {'min': 3.0, 'max': 6.0, 'avg': 4.5, 'p50': 4.0, 'p95': 5.0}
+
+    # A failed read is a gap: the previous sample is no longer the latest one
+    buf.append(None)
+    assert len(buf) == 3
+    assert buf.latest() is None
+    assert buf.stats() == {'min': 4.0, 'max': 6.0, 'avg': 5.0, 'p50': 5.0, 'p95': 5.0}
+
+    # Gaps age out of the window like samples
+    for value in [None, None, None]:
+        buf.append(value)
+    assert len(buf) == 0
+    assert buf.average() is None
+
+    buf.clear()
+    assert len(buf) == 0
+    assert buf.stats() is None
+
+
+def test_psu_telemetry_history():
+    history = psud.PsuTelemetryHistory(size=3)
+    assert history.to_fvs() == []
+
+    history.add(voltage=12.0, current=NOT_AVAILABLE, power=100.0, temp=30.0)
+    history.add(voltage=12.2, current=8.0, power=110.0, temp=NOT_AVAILABLE)
+    assert len(history.get('voltage')) == 2
+    assert len(history.get('current')) == 1
+    assert len(history.get('temp')) == 1
+
+    fvs = dict(history.to_fvs())
+    assert fvs['power_min'] == '100.0'
+    assert fvs['power_max'] == '110.0'
+    assert fvs['power_avg'] == '105.0'
+    assert fvs['voltage_avg'] == '12.1'
+    assert fvs['current_p95'] == '8.0'
+    assert fvs[psud.PSU_STATS_SAMPLES_FIELD] == '2'
+    assert fvs[psud.PSU_STATS_WINDOW_FIELD] == str(2 * psud.PSU_INFO_UPDATE_PERIOD_SECS)
+
+    history.clear()
+    assert history.to_fvs() == []
+
+
 def _make_mock_swsscommon_for_main():
     """Build a minimal swsscommon module so DaemonPsud can connect to STATE_DB without real Redis."""
     import types
@@ -633,6 +693,22 @@ def _make_mock_swsscommon_for_main():
 def test_main(mock_run):
     mock_run.return_value = False
     mock_swsscommon = _make_mock_swsscommon_for_main()
-    with mock.patch('psud.swsscommon', mock_swsscommon):
+    with mock.patch('psud.swsscommon', mock_swsscommon), mock.patch.object(sys, 'argv', ['psud']):
         psud.main()
     assert mock_run.call_count == 1
+
+
+@mock.patch('psud.platform_chassis', mock.MagicMock())
+@mock.patch('psud.DaemonPsud.run', mock.MagicMock(return_value=False))
+def test_main_power_threshold_use_average():
+    with mock.patch('psud.DaemonPsud.__init__', return_value=None) as mock_init, \
+         mock.patch('psud.DaemonPsud.log_info'), \
+         mock.patch.object(sys, 'argv', ['psud']):
+        psud.main()
+    mock_init.assert_called_once_with(psud.SYSLOG_IDENTIFIER, False)
+
+    with mock.patch('psud.DaemonPsud.__init__', return_value=None) as mock_init, \
+         mock.patch('psud.DaemonPsud.log_info'), \
+         mock.patch.object(sys, 'argv', ['psud', '--power-threshold-use-average']):
+        psud.main()
+    mock_init.assert_called_once_with(psud.SYSLOG_IDENTIFIER, True)
@@ -31,7 +31,7 @@ sys.path.insert(0, modules_path)
 # Import mocked modules
 
 from .mock_swsscommon import Table, FieldValuePairs
-from .mock_platform import MockChassis, MockVoltageSensor, MockCurrentSensor
+from .mock_platform import MockChassis, MockVoltageSensor, MockCurrentSensor, MockErrorVoltageSensor
 
 # Load file under test
 load_source('sensormond', os.path.join(scripts_path, 'sensormond'))
@@ -360,6 +360,251 @@ class TestCurrentUpdater(object):
         assert result is False
         current_updater.log_info.assert_called_with("Stop signal received while running current update")
 
+class TestSensorSampler(object):
+    """
+    Test cases to cover functionality in SensorSampler class
+    """
+    def test_read_file(self, tmp_path):
+        sensor_file = tmp_path / 'VSENSOR1'
+        sensor_file.write_text('1000\n')
+
+        sampler = sensormond.SensorSampler(max_workers=1)
+        assert sampler.read_file(str(sensor_file)) == 1000
+        assert len(sampler.fds) == 1
+        fd = sampler.fds[str(sensor_file)]
+
+        # File descriptor is kept open and the new value is read from offset 0
+        sensor_file.write_text('950\n')
+        assert sampler.read_file(str(sensor_file)) == 950
+        assert sampler.fds[str(sensor_file)] == fd
+
+        sampler.close()
+        assert not sampler.fds
+
+        with pytest.raises(OSError):
+            sampler.read_file(str(tmp_path / 'missing'))
+        assert not sampler.fds
+
+    def test_read_file_error_reopens(self, tmp_path):
+        sensor_file = tmp_path / 'VSENSOR1'
+        sensor_file.write_text('1000\n')
+
+        sampler = sensormond.SensorSampler(max_workers=1)
+        with mock.patch('sensormond.os.pread', side_effect=OSError('No such device')):
+            with pytest.raises(OSError):
+                sampler.read_file(str(sensor_file))
+        assert not sampler.fds
+
+        assert sampler.read_file(str(sensor_file)) == 1000
+        sampler.close()
+
+    def test_sample(self, tmp_path):
+        sensor_file = tmp_path / 'VSENSOR1'
+        sensor_file.write_text('1000\n')
+        voltage_sensor = MockVoltageSensor()
+        error_voltage_sensor = MockErrorVoltageSensor()
+
+        for max_workers in (1, 4):
+            sampler = sensormond.SensorSampler(max_workers=max_workers)
+            values = sampler.sample([(voltage_sensor, None),
+                                     (mock.MagicMock(), str(sensor_file)),
+                                     (error_voltage_sensor, None)])
+            assert values[0] == voltage_sensor.get_value()
+            assert values[1] == 1000
+            assert isinstance(values[2], Exception)
+            assert (sampler.executor is not None) == (max_workers > 1)
+            sampler.close()
+
+class TestScheduledUpdate(object):
+    """
+    Test cases to cover sensors polled on their own interval
+    """
+    def test_update_scheduled(self):
+        chassis = MockChassis()
+        voltage_sensor1 = MockVoltageSensor(1)
+        voltage_sensor2 = MockVoltageSensor(2)
+        chassis.get_all_voltage_sensors().extend([voltage_sensor1, voltage_sensor2])
+
+        voltage_updater = sensormond.VoltageUpdater(chassis, [], poll_intervals={'Voltage sensor 1': 1})
+        voltage_updater._refresh_voltage_status = mock.MagicMock()
+
+        with mock.patch('sensormond.time.monotonic', return_value=100):
+            voltage_updater.update(scheduled=True)
+        assert voltage_updater._refresh_voltage_status.call_count == 2
+        assert voltage_updater.next_poll_time == {('chassis 1', 0): 101,
+                                                  ('chassis 1', 1): 100 + sensormond.SENSOR_POLL_INTERVAL}
+        assert voltage_updater.get_next_poll_time() == 101
+
+        # Only the sensor with the short interval is due
+        voltage_updater._refresh_voltage_status.reset_mock()
+        with mock.patch('sensormond.time.monotonic', return_value=101):
+            voltage_updater.update(scheduled=True)
+        assert voltage_updater._refresh_voltage_status.call_count == 1
+        assert voltage_updater._refresh_voltage_status.call_args[0][1] is voltage_sensor1
+
+        # A full update refreshes all sensors
+        voltage_updater._refresh_voltage_status.reset_mock()
+        with mock.patch('sensormond.time.monotonic', return_value=101.5):
+            voltage_updater.update()
+        assert voltage_updater._refresh_voltage_status.call_count == 2
+
+    def test_update_fs_sensor(self, tmp_path):
+        sensor_file = tmp_path / 'CSENSOR1'
+        sensor_file.write_text('900\n')
+        current_sensor = mock.MagicMock()
+        current_sensor.get_name.return_value = 'CSENSOR1'
+        current_sensor.get_unit.return_value = 'mA'
+        current_sensor.get_high_threshold.return_value = 1000
+        current_sensor.get_low_threshold.return_value = 800
+
+        chassis = MockChassis()
+        current_updater = sensormond.CurrentUpdater(chassis, [current_sensor],
+                                                    fs_sensor_paths={'CSENSOR1': str(sensor_file)})
+        current_updater.update()
+        sensor_file.write_text('950\n')
+        current_updater.update()
+
+        # Value is read from the sensor file, not by platform API
+        current_sensor.get_value.assert_not_called()
+        current_sensor.get_minimum_recorded.assert_not_called()
+        fvs = current_updater.table.get('CSENSOR1')
+        assert fvs['current'] == '950'
+        assert fvs['minimum_current'] == '900'
+        assert fvs['maximum_current'] == '950'
+        current_updater.sampler.close()
+
+class TestDeadbandAndThresholdEvents(object):
+    """
+    Test cases to cover deadband writes and threshold event publishing
+    """
+    def test_deadband_write(self):
+        chassis = MockChassis()
+        voltage_sensor = MockVoltageSensor(1)
+        chassis.get_all_voltage_sensors().append(voltage_sensor)
+
+        voltage_updater = sensormond.VoltageUpdater(chassis, [], value_deadband=1)
+        voltage_updater.table.set = mock.MagicMock()
+
+        with mock.patch('sensormond.time.monotonic', return_value=100):
+            voltage_updater.update()
+            assert voltage_updater.table.set.call_count == 1
+
+            # Value moved within the deadband
+            voltage_sensor._value = 2.5
+            voltage_updater.update()
+            assert voltage_updater.table.set.call_count == 1
+
+            # Value moved beyond the deadband since the last write
+            voltage_sensor._value = 3.5
+            voltage_updater.update()
+            assert voltage_updater.table.set.call_count == 2
+            assert voltage_updater.table.set.call_args[0][1]['voltage'] == '3.5'
+
+            # Another field changed
+            voltage_sensor._high_threshold = 10
+            voltage_updater.update()
+            assert voltage_updater.table.set.call_count == 3
+
+            # Value became unavailable
+            voltage_sensor.get_value = mock.MagicMock(return_value=None)
+            voltage_updater.update()
+            assert voltage_updater.table.set.call_count == 4
+            voltage_updater.update()
+            assert voltage_updater.table.set.call_count == 4
+
+        # Unchanged row is rewritten after the force write interval
+        with mock.patch('sensormond.time.monotonic', return_value=100 + sensormond.SENSOR_FORCE_WRITE_INTERVAL):
+            voltage_updater.update()
+            assert voltage_updater.table.set.call_count == 5
+
+    def test_deadband_per_sensor(self):
+        chassis = MockChassis()
+        current_sensor1 = MockCurrentSensor(1)
+        current_sensor2 = MockCurrentSensor(2)
+        chassis.get_all_current_sensors().extend([current_sensor1, current_sensor2])
+
+        current_updater = sensormond.CurrentUpdater(chassis, [], deadbands={'Current sensor 1': 1})
+        current_updater.table.set = mock.MagicMock()
+        current_updater.update()
+        assert current_updater.table.set.call_count == 2
+
+        # No default deadband, only the sensor with a deadband skips the write
+        current_sensor1._value = 2.5
+        current_sensor2._value = 2.5
+        current_updater.update()
+        assert current_updater.table.set.call_count == 3
+        assert current_updater.table.set.call_args[0][0] == 'Current sensor 2'
+
+    def test_threshold_events(self):
+        chassis = MockChassis()
+        chassis.make_over_threshold_voltage_sensor()
+        voltage_updater = sensormond.VoltageUpdater(chassis, [])
+        voltage_updater.update()
+
+        event = voltage_updater.threshold_event_table.get('chassis 1 voltage_sensor 1')
+        assert event['sensor_type'] == 'voltage'
+        assert event['event'] == 'high_warning'
+        assert event['value'] == '3'
+        assert event['threshold'] == '2'
+        assert event['unit'] == 'mV'
+        seq = int(event['seq'])
+        monotonic_timestamp = float(event['monotonic_timestamp'])
+
+        # No transition, no event
+        voltage_updater.update()
+        assert voltage_updater.threshold_event_table.get('chassis 1 voltage_sensor 1')['seq'] == str(seq)
+
+        chassis.get_all_voltage_sensors()[0].make_normal_value()
+        voltage_updater.update()
+        event = voltage_updater.threshold_event_table.get('chassis 1 voltage_sensor 1')
+        assert event['event'] == 'high_warning_cleared'
+        assert int(event['seq']) == seq + 1
+        assert float(event['monotonic_timestamp']) >= monotonic_timestamp
+
+        # Events of the updater are removed on exit
+        voltage_updater.threshold_event_table._del = mock.MagicMock()
+        voltage_updater.phy_entity_table._del = mock.MagicMock()
+        voltage_updater.__del__()
+        voltage_updater.threshold_event_table._del.assert_called_once_with('chassis 1 voltage_sensor 1')
+
+    def test_threshold_event_failure(self):
+        chassis = MockChassis()
+        chassis.make_under_threshold_current_sensor()
+        current_updater = sensormond.CurrentUpdater(chassis, [])
+        current_updater.threshold_event_table.set = mock.MagicMock(side_effect=RuntimeError('BUSY'))
+        current_updater.update()
+
+        assert current_updater.log_warning.call_count == 2
+        current_updater.log_warning.assert_called_with(
+            "Failed to publish threshold event low_warning of chassis 1 current_sensor 1 - RuntimeError('BUSY')")
+        assert current_updater.table.get('chassis 1 current_sensor 1')['warning_status'] == 'True'
+        assert not current_updater.threshold_event_keys
+
+@mock.patch('sonic_py_common.device_info.get_paths_to_platform_and_hwsku_dirs', mock.MagicMock(return_value=(tests_path, '')))
+def test_daemon_sensor_poll_intervals():
+    import sonic_platform.platform
+    class MyPlatform():
+        def get_chassis(self):
+            return MockChassis()
+    sonic_platform.platform.Platform = MyPlatform
+
+    daemon_sensormond = sensormond.SensorMonitorDaemon()
+    assert daemon_sensormond._sensor_poll_intervals == {'VSENSOR1': 1}
+    assert daemon_sensormond._sensor_deadbands == {'VSENSOR2': 5}
+    assert daemon_sensormond.voltage_updater.deadbands is daemon_sensormond._sensor_deadbands
+    assert daemon_sensormond._fs_sensor_paths['CSENSOR2'] == 'sensor_data/CSENSOR2'
+    assert daemon_sensormond.voltage_updater.sampler is daemon_sensormond.current_updater.sampler
+
+    # Wake up when the first sensor is due
+    daemon_sensormond.stop_event.wait = mock.MagicMock(return_value=False)
+    daemon_sensormond.voltage_updater.get_next_poll_time = mock.MagicMock(return_value=None)
+    daemon_sensormond.current_updater.get_next_poll_time = mock.MagicMock(return_value=None)
+    with mock.patch('sensormond.time.monotonic', return_value=100):
+        daemon_sensormond.voltage_updater.get_next_poll_time.return_value = 101
+        daemon_sensormond.current_updater.get_next_poll_time.return_value = 160
+        assert daemon_sensormond.run()
+    assert daemon_sensormond.wait_time == 1
+
 # Modular chassis-related tests
 
 def test_updater_voltage_sensor_check_modular_chassis():
@@ -541,7 +786,7 @@ def test_daemon_run():
 builtin_open = open  # save the unpatched version
 def sensor_mock_open(*args, **kwargs):
     if args and args[0] == sensormond.PLATFORM_ENV_CONF_FILE:
-        return mock.mock_open(read_data="SENSORMOND_WARNING_TIME=45\nOTHER_CONFIG=value\n")(*args, **kwargs)
+        return mock.mock_open(read_data="SENSORMOND_WARNING_TIME=45\nSENSORMOND_VALUE_DEADBAND=2.5\nOTHER_CONFIG=value\n")(*args, **kwargs)
     # unpatched version for every other path
     return builtin_open(*args, **kwargs)
 
@@ -560,6 +805,8 @@ def test_daemon_init_with_valid_platform_config():
 
     daemon = sensormond.SensorMonitorDaemon()
     assert daemon.UPDATE_ELAPSED_THRESHOLD == 45
+    assert daemon.voltage_updater.value_deadband == 2.5
+    assert daemon.current_updater.value_deadband == 2.5
 
 def sensor_mock_open_invalid(*args, **kwargs):
     if args and args[0] == sensormond.PLATFORM_ENV_CONF_FILE:
@@ -642,10 +889,13 @@ def test_update_entity_info():
     assert mock_table.set.call_count == 1
     mock_table.set.assert_called_with('Key Name', expected_fvp)
 
+@mock.patch('sensormond.SensorSampler.close')
 @mock.patch('sensormond.SensorMonitorDaemon.run')
-def test_main(mock_run):
+def test_main(mock_run, mock_close):
     mock_run.return_value = False
 
     ret = sensormond.main()
     assert mock_run.call_count == 1
     assert  ret != 0
+    # The sampler workers and sensor files are released on shutdown
+    assert mock_close.call_count == 1
@@ -6,7 +6,7 @@ STATE_DB = ''
 
 
 class Table:
-    def __init__(self, db, table_name):
+    def __init__(self, db, table_name, buffered=False):
         self.table_name = table_name
         self.mock_dict = {}
 
@@ -56,6 +56,13 @@ class FieldValuePairs:
     def __str__(self):
         return repr(self.fv_dict)
 
+class RedisPipeline:
+    def __init__(self, db):
+        self.db = db
+
+    def flush(self):
+        pass
+
 class ConfigDBConnector:
     pass
 
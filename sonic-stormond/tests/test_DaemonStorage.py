@@ -250,11 +250,13 @@ class TestDaemonStorage(object):
         stormon_daemon = stormond.DaemonStorage(log_identifier)
         stormon_daemon.storage.devices = {'sda' : MagicMock()}
         stormon_daemon.state_db.keys = MagicMock(return_value=keys_list)
-        stormon_daemon.state_db.hget = MagicMock()
+        stormon_daemon.state_db.hgetall = MagicMock(return_value=fsio_statedb_dict['sda'])
 
         stormon_daemon._load_fsio_rw_statedb()
 
         assert stormon_daemon.statedb_storage_info_loaded == True
+        assert stormon_daemon.fsio_rw_statedb == fsio_statedb_dict
+        stormon_daemon.state_db.hgetall.assert_called_once_with('STORAGE_INFO|sda')
 
 
     @patch('sonic_py_common.daemon_base.db_connect', MagicMock())
@@ -265,7 +267,7 @@ class TestDaemonStorage(object):
         stormon_daemon = stormond.DaemonStorage(log_identifier)
         stormon_daemon.storage.devices = {'sda' : MagicMock()}
         stormon_daemon.state_db.keys = MagicMock(return_value=keys_list)
-        stormon_daemon.state_db.hget = MagicMock(side_effect=Exception)
+        stormon_daemon.state_db.hgetall = MagicMock(side_effect=Exception)
         stormon_daemon.log.log_error = MagicMock()
 
         stormon_daemon._load_fsio_rw_statedb()
@@ -282,7 +284,7 @@ class TestDaemonStorage(object):
         stormon_daemon = stormond.DaemonStorage(log_identifier)
         stormon_daemon.storage.devices = {'sda' : MagicMock()}
         stormon_daemon.state_db.keys = MagicMock(return_value=keys_list)
-        stormon_daemon.state_db.hget = MagicMock(return_value=None)
+        stormon_daemon.state_db.hgetall = MagicMock(return_value={'total_fsio_reads': '10500'})
 
         stormon_daemon._load_fsio_rw_statedb()
 
@@ -314,6 +316,83 @@ class TestDaemonStorage(object):
 
             assert stormon_daemon.state_db.call_count == 0
 
+    @patch('sonic_py_common.daemon_base.db_connect', MagicMock())
+    @patch('time.time', MagicMock(return_value=1000))
+    def test_sync_fsio_rw_json_atomic(self, tmp_path):
+        json_file = str(tmp_path / 'fsio-rw-stats.json')
+        stormon_daemon = stormond.DaemonStorage(log_identifier)
+        stormon_daemon.boot_id = 'boot-1'
+        stormon_daemon.state_db.hgetall = MagicMock(return_value=fsio_statedb_dict['sda'])
+
+        with patch('stormond.FSIO_RW_JSON_FILE', json_file), \
+                patch('stormond.FSIO_RW_JSON_TMP_FILE', json_file + '.tmp'):
+            # Nothing published yet, the values are read from STATE_DB
+            assert stormon_daemon.sync_fsio_rw_json() == True
+            stormon_daemon.state_db.hgetall.assert_called_once_with('STORAGE_INFO|sda')
+            with open(json_file) as f:
+                json_file_dict = stormond.json.load(f)
+            assert json_file_dict['sda'] == fsio_statedb_dict['sda']
+            assert json_file_dict['boot_id'] == 'boot-1'
+            assert not os.path.exists(json_file + '.tmp')
+
+            # Unchanged values are not written again
+            stormon_daemon.fsio_rw_published = {'sda': dict(fsio_statedb_dict['sda'])}
+            with patch.object(stormon_daemon, '_write_fsio_rw_json') as mock_write:
+                assert stormon_daemon.sync_fsio_rw_json() == True
+                assert mock_write.call_count == 0
+
+                stormon_daemon.fsio_rw_published['sda']['total_fsio_writes'] = '22000'
+                assert stormon_daemon.sync_fsio_rw_json() == True
+                assert mock_write.call_count == 1
+            assert stormon_daemon.state_db.hgetall.call_count == 1
+
+            # A failed write leaves the previous file in place
+            stormon_daemon.fsio_rw_published['sda']['total_fsio_writes'] = '23000'
+            with patch('stormond.os.fsync', side_effect=OSError):
+                assert stormon_daemon.sync_fsio_rw_json() == False
+            with open(json_file) as f:
+                assert stormond.json.load(f)['sda'] == fsio_statedb_dict['sda']
+
+            assert stormon_daemon.sync_fsio_rw_json() == True
+            with open(json_file) as f:
+                assert stormond.json.load(f)['sda']['total_fsio_writes'] == '23000'
+
+
+    @patch('os.path.exists', MagicMock(return_value=True))
+    @patch('sonic_py_common.daemon_base.db_connect', MagicMock())
+    def test_load_fsio_rw_json_same_boot(self):
+        json_dict = dict(fsio_json_dict, boot_id='boot-1')
+
+        with patch('builtins.open', new_callable=mock_open, read_data='boot-1\n'), \
+                patch('json.load', MagicMock(return_value=json_dict)):
+            stormon_daemon = stormond.DaemonStorage(log_identifier)
+        assert stormon_daemon.boot_id == 'boot-1'
+        assert stormon_daemon.fsio_json_file_loaded == True
+        assert stormon_daemon.fsio_json_same_boot == True
+
+        with patch('builtins.open', new_callable=mock_open, read_data='boot-2\n'), \
+                patch('json.load', MagicMock(return_value=json_dict)):
+            stormon_daemon = stormond.DaemonStorage(log_identifier)
+        assert stormon_daemon.fsio_json_file_loaded == True
+        assert stormon_daemon.fsio_json_same_boot == False
+
+
+    @patch('sonic_py_common.daemon_base.db_connect', MagicMock())
+    def test_reconcile_fsio_rw_values_same_boot(self):
+        stormon_daemon = stormond.DaemonStorage(log_identifier)
+
+        stormon_daemon.use_statedb_baseline = False
+        stormon_daemon.use_fsio_json_baseline = True
+        stormon_daemon.fsio_json_same_boot = True
+        stormon_daemon.fsio_rw_json = fsio_statedb_dict
+
+        # Only the reads and writes since the last sync are added
+        (reads, writes) = stormon_daemon._reconcile_fsio_rw_values(dict(fsio_dict), 'sda')
+
+        assert reads == '11300'
+        assert writes == '22600'
+
+
     @patch('sonic_py_common.daemon_base.db_connect', MagicMock())
     def test_reconcile_fsio_rw_values_init(self):
         stormon_daemon = stormond.DaemonStorage(log_identifier)
@@ -445,11 +524,27 @@ class TestDaemonStorage(object):
         mock_storage_device_object.get_reserved_blocks.return_value = "3"
 
         stormon_daemon.storage.devices = {'sda' : mock_storage_device_object}
+        stormon_daemon.pipeline.flush = MagicMock()
         stormon_daemon.get_dynamic_fields_update_state_db()
 
-        assert stormon_daemon.device_table.getKeys() == ['sda']
+        assert stormon_daemon.batch_table.getKeys() == ['sda']
         for field, value in dynamic_dict.items():
-            assert stormon_daemon.device_table.get('sda')[field] == value
+            assert stormon_daemon.batch_table.get('sda')[field] == value
+        assert stormon_daemon.pipeline.flush.call_count == 1
+        assert stormon_daemon.fsio_rw_published == {'sda': {'latest_fsio_reads': '150', 'latest_fsio_writes': '270',
+                                                            'total_fsio_reads': '150', 'total_fsio_writes': '270'}}
+
+        # Values which did not reach STATE_DB are not synced to the JSON file
+        mock_storage_device_object.get_fs_io_reads.return_value = "160"
+        stormon_daemon.pipeline.flush.side_effect = RuntimeError('flush failed')
+        stormon_daemon.log.log_error = MagicMock()
+        stormon_daemon.get_configdb_intervals = MagicMock()
+        stormon_daemon.wait_sampling_io_rates = MagicMock(return_value=False)
+        stormon_daemon.sync_fsio_rw_json = MagicMock(return_value=True)
+        stormon_daemon.write_sync_time_statedb = MagicMock()
+        assert stormon_daemon.run() is True
+        stormon_daemon.log.log_error.assert_called_once()
+        assert stormon_daemon.fsio_rw_published['sda']['latest_fsio_reads'] == '150'
 
 
     @patch('sonic_py_common.daemon_base.db_connect', MagicMock())
@@ -613,6 +708,107 @@ class TestDaemonStorage(object):
             assert stormon_daemon.log.log_warning.call_count == 1
             assert rc == True
 
+    @patch('sonic_py_common.daemon_base.db_connect', MagicMock())
+    def test_update_io_rates_state_db(self):
+        stormon_daemon = stormond.DaemonStorage(log_identifier)
+        stormon_daemon.pipeline.flush = MagicMock()
+        stormon_daemon.blkdev_sampler.sample = MagicMock(return_value={})
+
+        stormon_daemon.update_io_rates_state_db()
+        assert stormon_daemon.batch_table.getKeys() == []
+        assert stormon_daemon.pipeline.flush.call_count == 0
+
+        rates = {'read_iops': '5.00', 'write_iops': '60.00', 'read_bytes_per_sec': '10240.00', 'write_bytes_per_sec': '1024000.00'}
+        stormon_daemon.blkdev_sampler.sample.return_value = {'sda': rates}
+        stormon_daemon.update_io_rates_state_db()
+        assert stormon_daemon.batch_table.get('sda') == rates
+        assert stormon_daemon.pipeline.flush.call_count == 1
+
+        stormon_daemon.log.log_warning = MagicMock()
+        stormon_daemon.blkdev_sampler.sample.side_effect = Exception
+        stormon_daemon.update_io_rates_state_db()
+        assert stormon_daemon.log.log_warning.call_count == 1
+
+
+    @patch('sonic_py_common.daemon_base.db_connect', MagicMock())
+    def test_wait_sampling_io_rates(self):
+        stormon_daemon = stormond.DaemonStorage(log_identifier)
+        stormon_daemon.update_io_rates_state_db = MagicMock()
+        stormon_daemon.stop_event.wait = MagicMock(return_value=False)
+        stormon_daemon.blkdev_sample_interval = 60
+
+        with patch('stormond.time.monotonic', side_effect=[0, 0, 60, 120, 180, 200]):
+            assert stormon_daemon.wait_sampling_io_rates(200) == False
+        assert [c[0][0] for c in stormon_daemon.stop_event.wait.call_args_list] == [60, 60, 60, 20]
+        assert stormon_daemon.update_io_rates_state_db.call_count == 4
+
+        # Stop event
+        stormon_daemon.stop_event.wait.reset_mock()
+        stormon_daemon.update_io_rates_state_db.reset_mock()
+        stormon_daemon.stop_event.wait.side_effect = [False, True]
+        with patch('stormond.time.monotonic', side_effect=[0, 0, 60]):
+            assert stormon_daemon.wait_sampling_io_rates(200) == True
+        assert stormon_daemon.update_io_rates_state_db.call_count == 1
+
+        # Sampling disabled
+        stormon_daemon.stop_event.wait = MagicMock(return_value=False)
+        stormon_daemon.update_io_rates_state_db.reset_mock()
+        stormon_daemon.blkdev_sample_interval = 0
+        assert stormon_daemon.wait_sampling_io_rates(200) == False
+        stormon_daemon.stop_event.wait.assert_called_once_with(200)
+        assert stormon_daemon.update_io_rates_state_db.call_count == 0
+
+class TestBlockDeviceSampler(object):
+    """
+    Test cases to cover functionality in BlockDeviceSampler class
+    """
+
+    def test_read_counters(self, tmp_path):
+        (tmp_path / 'sda').mkdir()
+        stat_file = tmp_path / 'sda' / 'stat'
+        stat_file.write_text('     100        0     2000       10      300        0     4000       20        0       30       30\n')
+        diskstats_file = tmp_path / 'diskstats'
+        diskstats_file.write_text('   8       0 sda 1 0 2 0 3 0 4 0 0 0 0\n 179       0 mmcblk0 50 0 600 0 70 0 800 0 0 0 0\n')
+
+        sampler = stormond.BlockDeviceSampler(['sda', 'mmcblk0', 'nvme0n1'])
+        with patch('stormond.SYS_BLOCK_PATH', str(tmp_path)), \
+                patch('stormond.PROC_DISKSTATS_FILE', str(diskstats_file)):
+            assert sampler.read_counters() == {'sda': (100, 2000, 300, 4000), 'mmcblk0': (50, 600, 70, 800)}
+            assert list(sampler.fds) == ['sda']
+
+            # The stat file is kept open and re-read
+            stat_file.write_text('     150        0     2100       10      500        0     9000       20        0       30       30\n')
+            fd = sampler.fds['sda']
+            assert sampler.read_counters()['sda'] == (150, 2100, 500, 9000)
+            assert sampler.fds['sda'] == fd
+
+            # Fallback to /proc/diskstats when the stat file cannot be read
+            with patch('stormond.os.pread', side_effect=OSError):
+                assert sampler.read_counters()['sda'] == (1, 2, 3, 4)
+            assert not sampler.fds
+
+        sampler.close()
+
+    def test_sample(self):
+        sampler = stormond.BlockDeviceSampler(['sda'])
+        sampler.read_counters = MagicMock(return_value={'sda': (100, 2000, 300, 4000)})
+
+        with patch('stormond.time.monotonic', return_value=100):
+            assert sampler.sample() == {}
+
+        sampler.read_counters.return_value = {'sda': (150, 2200, 900, 24000)}
+        with patch('stormond.time.monotonic', return_value=110):
+            assert sampler.sample() == {'sda': {'read_iops': '5.00',
+                                                'write_iops': '60.00',
+                                                'read_bytes_per_sec': '10240.00',
+                                                'write_bytes_per_sec': '1024000.00'}}
+
+        # Counters were reset
+        sampler.read_counters.return_value = {'sda': (10, 20, 30, 40)}
+        with patch('stormond.time.monotonic', return_value=120):
+            assert sampler.sample()['sda']['write_iops'] == '0.00'
+
+
 class TestStormon():
 
     @patch('sonic_py_common.daemon_base.db_connect', MagicMock())
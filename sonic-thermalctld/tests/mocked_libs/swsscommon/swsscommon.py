@@ -29,8 +29,16 @@ class SonicV2Connector:
         pass
 
 
+class RedisPipeline:
+    def __init__(self, db):
+        self.db = db
+
+    def flush(self):
+        pass
+
+
 class Table:
-    def __init__(self, db, table_name):
+    def __init__(self, db, table_name, buffered=False):
         self.table_name = table_name
         self.mock_dict = {}
 
@@ -192,6 +192,21 @@ class TestFanUpdater(object):
         phy_entity_calls = [mock.call('fan1'), mock.call('fan2'), mock.call('drawer1'), mock.call('drawer2')]
         fan_updater.phy_entity_table._del.assert_has_calls(phy_entity_calls, any_order=True)
 
+    def test_fan_info_pruned_when_fan_removed(self):
+        chassis = MockChassis()
+        chassis.make_absent_fan()
+        psu = MockPsu()
+        psu._fan_list.append(MockFan())
+        chassis._psu_list.append(psu)
+        fan_updater = thermalctld.FanUpdater(chassis, threading.Event())
+        fan_updater.update()
+        assert 'PSU 1 fan 1' in fan_updater.fan_info
+
+        chassis._psu_list.remove(psu)
+        fan_updater.update()
+        assert 'PSU 1 fan 1' not in fan_updater.fan_info
+        assert 'FanDrawer 0 fan 1' in fan_updater.fan_info
+
     def test_update_fan_with_exception(self):
         chassis = MockChassis()
         chassis.make_error_fan()
@@ -1153,7 +1168,7 @@ class TestLiquidCoolingUpdater(object):
 
         stopping_event = threading.Event()
 
-        def side_effect_update():
+        def side_effect_update(detected_at):
             liquid_cooling_updater.task_stopping_event.set()
 
         liquid_cooling_updater.update.side_effect = side_effect_update
@@ -1171,6 +1186,94 @@ class TestLiquidCoolingUpdater(object):
 
         assert mock_sleep.call_count == 0
 
+    @mock.patch('thermalctld.try_get')
+    def test_refresh_leak_status_publishes_critical_first(self, mock_try_get):
+        """A new critical system leak is published before the remaining sensors are handled"""
+        mock_chassis = MockChassis()
+        mock_chassis.get_liquid_cooling().make_sensor_leak(0)
+        liquid_cooling_updater = thermalctld.LiquidCoolingUpdater(mock_chassis, 0.5)
+
+        tables = mock.MagicMock()
+        liquid_cooling_updater.sensor_table = tables.sensor_table
+        liquid_cooling_updater.system_table = tables.system_table
+        liquid_cooling_updater.event_logger = mock.MagicMock()
+        mock_try_get.side_effect = lambda func, default: func()
+
+        liquid_cooling_updater._refresh_leak_status()
+
+        written = [(call[0], call[1][0]) for call in tables.mock_calls]
+        assert written == [('sensor_table.set', 'leakage1'), ('system_table.set', 'system'),
+                           ('sensor_table.set', 'leakage2')]
+        assert tables.system_table.set.call_args[0][1].fv_dict['device_leak_status'] == 'CRITICAL'
+
+        # Nothing changed, SYSTEM_LEAK_STATUS is not written again
+        liquid_cooling_updater._refresh_leak_status()
+        assert tables.system_table.set.call_count == 1
+
+    @mock.patch('thermalctld.try_get')
+    def test_refresh_leak_status_detection_latency(self, mock_try_get):
+        """The detection-to-DB latency is measured from the leak event"""
+        mock_chassis = MockChassis()
+        mock_chassis.get_liquid_cooling().make_sensor_leak(0)
+        liquid_cooling_updater = thermalctld.LiquidCoolingUpdater(mock_chassis, 0.5)
+        liquid_cooling_updater.sensor_table = mock.MagicMock()
+        liquid_cooling_updater.system_table = mock.MagicMock()
+        liquid_cooling_updater.event_logger = mock.MagicMock()
+        mock_try_get.side_effect = lambda func, default: func()
+
+        liquid_cooling_updater._refresh_leak_status(detected_at=time.monotonic() - 1)
+
+        fvp = liquid_cooling_updater.system_table.set.call_args[0][1]
+        assert int(fvp.fv_dict['detection_latency_ms']) >= 1000
+        assert liquid_cooling_updater.last_detection_latency >= 1
+
+    def test_open_leak_event_poller_not_supported(self):
+        """Platforms without a leak event fd fall back to polling"""
+        mock_chassis = MockChassis()
+        liquid_cooling_updater = thermalctld.LiquidCoolingUpdater(mock_chassis, 0.5)
+        mock_chassis.get_liquid_cooling().get_leak_event_fd = mock.MagicMock(side_effect=NotImplementedError)
+
+        assert liquid_cooling_updater._open_leak_event_poller() is False
+        assert liquid_cooling_updater.leak_event_poller is None
+
+    @mock.patch('time.sleep')
+    @mock.patch('thermalctld.select.poll')
+    def test_task_worker_leak_event(self, mock_poll, mock_sleep, tmp_path):
+        """task_worker refreshes immediately when the leak event fd signals"""
+        event_file = tmp_path / 'value'
+        event_file.write_text('1\n')
+        fd = os.open(str(event_file), os.O_RDONLY)
+
+        mock_chassis = MockChassis()
+        mock_chassis.get_liquid_cooling().get_leak_event_fd = mock.MagicMock(return_value=fd)
+        liquid_cooling_updater = thermalctld.LiquidCoolingUpdater(mock_chassis, 0.5)
+        liquid_cooling_updater.log_notice = mock.MagicMock()
+        liquid_cooling_updater.update = mock.MagicMock()
+
+        poller = mock_poll.return_value
+        poller.poll.side_effect = [[(fd, thermalctld.select.POLLPRI)], []]
+
+        stopping_event = threading.Event()
+
+        def side_effect_update(detected_at):
+            if liquid_cooling_updater.update.call_count == 3:
+                liquid_cooling_updater.task_stopping_event.set()
+
+        liquid_cooling_updater.update.side_effect = side_effect_update
+
+        liquid_cooling_updater.task_worker(stopping_event)
+        os.close(fd)
+
+        poller.register.assert_called_once_with(fd, thermalctld.LiquidCoolingUpdater.LEAK_EVENT_POLL_MASK)
+        poller.poll.assert_called_with(500.0)
+        updates = liquid_cooling_updater.update.call_args_list
+        assert updates[0] == mock.call(None)
+        # Woken up by the event
+        assert isinstance(updates[1][0][0], float)
+        # Periodic reconciliation
+        assert updates[2] == mock.call(None)
+        assert mock_sleep.call_count == 0
+
 
 class TestThermalMonitor(object):
     """
@@ -1186,6 +1289,47 @@ class TestThermalMonitor(object):
         assert thermal_monitor.fan_updater.update.call_count == 1
         assert thermal_monitor.temperature_updater.update.call_count == 1
 
+    def test_main_publishes_snapshot(self):
+        mock_chassis = MockChassis()
+        mock_chassis.make_over_speed_fan()
+        mock_chassis.make_over_temper_thermal()
+        mock_chassis._psu_list.append(MockPsu())
+        thermal_monitor = thermalctld.ThermalMonitor(mock_chassis, 5, 60, 30)
+        assert thermal_monitor.get_snapshot() is None
+
+        thermal_monitor.main()
+        snapshot = thermal_monitor.get_snapshot()
+        assert snapshot.generation == 0
+        assert dict(snapshot.fans['FanDrawer 0 fan 1'])['speed'] == '2'
+        assert dict(snapshot.thermals['chassis 1 Thermal 1'])['temperature'] == '3'
+        assert snapshot.psus == {'PSU 1': True}
+        with pytest.raises(TypeError):
+            snapshot.fans['FanDrawer 0 fan 1'] = ()
+
+        # Nothing changed, the generation is kept
+        thermal_monitor.main()
+        assert thermal_monitor.get_snapshot() is not snapshot
+        assert thermal_monitor.get_snapshot().generation == 0
+
+        mock_chassis.get_all_thermals()[0]._temperature = 4
+        thermal_monitor.main()
+        assert thermal_monitor.get_snapshot().generation == 1
+        assert dict(thermal_monitor.get_snapshot().thermals['chassis 1 Thermal 1'])['temperature'] == '4'
+        # The previous snapshot is not modified
+        assert dict(snapshot.thermals['chassis 1 Thermal 1'])['temperature'] == '3'
+
+    def test_removed_thermal_dropped_from_snapshot(self):
+        mock_chassis = MockChassis()
+        mock_chassis.make_over_temper_thermal()
+        thermal_monitor = thermalctld.ThermalMonitor(mock_chassis, 5, 60, 30)
+        thermal_monitor.main()
+        assert 'chassis 1 Thermal 1' in thermal_monitor.get_snapshot().thermals
+
+        mock_chassis._thermal_list = []
+        thermal_monitor.main()
+        assert 'chassis 1 Thermal 1' not in thermal_monitor.get_snapshot().thermals
+        assert thermal_monitor.get_snapshot().generation == 1
+
 
 def test_insufficient_fan_number():
     fan_status1 = thermalctld.FanStatus()
@@ -1472,7 +1616,9 @@ class TestTemperatureUpdater(object):
         result = temperature_updater._collect_thermals(available, 'chassis 1', [thermal])
         assert result is True
         assert len(available) == 1
-        assert temperature_updater._refresh_temperature_status.call_count == 1
+        # Collecting only schedules the thermal, refresh happens in update()
+        assert len(temperature_updater._unthrottled_thermals) == 1
+        assert temperature_updater._refresh_temperature_status.call_count == 0
 
     def test_collect_thermals_stops_on_event(self):
         """Test _collect_thermals returns False when task_stopping_event is set"""
@@ -1717,6 +1863,21 @@ def test_daemon_run():
     assert ret is True
 
 
+def test_daemon_run_retries_failed_policy():
+    daemon_thermalctld = thermalctld.ThermalControlDaemon(5, 60, 30)
+    daemon_thermalctld.stop_event.wait = mock.MagicMock(return_value=False)
+    daemon_thermalctld.log_error = mock.MagicMock()
+    daemon_thermalctld.thermal_manager = mock.MagicMock()
+    daemon_thermalctld.thermal_manager.get_interval = mock.MagicMock(return_value=60)
+    daemon_thermalctld.thermal_manager.run_policy = mock.MagicMock(side_effect=[Exception('failed'), None])
+
+    daemon_thermalctld.run()
+    daemon_thermalctld.run()
+    assert daemon_thermalctld.thermal_manager.run_policy.call_count == 2
+    assert daemon_thermalctld.log_error.call_count == 1
+    daemon_thermalctld.deinit()
+
+
 def test_try_get():
     def good_callback():
         return 'good result'
@@ -1913,62 +2074,127 @@ class TestParsePollingIntervals(object):
         assert result['thermals'] == {'CPU': 5.0}
 
 
-class TestShouldUpdateThermal(object):
-    """Tests for TemperatureUpdater._should_update_thermal()"""
+class TestThermalInterval(object):
+    """Tests for TemperatureUpdater._get_thermal_interval()"""
 
-    def test_always_true_when_no_interval_configured(self):
+    def test_none_when_no_interval_configured(self):
         chassis = MockChassis()
         updater = thermalctld.TemperatureUpdater(chassis, threading.Event())
-        assert updater._should_update_thermal('Unknown Thermal') is True
+        assert updater._get_thermal_interval('Unknown Thermal') is None
 
-    def test_default_interval_throttles_unconfigured_thermals(self):
+    def test_default_interval_for_unconfigured_thermals(self):
         chassis = MockChassis()
         updater = thermalctld.TemperatureUpdater(
             chassis, threading.Event(), default_interval=60)
-        # First call always returns True (last time is 0)
-        assert updater._should_update_thermal('Unknown Thermal') is True
-        # Immediately after, should be throttled
-        assert updater._should_update_thermal('Unknown Thermal') is False
+        assert updater._get_thermal_interval('Unknown Thermal') == 60
 
-    def test_default_interval_allows_after_elapsed(self):
+    def test_explicit_interval_overrides_default(self):
         chassis = MockChassis()
         updater = thermalctld.TemperatureUpdater(
-            chassis, threading.Event(), default_interval=1)
-        updater._should_update_thermal('Unknown Thermal')
-        updater._last_thermal_update_times['Unknown Thermal'] = time.time() - 2
-        assert updater._should_update_thermal('Unknown Thermal') is True
+            chassis, threading.Event(),
+            thermal_intervals={'CPU Temp': 5}, default_interval=60)
+        assert updater._get_thermal_interval('CPU Temp') == 5
 
-    def test_true_on_first_call(self):
+    def test_psu_interval_applies_to_psu_thermals(self):
         chassis = MockChassis()
         updater = thermalctld.TemperatureUpdater(
-            chassis, threading.Event(), thermal_intervals={'CPU Temp': 10})
-        assert updater._should_update_thermal('CPU Temp') is True
+            chassis, threading.Event(), psu_interval=30,
+            thermal_intervals={'PSU Temp': 5, 'Slow PSU Temp': 60})
+        assert updater._get_thermal_interval('PSU 1 Thermal 1', psu_thermal=True) == 30
+        assert updater._get_thermal_interval('PSU Temp', psu_thermal=True) == 30
+        assert updater._get_thermal_interval('Slow PSU Temp', psu_thermal=True) == 60
+        assert updater._get_thermal_interval('PSU Temp') == 5
+
 
-    def test_false_before_interval_elapses(self):
+class TestThermalSchedule(object):
+    """Tests for the TemperatureUpdater polling schedule"""
+
+    def _make_updater(self, chassis, **kwargs):
+        updater = thermalctld.TemperatureUpdater(chassis, threading.Event(), **kwargs)
+        updater._refresh_temperature_status = mock.MagicMock()
+        return updater
+
+    def test_unthrottled_thermals_refreshed_every_update(self):
         chassis = MockChassis()
-        updater = thermalctld.TemperatureUpdater(
-            chassis, threading.Event(), thermal_intervals={'CPU Temp': 100})
-        updater._should_update_thermal('CPU Temp')  # first call sets timestamp
-        assert updater._should_update_thermal('CPU Temp') is False
+        chassis._thermal_list.append(MockThermal())
+        updater = self._make_updater(chassis)
 
-    def test_true_after_interval_elapses(self):
+        updater.update()
+        updater.update()
+        assert updater._refresh_temperature_status.call_count == 2
+        assert updater.get_next_due() is None
+
+    def test_only_due_thermals_refreshed(self):
         chassis = MockChassis()
-        updater = thermalctld.TemperatureUpdater(
-            chassis, threading.Event(), thermal_intervals={'CPU Temp': 1})
-        updater._should_update_thermal('CPU Temp')
-        # Fake that last update was 2 seconds ago
-        updater._last_thermal_update_times['CPU Temp'] = time.time() - 2
-        assert updater._should_update_thermal('CPU Temp') is True
+        fast = MockThermal()
+        fast._name = 'Fast Temp'
+        slow = MockThermal()
+        slow._name = 'Slow Temp'
+        chassis._thermal_list.extend([fast, slow])
+        updater = self._make_updater(chassis, thermal_intervals={'Fast Temp': 1, 'Slow Temp': 60})
+
+        now = time.time()
+        updater.update(now=now)
+        assert updater._refresh_temperature_status.call_count == 2
+        assert updater.get_next_due() == now + 1
 
-    def test_explicit_interval_overrides_default(self):
+        updater._refresh_temperature_status.reset_mock()
+        updater.update(now=now + 0.5)
+        assert updater._refresh_temperature_status.call_count == 0
+
+        updater.update(now=now + 1)
+        assert updater._refresh_temperature_status.call_count == 1
+        assert updater._refresh_temperature_status.call_args[0][1] is fast
+        assert updater._refresh_temperature_status.call_args[0][3] == 'Fast Temp'
+
+        updater._refresh_temperature_status.reset_mock()
+        updater.update(now=now + 60)
+        assert updater._refresh_temperature_status.call_count == 2
+
+    def test_schedule_not_rebuilt_without_topology_change(self):
         chassis = MockChassis()
-        updater = thermalctld.TemperatureUpdater(
-            chassis, threading.Event(),
-            thermal_intervals={'CPU Temp': 5}, default_interval=60)
-        updater._should_update_thermal('CPU Temp')
-        # CPU Temp uses explicit 5s, not default 60s
-        updater._last_thermal_update_times['CPU Temp'] = time.time() - 6
-        assert updater._should_update_thermal('CPU Temp') is True
+        thermal = MockThermal()
+        thermal.get_name = mock.MagicMock(return_value='CPU Temp')
+        chassis._thermal_list.append(thermal)
+        updater = self._make_updater(chassis, thermal_intervals={'CPU Temp': 1})
+        updater.phy_entity_table = mock.MagicMock()
+
+        now = time.time()
+        updater.update(now=now)
+        updater.update(now=now + 1)
+        updater.update(now=now + 2)
+        assert thermal.get_name.call_count == 1
+        assert updater.phy_entity_table.set.call_count == 1
+        assert updater._refresh_temperature_status.call_count == 3
+
+    def test_schedule_rebuilt_on_topology_change(self):
+        chassis = MockChassis()
+        thermal = MockThermal()
+        thermal._name = 'CPU Temp'
+        chassis._thermal_list.append(thermal)
+        updater = self._make_updater(chassis, thermal_intervals={'CPU Temp': 10, 'New Temp': 10})
+        updater._remove_thermal_from_db = mock.MagicMock()
+
+        now = time.time()
+        updater.update(now=now)
+        assert updater._refresh_temperature_status.call_count == 1
+
+        # A new thermal is due immediately, the existing one keeps its deadline
+        new_thermal = MockThermal()
+        new_thermal._name = 'New Temp'
+        chassis._thermal_list.append(new_thermal)
+        updater._refresh_temperature_status.reset_mock()
+        updater.update(now=now + 1)
+        assert updater._refresh_temperature_status.call_count == 1
+        assert updater._refresh_temperature_status.call_args[0][1] is new_thermal
+        assert updater.get_next_due() == now + 10
+
+        # A removed thermal is dropped from the schedule and the DB
+        chassis._thermal_list.remove(thermal)
+        updater.update(now=now + 2)
+        updater._remove_thermal_from_db.assert_called_once_with(thermal, 'chassis 1', 0)
+        assert list(updater._scheduled_thermals) == ['New Temp']
+        assert updater.get_next_due() == now + 11
 
 
 class TestPsuIntervalGating(object):
@@ -2008,12 +2234,12 @@ class TestPsuIntervalGating(object):
             chassis, threading.Event(), psu_interval=1)
         updater._refresh_temperature_status = mock.MagicMock()
 
-        updater.update()
+        now = time.time()
+        updater.update(now=now)
         updater._refresh_temperature_status.reset_mock()
 
-        # Fake that last PSU update was 2 seconds ago
-        updater._last_psu_thermal_update = time.time() - 2
-        updater.update()
+        # PSU interval has elapsed 2 seconds later
+        updater.update(now=now + 2)
         assert updater._refresh_temperature_status.call_count > 0
 
     def test_psu_thermals_always_refreshed_when_no_interval(self):
@@ -2127,6 +2353,36 @@ class TestThermalMonitorPollingIntervals(object):
         assert monitor.fan_updater.update.call_count == 1
 
 
+    def test_thermal_intervals_do_not_shrink_update_interval(self):
+        chassis = MockChassis()
+        monitor = thermalctld.ThermalMonitor(
+            chassis, 5, 60, 30,
+            polling_intervals={'fan_drawer': None, 'psu': None, 'thermals': {'CPU Temp': 5}})
+        assert monitor.update_interval == 60
+
+    def test_main_wakes_up_for_next_due_thermal(self):
+        chassis = MockChassis()
+        monitor = thermalctld.ThermalMonitor(
+            chassis, 5, 60, 30,
+            polling_intervals={'fan_drawer': None, 'psu': None, 'thermals': {'CPU Temp': 5}})
+        monitor.fan_updater.update = mock.MagicMock()
+        monitor.temperature_updater.update = mock.MagicMock()
+        monitor.temperature_updater.get_next_due = mock.MagicMock(return_value=time.time() + 5)
+
+        monitor.main()
+        assert monitor.wait_time <= 5
+
+        # An overdue thermal does not make the loop spin
+        monitor.temperature_updater.get_next_due.return_value = time.time() - 1
+        monitor.main()
+        assert monitor.wait_time == thermalctld.ThermalMonitor.MIN_WAIT_TIME
+
+        # The floor does not stretch a shorter wait for the regular update interval
+        monitor.update_interval = 0.5
+        monitor.main()
+        assert monitor.wait_time < thermalctld.ThermalMonitor.MIN_WAIT_TIME
+
+
 class TestCollectFansEarlyReturn(object):
     """Tests for FanUpdater._collect_fans() task_stopping_event handling"""
 
@@ -2163,20 +2419,200 @@ class TestCollectThermalsEarlyReturn(object):
         result = updater._collect_thermals(available, 'test', [MockThermal()])
         assert result is False
 
-    def test_collect_thermals_no_refresh_when_false(self):
+    def test_collect_thermals_schedules_psu_thermals(self):
         chassis = MockChassis()
-        updater = thermalctld.TemperatureUpdater(chassis, threading.Event())
+        updater = thermalctld.TemperatureUpdater(chassis, threading.Event(), psu_interval=30)
         updater._refresh_temperature_status = mock.MagicMock()
         updater.phy_entity_table = mock.MagicMock()
         available = set()
-        result = updater._collect_thermals(available, 'PSU 1', [MockThermal()], refresh=False)
+        result = updater._collect_thermals(available, 'PSU 1', [MockThermal()], psu_thermal=True, now=100)
         assert result is True
         assert len(available) == 1
         updater._refresh_temperature_status.assert_not_called()
-        # Entity info should still be updated even without temperature refresh
+        assert updater.get_next_due() == 100
+        assert updater._unthrottled_thermals == []
+        # Entity info should be updated when the thermal is scheduled
         updater.phy_entity_table.set.assert_called()
 
 
+class TestConcurrentSensorReader(object):
+    """Tests for ConcurrentSensorReader"""
+
+    def test_read_returns_values_and_exceptions(self):
+        reader = thermalctld.ConcurrentSensorReader(2, 5)
+        error = Exception('read failed')
+        groups = [
+            ('drawer 1', [('fan1', 'Fan 1', lambda: 1), ('fan2', 'Fan 2', lambda: 2)]),
+            ('drawer 2', [('fan3', 'Fan 3', mock.MagicMock(side_effect=error))]),
+        ]
+        results = reader.read(groups)
+        assert results == {'fan1': 1, 'fan2': 2, 'fan3': error}
+        reader.shutdown()
+
+    def test_groups_read_in_parallel(self):
+        reader = thermalctld.ConcurrentSensorReader(4, 5)
+        barrier = threading.Barrier(3, timeout=2)
+
+        def read():
+            # Only completes if all three groups are read at the same time
+            barrier.wait()
+            return 1
+
+        groups = [('psu {}'.format(i), [('thermal{}'.format(i), 'Thermal {}'.format(i), read)]) for i in range(3)]
+        results = reader.read(groups)
+        assert results == {'thermal0': 1, 'thermal1': 1, 'thermal2': 1}
+        reader.shutdown()
+
+    def test_slow_read_marked_as_timeout(self):
+        reader = thermalctld.ConcurrentSensorReader(2, 0.1)
+        reader.log_warning = mock.MagicMock()
+        reader.log_notice = mock.MagicMock()
+        release = threading.Event()
+
+        def hung_read():
+            release.wait(2)
+            return 1
+
+        groups = [
+            ('psu 1', [('thermal1', 'Thermal 1', hung_read)]),
+            ('psu 2', [('thermal2', 'Thermal 2', lambda: 2)]),
+        ]
+        results = reader.read(groups)
+        assert isinstance(results['thermal1'], thermalctld.SensorReadTimeout)
+        assert results['thermal2'] == 2
+        reader.log_warning.assert_called_once_with('Reading Thermal 1 timed out after 0.1 seconds')
+
+        # The hung device is not read again until its previous read returns
+        results = reader.read(groups)
+        assert isinstance(results['thermal1'], thermalctld.SensorReadTimeout)
+        assert reader.log_warning.call_count == 1
+
+        release.set()
+        time.sleep(0.2)
+        groups[0] = ('psu 1', [('thermal1', 'Thermal 1', lambda: 1)])
+        results = reader.read(groups)
+        assert results['thermal1'] == 1
+        reader.log_notice.assert_called_once_with('Reading Thermal 1 recovered from timeout')
+        reader.shutdown()
+
+    def test_timeout_applies_per_read(self):
+        reader = thermalctld.ConcurrentSensorReader(1, 0.3)
+
+        def slow_read():
+            time.sleep(0.15)
+            return 1
+
+        # The group takes longer than read_timeout, but none of its reads does
+        groups = [('psu 1', [('thermal{}'.format(i), 'Thermal {}'.format(i), slow_read) for i in range(4)])]
+        results = reader.read(groups)
+        assert results == {'thermal0': 1, 'thermal1': 1, 'thermal2': 1, 'thermal3': 1}
+        reader.shutdown()
+
+    def test_groups_queued_behind_hung_workers_time_out(self):
+        reader = thermalctld.ConcurrentSensorReader(1, 0.1)
+        release = threading.Event()
+
+        def hung_read():
+            release.wait(2)
+            return 1
+
+        groups = [
+            ('psu 1', [('thermal1', 'Thermal 1', hung_read)]),
+            ('psu 2', [('thermal2', 'Thermal 2', lambda: 2)]),
+        ]
+        begin = time.monotonic()
+        results = reader.read(groups)
+        assert time.monotonic() - begin < 1
+        assert isinstance(results['thermal1'], thermalctld.SensorReadTimeout)
+        assert isinstance(results['thermal2'], thermalctld.SensorReadTimeout)
+
+        release.set()
+        time.sleep(0.2)
+        results = reader.read(groups)
+        assert results == {'thermal1': 1, 'thermal2': 2}
+        reader.shutdown()
+
+
+class TestConcurrentSensorCollection(object):
+    """Tests for FanUpdater and TemperatureUpdater in concurrent collection mode"""
+
+    def test_fan_update_uses_concurrent_readings(self):
+        chassis = MockChassis()
+        chassis.make_over_speed_fan()
+        reader = thermalctld.ConcurrentSensorReader(2, 5)
+        fan_updater = thermalctld.FanUpdater(chassis, threading.Event(), sensor_reader=reader)
+        fan_updater.pipeline = mock.MagicMock()
+        fan_updater.update()
+
+        fan_updater.pipeline.flush.assert_called_once()
+        assert fan_updater.log_warning.call_count == 1
+        fan_updater.log_warning.assert_called_with(
+            'Fan high speed warning: FanDrawer 0 fan 1 current speed=2, target speed=1')
+        assert fan_updater.batch_table.get('FanDrawer 0 fan 1')["speed"] == "2"
+        reader.shutdown()
+
+    def test_fan_timeout_written_as_not_available(self):
+        chassis = MockChassis()
+        chassis.make_absent_fan()
+        reader = mock.MagicMock()
+        fan = chassis.get_all_fans()[0]
+        reader.read = mock.MagicMock(return_value={fan: thermalctld.SensorReadTimeout()})
+        fan_updater = thermalctld.FanUpdater(chassis, threading.Event(), sensor_reader=reader)
+        fan_updater.fan_status_dict['FanDrawer 0 fan 1'] = thermalctld.FanStatus(fan)
+        fan_updater.fan_status_dict['FanDrawer 0 fan 1'].presence = False
+        fan_updater.update()
+
+        row = fan_updater.batch_table.get('FanDrawer 0 fan 1')
+        assert row['presence'] == thermalctld.NOT_AVAILABLE
+        assert row['speed'] == thermalctld.NOT_AVAILABLE
+        # Last known status still counts towards bad fans
+        assert thermalctld.FanStatus.get_bad_fan_count() == 1
+
+    def test_thermal_update_uses_concurrent_readings(self):
+        chassis = MockChassis()
+        chassis.make_over_temper_thermal()
+        reader = thermalctld.ConcurrentSensorReader(2, 5)
+        temperature_updater = thermalctld.TemperatureUpdater(chassis, threading.Event(), sensor_reader=reader)
+        temperature_updater.pipeline = mock.MagicMock()
+        temperature_updater.log_warning.reset_mock()
+        temperature_updater.update()
+
+        temperature_updater.pipeline.flush.assert_called_once()
+        temperature_updater.log_warning.assert_called_with(
+            'High temperature warning: chassis 1 Thermal 1 current temperature 3C, high threshold 2C')
+        assert temperature_updater.batch_table.get('chassis 1 Thermal 1')['temperature'] == '3'
+        reader.shutdown()
+
+    def test_thermal_timeout_written_as_not_available(self):
+        chassis = MockChassis()
+        chassis.make_over_temper_thermal()
+        thermal = chassis.get_all_thermals()[0]
+        reader = mock.MagicMock()
+        reader.read = mock.MagicMock(return_value={thermal: thermalctld.SensorReadTimeout()})
+        temperature_updater = thermalctld.TemperatureUpdater(chassis, threading.Event(), sensor_reader=reader)
+        temperature_updater.log_warning.reset_mock()
+        temperature_updater.update()
+
+        row = temperature_updater.batch_table.get('chassis 1 Thermal 1')
+        assert row['temperature'] == thermalctld.NOT_AVAILABLE
+        assert row['high_threshold'] == thermalctld.NOT_AVAILABLE
+        assert row['warning_status'] == 'False'
+        assert temperature_updater.log_warning.call_count == 0
+
+    def test_thermal_monitor_creates_sensor_reader(self):
+        chassis = MockChassis()
+        monitor = thermalctld.ThermalMonitor(chassis, 5, 60, 30, sensor_read_workers=4, sensor_read_timeout=2)
+        assert monitor.sensor_reader.max_workers == 4
+        assert monitor.sensor_reader.read_timeout == 2
+        assert monitor.fan_updater.sensor_reader is monitor.sensor_reader
+        assert monitor.temperature_updater.sensor_reader is monitor.sensor_reader
+        monitor.sensor_reader.shutdown()
+
+        monitor = thermalctld.ThermalMonitor(chassis, 5, 60, 30)
+        assert monitor.sensor_reader is None
+        assert monitor.fan_updater.batch_table is None
+
+
 class TestTemperatureUpdaterBmcMirror(object):
     """
     Tests for pushing TEMPERATURE_INFO from Switch-Host to BMC's STATE_DB
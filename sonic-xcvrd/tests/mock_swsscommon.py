@@ -8,6 +8,9 @@ class Table:
         self.mock_dict = {}
         self.mock_keys = []
 
+    def getTableName(self):
+        return self.table_name
+
     def _del(self, key):
         if key in self.mock_dict:
             del self.mock_dict[key]
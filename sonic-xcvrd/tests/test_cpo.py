@@ -1,9 +1,14 @@
 import contextlib
+import threading
 
 from unittest.mock import MagicMock, patch
 
 from sonic_py_common import device_info
 from xcvrd.xcvrd_utilities import common
+from xcvrd.xcvrd_utilities.port_event_helper import PortChangeEvent, PortMapping
+from xcvrd import xcvrd
+from xcvrd.cpo.dom_mgr import CpoDomInfoUpdateTask
+from xcvrd.cpo.cpo_state_task import CpoStateUpdateTask
 
 
 class TestPortDeviceResolver:
@@ -176,3 +181,94 @@ class TestCpoTopology:
             assert common.get_oe_sibling_pports(1) == {1}
             assert common.get_elsfp_sibling_pports(1) == {1}
 
+
+
+class TestCpoDeviceReads:
+    SIBLING_PPORTS_FUNCS = (common.get_oe_sibling_pports, common.get_elsfp_sibling_pports)
+
+    def test_group_pports_by_cpo_devices(self):
+        with patched_topology():
+            # Physical ports 1 and 2 share both OE1 and ELS1, physical port 3 only shares ELS1
+            assert common.group_pports_by_cpo_devices([1, 2, 3], self.SIBLING_PPORTS_FUNCS) == [[1, 2], [3]]
+            assert common.group_pports_by_cpo_devices([1, 2, 3], (common.get_elsfp_sibling_pports,)) == [[1, 2, 3]]
+            # Physical ports not described by the topology are grouped alone
+            assert common.group_pports_by_cpo_devices([1, 98, 2, 99], self.SIBLING_PPORTS_FUNCS) == [[1, 2], [98], [99]]
+            assert common.group_pports_by_cpo_devices([], self.SIBLING_PPORTS_FUNCS) == []
+
+    def test_read_once_per_cpo_device(self):
+        read_func = MagicMock(side_effect=lambda physical_port: physical_port * 10)
+        values = common.read_once_per_cpo_device([[1, 2], [3]], read_func, threading.Event())
+        assert values == {1: 10, 2: 10, 3: 30}
+        assert sorted(call.args[0] for call in read_func.call_args_list) == [1, 3]
+
+        assert common.read_once_per_cpo_device([], read_func, threading.Event()) == {}
+
+    def test_read_once_per_cpo_device_failed_reads_are_left_out(self):
+        def read_func(physical_port):
+            if physical_port == 3:
+                raise KeyError(physical_port)
+            return None
+
+        # A None value is still fanned out, only the failed group is left out
+        assert common.read_once_per_cpo_device([[1, 2], [3]], read_func, threading.Event()) == {1: None, 2: None}
+
+    def test_read_once_per_cpo_device_stopped(self):
+        read_func = MagicMock()
+        stop_event = threading.Event()
+        stop_event.set()
+        assert common.read_once_per_cpo_device([[1, 2], [3]], read_func, stop_event) == {}
+        read_func.assert_not_called()
+
+    def _make_port_mapping(self):
+        port_mapping = PortMapping()
+        for port_name, physical_port in (('Ethernet0', 1), ('Ethernet8', 2), ('Ethernet16', 3)):
+            port_mapping.handle_port_change_event(PortChangeEvent(port_name, physical_port, 0, PortChangeEvent.PORT_ADD))
+        return port_mapping
+
+    @patch('xcvrd.dom.dom_mgr.XcvrTableHelper', MagicMock())
+    @patch('xcvrd.cpo.dom_mgr.sfp_status_helper.detect_port_in_error_status', MagicMock(return_value=False))
+    @patch('xcvrd.xcvrd_utilities.common._wrapper_get_transceiver_firmware_info')
+    @patch('xcvrd.xcvrd_utilities.common._wrapper_get_presence')
+    def test_CpoDomInfoUpdateTask_prefetch_dom_pass(self, mock_get_presence, mock_get_firmware_info):
+        mock_get_presence.side_effect = lambda physical_port: physical_port != 3
+        mock_get_firmware_info.return_value = {'active_firmware': '1.0'}
+        port_obj_dict = {1: MagicMock(), 2: MagicMock(), 3: MagicMock()}
+        task = CpoDomInfoUpdateTask([''], self._make_port_mapping(), port_obj_dict, threading.Event(), True)
+        task.get_dom_polling_from_config_db = MagicMock(return_value='enabled')
+
+        with patched_topology():
+            task.prefetch_dom_pass()
+
+        # Presence is read once for OE1 and once for OE2, firmware info only for the present OE1
+        assert mock_get_presence.call_count == 2
+        assert task.presence_cache == {1: True, 2: True, 3: False}
+        mock_get_firmware_info.assert_called_once()
+        assert task.firmware_info_cache == {1: {'active_firmware': '1.0'}, 2: {'active_firmware': '1.0'}}
+        assert task.get_port_presence(2) is True
+        assert task.get_port_presence(3) is False
+
+        # Ports with DOM monitoring disabled are not read
+        mock_get_presence.reset_mock()
+        task.get_dom_polling_from_config_db = MagicMock(side_effect=lambda lport: 'disabled' if lport != 'Ethernet16' else 'enabled')
+        with patched_topology():
+            task.prefetch_dom_pass()
+        mock_get_presence.assert_called_once_with(3)
+        assert task.presence_cache == {3: False}
+        assert task.firmware_info_cache == {}
+
+    @patch('xcvrd.xcvrd.XcvrTableHelper', MagicMock())
+    @patch('xcvrd.xcvrd.common.update_port_transceiver_status_table_sw')
+    @patch('xcvrd.xcvrd_utilities.common._wrapper_get_presence', MagicMock(return_value=True))
+    def test_CpoStateUpdateTask_init_port_sfp_status_sw_tbl(self, mock_update_status):
+        port_mapping = self._make_port_mapping()
+        port_obj_dict = {1: MagicMock(), 2: MagicMock(), 3: MagicMock()}
+        stop_event = threading.Event()
+        task = CpoStateUpdateTask([''], port_mapping, port_obj_dict, stop_event, threading.Event())
+
+        with patched_topology():
+            task._init_port_sfp_status_sw_tbl(port_mapping, MagicMock(), stop_event)
+
+        # Presence is read once per group of ports sharing the same devices
+        assert common._wrapper_get_presence.call_count == 2
+        assert mock_update_status.call_count == 3
+        assert task.presence_cache is None
@@ -18,6 +18,7 @@ from xcvrd.xcvrd_utilities.xcvr_table_helper import *
 from xcvrd.dom.utilities.db.utils import DBUtils
 from xcvrd.dom.utilities.dom_sensor.utils import DOMUtils
 from xcvrd.dom.utilities.status.utils import StatusUtils
+from xcvrd.dom.utilities.pm.utils import PMAggregator
 import pytest
 import copy
 import os
@@ -899,6 +900,30 @@ class TestXcvrdScript(object):
         dom_db_utils.post_port_dom_temperature_info_to_db(logical_port_name, db_cache=db_cache)
         assert dom_tbl.get_size_for_key(logical_port_name) == 2
 
+    def test_post_port_dom_temperature_values_to_db(self):
+        port_mapping = PortMapping()
+        xcvr_table_helper = XcvrTableHelper(DEFAULT_NAMESPACE)
+        stop_event = threading.Event()
+        mock_sfp_obj_dict = {0 : MagicMock()}
+
+        dom_db_utils = DOMDBUtils(mock_sfp_obj_dict, port_mapping, xcvr_table_helper, stop_event, helper_logger)
+        dom_db_utils.dom_utils = MagicMock()
+        dom_db_utils.xcvrd_utils.get_transceiver_presence = MagicMock()
+        dom_tbl = Table("STATE_DB", TRANSCEIVER_DOM_TEMPERATURE_TABLE)
+
+        # Ensure table is empty if temperature is not supported
+        dom_db_utils.dom_utils.get_transceiver_dom_temperature = MagicMock(return_value={})
+        assert dom_db_utils.post_port_dom_temperature_values_to_db('Ethernet0', 0, dom_tbl) == {}
+        assert dom_tbl.get_size() == 0
+
+        # Ensure only the temperature is read and the unit is stripped
+        dom_db_utils.dom_utils.get_transceiver_dom_temperature = MagicMock(return_value={'temperature': '68.75C'})
+        assert dom_db_utils.post_port_dom_temperature_values_to_db('Ethernet0', 0, dom_tbl) == {'temperature': '68.75'}
+        assert dom_tbl.get_size_for_key('Ethernet0') == 2
+        assert dict(dom_tbl.get('Ethernet0')[1])['temperature'] == '68.75'
+        dom_db_utils.dom_utils.get_transceiver_dom_temperature.assert_called_once_with(0)
+        assert dom_db_utils.xcvrd_utils.get_transceiver_presence.call_count == 0
+
     def test_post_port_dom_flags_to_db(self):
         def mock_get_transceiver_dom_flags(physical_port):
             return {
@@ -1400,6 +1425,73 @@ class TestXcvrdScript(object):
         dom_info_update.post_port_pm_info_to_db(logical_port_name, port_mapping, pm_tbl, stop_event)
         assert pm_tbl.get_size_for_key(logical_port_name) == 6
 
+        # The fresh PM snapshot is aggregated into the interval bins of the port
+        dom_info_update.pm_db_utils.post_port_pm_interval_info_to_db = MagicMock()
+        port_mapping.get_asic_id_for_logical_port = MagicMock(return_value=0)
+        dom_info_update.post_port_pm_info_to_db(logical_port_name, port_mapping, pm_tbl, stop_event)
+        dom_info_update.pm_db_utils.post_port_pm_interval_info_to_db.assert_called_once()
+        assert dom_info_update.pm_db_utils.post_port_pm_interval_info_to_db.call_args[0][:3] == (logical_port_name, 0, 0)
+
+        # A cached PM snapshot is not aggregated again
+        dom_info_update.post_port_pm_info_to_db(logical_port_name, port_mapping, pm_tbl, stop_event, pm_info_cache={})
+        assert dom_info_update.pm_db_utils.post_port_pm_interval_info_to_db.call_count == 1
+
+    def test_pm_aggregator(self):
+        pm_aggregator = PMAggregator(helper_logger)
+        module = MagicMock()
+        day = 24 * 60 * 60
+
+        # Non PM keys and non numeric values are ignored, missing min/max fall back to avg
+        assert PMAggregator.parse_pm_metrics({'osnr_avg': '20.0', 'osnr_min': 19, 'cd_avg': 'N/A',
+                                              'cfo_avg': 1.5, 'unrelated': 1}) == {'osnr': (19.0, 20.0, 20.0),
+                                                                                   'cfo': (1.5, 1.5, 1.5)}
+        assert pm_aggregator.update('Ethernet0', {'cd_avg': 'N/A'}, day) == []
+
+        assert pm_aggregator.update('Ethernet0', {'osnr_avg': 20.0, 'osnr_min': 19.0, 'osnr_max': 21.0}, day, module) == \
+            [('15min', 'current'), ('24h', 'current')]
+        assert pm_aggregator.update('Ethernet0', {'osnr_avg': 22.0, 'osnr_min': 18.0, 'osnr_max': 23.0}, day + 60, module) == \
+            [('15min', 'current'), ('24h', 'current')]
+        assert pm_aggregator.get_bin('Ethernet0', '15min', 'current').to_dict() == \
+            {'osnr_min': 18.0, 'osnr_max': 23.0, 'osnr_avg': 21.0, 'osnr_count': 2}
+        assert pm_aggregator.get_bin('Ethernet0', '15min', 'previous') is None
+
+        # Crossing a quarter hour boundary rolls the 15-minute bin over
+        assert pm_aggregator.update('Ethernet0', {'osnr_avg': 24.0, 'osnr_min': 24.0, 'osnr_max': 24.0}, day + 900, module) == \
+            [('15min', 'previous'), ('15min', 'current'), ('24h', 'current')]
+        assert pm_aggregator.get_bin('Ethernet0', '15min', 'previous').to_dict()['osnr_count'] == 2
+        assert pm_aggregator.get_bin('Ethernet0', '15min', 'current').to_dict() == \
+            {'osnr_min': 24.0, 'osnr_max': 24.0, 'osnr_avg': 24.0, 'osnr_count': 1}
+        assert pm_aggregator.get_bin('Ethernet0', '15min', 'current').start_time == day + 900
+        assert pm_aggregator.get_bin('Ethernet0', '24h', 'current').to_dict()['osnr_count'] == 3
+
+        # A new module restarts the bins of the port
+        assert pm_aggregator.update('Ethernet0', {'osnr_avg': 20.0}, day + 960, MagicMock()) == \
+            [('15min', 'current'), ('24h', 'current')]
+        assert pm_aggregator.get_bin('Ethernet0', '24h', 'current').to_dict()['osnr_count'] == 1
+        assert pm_aggregator.get_bin('Ethernet0', '15min', 'previous') is None
+
+        pm_aggregator.remove_port('Ethernet0')
+        assert pm_aggregator.get_bin('Ethernet0', '15min', 'current') is None
+
+    def test_post_port_pm_interval_info_to_db(self):
+        port_mapping = PortMapping()
+        xcvr_table_helper = XcvrTableHelper(DEFAULT_NAMESPACE)
+        pm_db_utils = PMDBUtils({0 : MagicMock()}, port_mapping, xcvr_table_helper, threading.Event(), helper_logger)
+        pm_interval_tbls = {t: Table("STATE_DB", f'TRANSCEIVER_PM_{t.upper()}') for t in PM_INTERVAL_TYPES}
+        pm_db_utils.xcvr_table_helper.get_pm_interval_tbl = MagicMock(side_effect=lambda asic_id, t: pm_interval_tbls[t])
+
+        pm_info = {'prefec_ber_avg': 1e-4, 'prefec_ber_min': 1e-5, 'prefec_ber_max': 1e-3}
+        pm_db_utils.post_port_pm_interval_info_to_db('Ethernet0', 0, 0, pm_info, now=0)
+        assert pm_interval_tbls['15min_current'].get_size_for_key('Ethernet0') == 6
+        assert pm_interval_tbls['24h_current'].get_size_for_key('Ethernet0') == 6
+        assert pm_interval_tbls['15min_previous'].get_size() == 0
+        assert dict(pm_interval_tbls['15min_current'].get('Ethernet0')[1])['interval_start'] == 'Thu Jan 01 00:00:00 1970'
+
+        pm_db_utils.post_port_pm_interval_info_to_db('Ethernet0', 0, 0, pm_info, now=900)
+        assert pm_interval_tbls['15min_previous'].get_size_for_key('Ethernet0') == 6
+        assert pm_interval_tbls['24h_previous'].get_size() == 0
+        assert dict(pm_interval_tbls['15min_current'].get('Ethernet0')[1])['interval_start'] == 'Thu Jan 01 00:15:00 1970'
+
     @patch('xcvrd.xcvrd_utilities.port_event_helper.PortMapping.logical_port_name_to_physical_port_list', MagicMock(return_value=[0]))
     @patch('xcvrd.xcvrd_utilities.common._wrapper_get_presence', MagicMock(return_value=True))
     def test_del_port_sfp_dom_info_from_db(self):
@@ -1413,6 +1505,87 @@ class TestXcvrdScript(object):
         common.del_port_sfp_dom_info_from_db(logical_port_name, port_mapping, [init_tbl, dom_tbl, dom_threshold_tbl, pm_tbl, firmware_info_tbl])
         assert dom_tbl.get_size() == 0
 
+    def test_bulk_del_port_sfp_dom_info_from_db(self):
+        port_mapping = PortMapping()
+        port_mapping.handle_port_change_event(PortChangeEvent('Ethernet0', 1, 0, PortChangeEvent.PORT_ADD))
+        port_mapping.handle_port_change_event(PortChangeEvent('Ethernet4', 2, 0, PortChangeEvent.PORT_ADD))
+        xcvr_table_helper = MagicMock()
+        xcvr_table_helper.bulk_del = MagicMock(return_value=0.5)
+        tbl_list = [MagicMock(), None]
+
+        assert common.bulk_del_port_sfp_dom_info_from_db(['Ethernet0', 'Ethernet4'], port_mapping,
+                                                         xcvr_table_helper, 0, tbl_list) == 0.5
+        xcvr_table_helper.bulk_del.assert_called_once_with(0, ['Ethernet0', 'Ethernet4'], tbl_list)
+
+    def test_XcvrTableHelper_bulk_del(self):
+        batch_tbls = {}
+
+        def mock_table(db, table_name, buffered=False):
+            tbl = MagicMock()
+            tbl.getTableName = MagicMock(return_value=table_name)
+            if buffered:
+                batch_tbls[table_name] = tbl
+            return tbl
+
+        with patch('xcvrd.xcvrd_utilities.xcvr_table_helper.swsscommon.Table', side_effect=mock_table), \
+                patch('xcvrd.xcvrd_utilities.xcvr_table_helper.swsscommon.RedisPipeline') as mock_pipeline:
+            xcvr_table_helper = XcvrTableHelper(DEFAULT_NAMESPACE)
+            tbl_list = [None, xcvr_table_helper.get_dom_tbl(0), xcvr_table_helper.get_pm_tbl(0)]
+
+            assert xcvr_table_helper.bulk_del(0, ['Ethernet0', 'Ethernet4'], tbl_list) >= 0
+            assert sorted(batch_tbls) == [TRANSCEIVER_DOM_SENSOR_TABLE, TRANSCEIVER_PM_TABLE]
+            for tbl in batch_tbls.values():
+                assert tbl._del.call_args_list == [(('Ethernet0',),), (('Ethernet4',),)]
+            # Nothing is deleted through the non-pipelined tables
+            assert xcvr_table_helper.get_dom_tbl(0)._del.call_count == 0
+            mock_pipeline.assert_called_once()
+            assert mock_pipeline.return_value.flush.call_count == 1
+
+            # Pipeline and buffered tables are reused
+            xcvr_table_helper.bulk_del(0, ['Ethernet8'], tbl_list)
+            mock_pipeline.assert_called_once()
+            assert mock_pipeline.return_value.flush.call_count == 2
+            assert batch_tbls[TRANSCEIVER_PM_TABLE]._del.call_count == 3
+
+            # Nothing to delete
+            xcvr_table_helper.bulk_del(0, [], tbl_list)
+            assert mock_pipeline.return_value.flush.call_count == 2
+
+    def test_XcvrTableHelper_publish_rows(self):
+        batch_tbls = {}
+
+        def mock_table(db, table_name, buffered=False):
+            tbl = Table(db, table_name)
+            if buffered:
+                batch_tbls[table_name] = tbl
+            return tbl
+
+        with patch('xcvrd.xcvrd_utilities.xcvr_table_helper.swsscommon.Table', side_effect=mock_table), \
+                patch('xcvrd.xcvrd_utilities.xcvr_table_helper.swsscommon.RedisPipeline') as mock_pipeline:
+            xcvr_table_helper = XcvrTableHelper(DEFAULT_NAMESPACE)
+            int_tbl = xcvr_table_helper.get_intf_tbl(0)
+            keys = ['Ethernet0', 'Ethernet2', 'Ethernet4']
+            fv_list = [('model', 'X'), ('cable_length', '3')]
+
+            # All the siblings are written through the pipeline with a single flush
+            assert xcvr_table_helper.publish_rows(0, int_tbl, keys, fv_list) == keys
+            assert batch_tbls[TRANSCEIVER_INFO_TABLE].getKeys() == keys
+            assert mock_pipeline.return_value.flush.call_count == 1
+
+            # The siblings already holding the same row are skipped
+            int_tbl.set('Ethernet0', [('model', 'X'), ('cable_length', '3'), ('serial', 'Y')])
+            int_tbl.set('Ethernet2', [('model', 'X'), ('cable_length', '3')])
+            int_tbl.set('Ethernet4', [('model', 'Z'), ('cable_length', '3')])
+            int_tbl.mock_keys.clear()
+            assert xcvr_table_helper.publish_rows(0, int_tbl, keys, fv_list) == ['Ethernet4']
+            # A single changed row is written directly
+            assert int_tbl.getKeys() == ['Ethernet4']
+            assert mock_pipeline.return_value.flush.call_count == 1
+
+            int_tbl.mock_keys.clear()
+            assert xcvr_table_helper.publish_rows(0, int_tbl, keys, fv_list) == []
+            assert int_tbl.getKeys() == []
+
     @pytest.mark.parametrize("mock_found, mock_state, expected_cmis_state", [
         (True, CMIS_STATE_INSERTED, CMIS_STATE_INSERTED),
         (False, None, CMIS_STATE_UNKNOWN)
@@ -1474,6 +1647,33 @@ class TestXcvrdScript(object):
         transceiver_dict = {}
         post_port_sfp_info_to_db(logical_port_name, port_mapping, dom_tbl, transceiver_dict, stop_event)
 
+    @patch('xcvrd.xcvrd_utilities.common._wrapper_get_presence', MagicMock(return_value=True))
+    @patch('xcvrd.xcvrd._wrapper_is_replaceable', MagicMock(return_value=True))
+    @patch('xcvrd.xcvrd._wrapper_get_transceiver_info', MagicMock(return_value={'cmis_rev': '5.0', 'model': 'X'}))
+    def test_post_port_sfp_info_to_db_breakout(self):
+        port_mapping = PortMapping()
+        for port_name in ('Ethernet0', 'Ethernet2', 'Ethernet4'):
+            port_mapping.handle_port_change_event(PortChangeEvent(port_name, 1, 0, PortChangeEvent.PORT_ADD))
+        intf_tbl = Table("STATE_DB", TRANSCEIVER_INFO_TABLE)
+        xcvr_table_helper = MagicMock()
+        transceiver_dict = {}
+        published_lports = set()
+
+        # The row is published once for all the subports of the breakout
+        for port_name in ('Ethernet0', 'Ethernet2', 'Ethernet4'):
+            assert post_port_sfp_info_to_db(port_name, port_mapping, intf_tbl, transceiver_dict,
+                                            xcvr_table_helper=xcvr_table_helper,
+                                            published_lports=published_lports) is None
+        xcvr_table_helper.publish_rows.assert_called_once_with(
+            0, intf_tbl, ['Ethernet0', 'Ethernet2', 'Ethernet4'],
+            [('cmis_rev', '5.0'), ('model', 'X'), ('is_replaceable', 'True')])
+        assert published_lports == {'Ethernet0', 'Ethernet2', 'Ethernet4'}
+        assert xcvrd._wrapper_get_transceiver_info.call_count == 1
+
+        # Without the table helper, only the row of the logical port is set
+        post_port_sfp_info_to_db('Ethernet2', port_mapping, intf_tbl, transceiver_dict)
+        assert intf_tbl.getKeys() == ['Ethernet2']
+
     @patch('xcvrd.xcvrd_utilities.port_event_helper.PortMapping.logical_port_name_to_physical_port_list', MagicMock(return_value=[0]))
     @patch('xcvrd.xcvrd_utilities.common._wrapper_get_presence', MagicMock(return_value=False))
     def test_post_port_sfp_info_to_db_with_sfp_not_present(self):
@@ -1518,7 +1718,9 @@ class TestXcvrdScript(object):
         xcvr_table_helper = XcvrTableHelper(DEFAULT_NAMESPACE)
         sfp_error_event = threading.Event()
         task = SfpStateUpdateTask(DEFAULT_NAMESPACE, port_mapping, mock_sfp_obj_dict, stop_event, sfp_error_event)
+        xcvr_table_helper.get_intf_tbl(0).get.return_value = (False, ())
         task._post_port_sfp_info_and_dom_thr_to_db_once(port_mapping, xcvr_table_helper, stop_event)
+        assert xcvr_table_helper.get_intf_tbl(0).set.call_count == 1
 
     @patch('xcvrd.xcvrd_utilities.port_event_helper.PortMapping.logical_port_name_to_physical_port_list', MagicMock(return_value=[0]))
     @patch('xcvrd.xcvrd.platform_sfputil', MagicMock(return_value=[0]))
@@ -2602,8 +2804,8 @@ class TestXcvrdScript(object):
         stop_event = threading.Event()
         stop_event.is_set = MagicMock(return_value=False)
         logger = MagicMock()
-        handle_port_config_change(sel, asic_context, stop_event, port_mapping,
-                                  logger, port_mapping.handle_port_change_event)
+        assert handle_port_config_change(sel, asic_context, stop_event, port_mapping,
+                                         logger, port_mapping.handle_port_change_event)
 
         assert port_mapping.logical_port_list.count('Ethernet0')
         assert port_mapping.get_asic_id_for_logical_port('Ethernet0') == 0
@@ -2619,6 +2821,11 @@ class TestXcvrdScript(object):
         assert not port_mapping.physical_to_logical
         assert not port_mapping.logical_to_asic
 
+        mock_select.return_value = (swsscommon.Select.TIMEOUT, None)
+        assert not handle_port_config_change(sel, asic_context, stop_event, port_mapping,
+                                             logger, port_mapping.handle_port_change_event, timeout=0)
+        mock_select.assert_called_with(0)
+
     @patch('swsscommon.swsscommon.Table')
     def test_get_port_mapping(self, mock_swsscommon_table):
         mock_table = MagicMock()
@@ -3018,6 +3225,7 @@ class TestXcvrdScript(object):
             'admin_status': 'up',
             'asic_id': 0
         }
+        sff_manager_task.dirty_lports.add('Ethernet0')
 
         # Mock task_stopping_event to stop after processing once
         sff_manager_task.task_stopping_event.is_set = MagicMock(side_effect=[False, False, True])
@@ -3029,6 +3237,66 @@ class TestXcvrdScript(object):
         assert any("skipping sff_mgr since no xcvr api!" in str(call)
                    for call in mock_logger.log_error.call_args_list)
 
+    @patch('xcvrd.xcvrd.helper_logger')
+    @patch('xcvrd.sff_mgr.PortChangeObserver', MagicMock(handle_port_update_event=MagicMock()))
+    def test_SffManagerTask_task_worker_dirty_lports(self, mock_logger):
+        mock_xcvr_api = MagicMock()
+        mock_xcvr_api.is_copper = MagicMock(return_value=False)
+        mock_xcvr_api.get_tx_disable_support = MagicMock(return_value=True)
+        mock_xcvr_api.get_power_class = MagicMock(return_value=1)
+        mock_xcvr_api.get_tx_disable = MagicMock(return_value=[True, True, True, True])
+        mock_sfps = {1: MagicMock(), 2: MagicMock()}
+        for mock_sfp in mock_sfps.values():
+            mock_sfp.get_presence = MagicMock(return_value=True)
+            mock_sfp.get_xcvr_api = MagicMock(return_value=mock_xcvr_api)
+        mock_chassis = MagicMock()
+        mock_chassis.get_sfp = MagicMock(side_effect=lambda pport: mock_sfps[pport])
+
+        task = SffManagerTask(DEFAULT_NAMESPACE, threading.Event(), mock_chassis, mock_logger)
+        task.get_host_tx_status = MagicMock(return_value='false')
+        task.get_admin_status = MagicMock(return_value='up')
+        for lport, pport in [('Ethernet0', 1), ('Ethernet4', 2)]:
+            task.on_port_update_event(PortChangeEvent(lport, pport, 0, PortChangeEvent.PORT_SET, {
+                'type': 'QSFP28',
+                'subport': '0',
+                'lanes': '1,2,3,4',
+            }))
+        assert task.dirty_lports == {'Ethernet0', 'Ethernet4'}
+        task.task_stopping_event.is_set = MagicMock(side_effect=[False, False, False, True])
+        task.task_worker()
+        assert not task.dirty_lports
+        assert mock_sfps[1].get_presence.call_count == 1
+        assert mock_sfps[2].get_presence.call_count == 1
+        assert task.xcvr_api_cache == {1: mock_xcvr_api, 2: mock_xcvr_api}
+
+        # A host_tx_ready update of a port only processes this port, with its cached XcvrApi
+        task.on_port_update_event(PortChangeEvent('Ethernet4', 2, 0, PortChangeEvent.PORT_SET,
+                                                  {'host_tx_ready': 'true'}))
+        task.task_stopping_event.is_set = MagicMock(side_effect=[False, False, True])
+        task.task_worker()
+        assert mock_sfps[1].get_presence.call_count == 1
+        assert mock_sfps[2].get_presence.call_count == 2
+        assert mock_sfps[2].get_xcvr_api.call_count == 1
+        mock_xcvr_api.tx_disable_channel.assert_called_once_with(0xf, False)
+
+        # The XcvrApi is created again after the transceiver is removed
+        task.on_port_update_event(PortChangeEvent('Ethernet4', 2, 0, PortChangeEvent.PORT_DEL, {},
+                                                  'STATE_DB', 'TRANSCEIVER_INFO'))
+        assert 2 not in task.xcvr_api_cache
+        task.on_port_update_event(PortChangeEvent('Ethernet4', 2, 0, PortChangeEvent.PORT_SET,
+                                                  {'type': 'QSFP28'}))
+        task.task_stopping_event.is_set = MagicMock(side_effect=[False, False, True])
+        task.task_worker()
+        assert mock_sfps[2].get_xcvr_api.call_count == 2
+
+        # A removed port is dropped from the work queue
+        task.on_port_update_event(PortChangeEvent('Ethernet0', 1, 0, PortChangeEvent.PORT_SET,
+                                                  {'host_tx_ready': 'true'}))
+        task.on_port_update_event(PortChangeEvent('Ethernet0', 1, 0, PortChangeEvent.PORT_DEL, {},
+                                                  'CONFIG_DB', 'PORT_TABLE'))
+        assert not task.dirty_lports
+        assert 'Ethernet0' not in task.port_dict_prev
+
     def test_SffManagerTask_enable_high_power_class(self):
         mock_xcvr_api = MagicMock()
         mock_xcvr_api.get_power_class = MagicMock(return_value=5)
@@ -3828,6 +4096,91 @@ class TestXcvrdScript(object):
             {'lport': 'Ethernet0', 'subport': 1, 'speed': 200000, 'host_lane_count': 2},
         ]
 
+    def test_CmisManagerTask_get_sibling_port_configs_cached_per_iteration(self):
+        port_mapping = PortMapping()
+        stop_event = threading.Event()
+        task = CmisManagerTask(DEFAULT_NAMESPACE, port_mapping, {1: MagicMock(), 2: MagicMock()}, stop_event)
+        task.port_dict['Ethernet0'] = {'index': 1, 'asic_id': 0}
+        task.port_dict['Ethernet8'] = {'index': 2, 'asic_id': 0}
+
+        cfg_port_tbl = MagicMock()
+        cfg_port_tbl.getKeys = MagicMock(return_value=['Ethernet0', 'Ethernet8'])
+        cfg_port_tbl.get = MagicMock(side_effect=lambda key: {
+            'Ethernet0': (True, [('speed', '400000'), ('lanes', '1,2,3,4'), ('subport', '0'), ('index', '1')]),
+            'Ethernet8': (True, [('speed', '400000'), ('lanes', '9,10,11,12'), ('subport', '0'), ('index', '2')]),
+        }[key])
+        task.xcvr_table_helper.get_cfg_port_tbl = MagicMock(return_value=cfg_port_tbl)
+        task._gearbox_lanes_dict = {}
+
+        # Not cached outside of a task_worker iteration
+        task.get_sibling_port_configs('Ethernet0')
+        task.get_sibling_port_configs('Ethernet0')
+        assert cfg_port_tbl.getKeys.call_count == 2
+
+        # The PORT table is read once for all the physical ports of the iteration
+        cfg_port_tbl.getKeys.reset_mock()
+        task._port_configs_by_pport = {}
+        assert task.get_sibling_port_configs('Ethernet0') == [
+            {'lport': 'Ethernet0', 'subport': 0, 'speed': 400000, 'host_lane_count': 4}]
+        assert task.get_sibling_port_configs('Ethernet8') == [
+            {'lport': 'Ethernet8', 'subport': 0, 'speed': 400000, 'host_lane_count': 4}]
+        assert cfg_port_tbl.getKeys.call_count == 1
+
+    def test_CmisManagerTask_cmis_app_memo(self):
+        port_mapping = PortMapping()
+        stop_event = threading.Event()
+        task = CmisManagerTask(DEFAULT_NAMESPACE, port_mapping, {1: MagicMock()}, stop_event)
+
+        def make_api(firmware='1.0'):
+            api = MagicMock()
+            api.get_manufacturer.return_value = 'VENDOR'
+            api.get_model.return_value = 'PN'
+            api.get_vendor_rev.return_value = 'A'
+            api.get_module_active_firmware.return_value = firmware
+            api.get_host_lane_assignment_option.return_value = 0x11
+            api.get_media_lane_count.return_value = 4
+            api.get_media_lane_assignment_option.return_value = 0x1
+            return api
+
+        api1 = make_api()
+        api2 = make_api()
+        with patch('xcvrd.xcvrd_utilities.common.get_cmis_application_desired', return_value=1) as mock_app_desired:
+            # The advertisement is decoded once for the modules of the same type
+            assert task.get_cmis_application_desired(api1, 4, 200000) == 1
+            assert task.get_cmis_application_desired(api2, 4, 200000) == 1
+            assert mock_app_desired.call_count == 1
+            assert task.get_cmis_host_lanes_mask(api1, 1, 4, 2) == 0xf0
+            assert task.get_cmis_host_lanes_mask(api2, 1, 4, 1) == 0x0f
+            assert api1.get_host_lane_assignment_option.call_count == 1
+            api2.get_host_lane_assignment_option.assert_not_called()
+            assert task.get_cmis_media_lane_info(api2, 1) == (4, 1)
+            assert task.get_cmis_media_lane_info(api1, 1) == (4, 1)
+            api1.get_media_lane_count.assert_not_called()
+
+            # A different firmware is a different module type
+            api3 = make_api(firmware='2.0')
+            assert task.get_cmis_application_desired(api3, 4, 200000) == 1
+            assert mock_app_desired.call_count == 2
+
+            # Modules whose type can't be read are not shared
+            api4 = make_api(firmware='N/A')
+            api5 = make_api(firmware='N/A')
+            task.get_cmis_application_desired(api4, 4, 200000)
+            task.get_cmis_application_desired(api5, 4, 200000)
+            assert mock_app_desired.call_count == 4
+
+            # No application found is not memoized
+            mock_app_desired.return_value = None
+            assert task.get_cmis_application_desired(api1, 8, 400000) is None
+            assert task.get_cmis_application_desired(api1, 8, 400000) is None
+            assert mock_app_desired.call_count == 6
+
+        # The module type is read again once the memo of the api is cleared
+        assert api1.get_model.call_count == 1
+        task.clear_cmis_app_memo(api1)
+        task.get_cmis_app_memo(api1)
+        assert api1.get_model.call_count == 2
+
     DEFAULT_DP_STATE = {
         'DP1State': 'DataPathActivated',
         'DP2State': 'DataPathActivated',
@@ -5097,38 +5450,164 @@ class TestXcvrdScript(object):
         assert dom_info_dict == expected_dom_info_dict
 
     @patch('xcvrd.xcvrd.XcvrTableHelper', MagicMock())
+    @patch('xcvrd.xcvrd_utilities.port_event_helper.subscribe_port_config_change', MagicMock(return_value=(None, None)))
+    @patch('xcvrd.xcvrd_utilities.port_event_helper.handle_port_config_change', MagicMock(return_value=False))
+    @patch('xcvrd.xcvrd_utilities.port_event_helper.PortChangeObserver')
     @patch('xcvrd.xcvrd_utilities.common._wrapper_get_presence', MagicMock(return_value=True))
     @patch('xcvrd.xcvrd_utilities.sfp_status_helper.detect_port_in_error_status')
-    @patch('time.sleep', MagicMock())
-    def test_DomThermalInfoUpdateTask_task_worker(self, mock_detect_error):
+    def test_DomThermalInfoUpdateTask_task_worker(self, mock_detect_error, mock_observer):
         poll_interval = 10
         port_mapping = PortMapping()
         port_mapping.physical_to_logical = {
             1: ['Ethernet0'],
             2: ['Ethernet4'],
             3: ['Ethernet8'],
+            4: ['Ethernet12'],
         }
         port_mapping.logical_to_asic = {
             'Ethernet0': 0,
             'Ethernet4': 0,
             'Ethernet8': None,
+            'Ethernet12': 0,
         }
         dom_monitoring_disabled = {
             'Ethernet0': False,
             'Ethernet4': True,
             'Ethernet8': False,
+            'Ethernet12': False,
         }
-        mock_sfp_obj_dict = MagicMock()
+        mock_observer.return_value.handle_port_update_event = MagicMock(return_value=False)
+        mock_sfp_obj_dict = {1: MagicMock(), 2: MagicMock(), 3: MagicMock(), 4: MagicMock()}
         stop_event = threading.Event()
         task = DomThermalInfoUpdateTask(DEFAULT_NAMESPACE, port_mapping, mock_sfp_obj_dict, stop_event, poll_interval)
-        task.xcvr_table_helper = XcvrTableHelper(DEFAULT_NAMESPACE)
-        task.task_stopping_event.is_set = MagicMock(side_effect=[False, False, False, False, False, False, True])
-        mock_detect_error.return_value = False
-        task.is_port_dom_monitoring_disabled = lambda p: dom_monitoring_disabled[p]
+        task.xcvr_table_helper = MagicMock()
+        task.task_stopping_event.wait = MagicMock(side_effect=[False, False, True])
+        mock_detect_error.side_effect = lambda lport, tbl: lport == 'Ethernet12'
+        task.is_port_dom_monitoring_disabled = MagicMock(side_effect=lambda p: dom_monitoring_disabled[p])
+        task.dom_db_utils.post_port_dom_temperature_values_to_db = MagicMock(return_value={'temperature': '30.0'})
         task.task_worker()
 
+        # The first update is not delayed, the next one is scheduled after poll_interval
+        assert task.task_stopping_event.wait.call_args_list[0][0][0] == 0
+        assert 0 < task.task_stopping_event.wait.call_args_list[1][0][0] <= poll_interval
+        # Only the temperature of Ethernet0 is read, in both updates
+        assert task.dom_db_utils.post_port_dom_temperature_values_to_db.call_count == 2
+        for call in task.dom_db_utils.post_port_dom_temperature_values_to_db.call_args_list:
+            assert call[0][:2] == ('Ethernet0', 1)
+        task.xcvr_table_helper.get_state_db_batch_tbl.assert_any_call(0, TRANSCEIVER_DOM_TEMPERATURE_TABLE)
+        # One flush per update, and one to remove the temperature vector on stop
+        assert task.xcvr_table_helper.get_state_db_pipeline.return_value.flush.call_count == 3
+        task.xcvr_table_helper.get_state_db_batch_tbl.return_value._del.assert_called_once_with(
+            TRANSCEIVER_DOM_TEMPERATURE_VECTOR_KEY)
+        assert not task.temperature_vector_ports
+        # DOM disable, error status and presence are only checked in the first update
+        assert task.is_port_dom_monitoring_disabled.call_count == 3
+        assert mock_detect_error.call_count == 2
+        assert task.port_thermal_capability == {
+            1: {'asic_index': 0, 'temperature_supported': True},
+            2: None,
+            3: None,
+            4: None,
+        }
+
     @patch('xcvrd.xcvrd.XcvrTableHelper', MagicMock())
-    @patch('xcvrd.xcvrd_utilities.common.del_port_sfp_dom_info_from_db')
+    @patch('xcvrd.xcvrd_utilities.common._wrapper_get_presence')
+    @patch('xcvrd.xcvrd_utilities.sfp_status_helper.detect_port_in_error_status', MagicMock(return_value=False))
+    def test_DomThermalInfoUpdateTask_port_thermal_capability(self, mock_get_presence):
+        port_mapping = PortMapping()
+        port_mapping.handle_port_change_event(PortChangeEvent('Ethernet0', 1, 0, PortChangeEvent.PORT_ADD))
+        mock_sfp_obj_dict = {1: MagicMock()}
+        stop_event = threading.Event()
+        task = DomThermalInfoUpdateTask(DEFAULT_NAMESPACE, port_mapping, mock_sfp_obj_dict, stop_event, 10)
+        task.xcvr_table_helper = MagicMock()
+        task.is_port_dom_monitoring_disabled = MagicMock(return_value=False)
+        task.dom_db_utils.post_port_dom_temperature_values_to_db = MagicMock(return_value={})
+
+        # Module is absent, the port is skipped without reading the presence again
+        mock_get_presence.return_value = False
+        task.update_port_dom_temperature()
+        task.update_port_dom_temperature()
+        assert mock_get_presence.call_count == 1
+        assert task.dom_db_utils.post_port_dom_temperature_values_to_db.call_count == 0
+
+        # Module insertion invalidates the cached capability
+        mock_get_presence.return_value = True
+        task.on_port_update_event(PortChangeEvent('Ethernet0', -1, 0, PortChangeEvent.PORT_SET, db_name='STATE_DB',
+                                                  table_name=TRANSCEIVER_STATUS_SW_TABLE))
+        assert 1 not in task.port_thermal_capability
+
+        # Temperature is not supported by the module, it is not read again
+        task.update_port_dom_temperature()
+        task.update_port_dom_temperature()
+        assert task.dom_db_utils.post_port_dom_temperature_values_to_db.call_count == 1
+        assert task.port_thermal_capability[1] == {'asic_index': 0, 'temperature_supported': False}
+        assert task.xcvr_table_helper.get_state_db_pipeline.return_value.flush.call_count == 0
+
+        # Exception while reading the temperature invalidates the cached capability
+        task.port_thermal_capability[1]['temperature_supported'] = True
+        task.dom_db_utils.post_port_dom_temperature_values_to_db = MagicMock(side_effect=KeyError)
+        task.update_port_dom_temperature()
+        assert 1 not in task.port_thermal_capability
+
+        # Port removal invalidates the cached capability
+        task.get_port_thermal_capability(1, 'Ethernet0')
+        task.on_port_config_change(PortChangeEvent('Ethernet0', 1, 0, PortChangeEvent.PORT_REMOVE))
+        assert not task.port_thermal_capability
+        assert not task.port_mapping.physical_to_logical
+
+    @patch('xcvrd.xcvrd.XcvrTableHelper', MagicMock())
+    def test_DomThermalInfoUpdateTask_temperature_vector(self):
+        port_mapping = PortMapping()
+        for port_name, index in (('Ethernet0', 1), ('Ethernet8', 2), ('Ethernet16', 3)):
+            port_mapping.handle_port_change_event(PortChangeEvent(port_name, index, 0, PortChangeEvent.PORT_ADD))
+        mock_sfp_obj_dict = {1: MagicMock(), 2: MagicMock(), 3: MagicMock()}
+        stop_event = threading.Event()
+        task = DomThermalInfoUpdateTask(DEFAULT_NAMESPACE, port_mapping, mock_sfp_obj_dict, stop_event, 10)
+        task.xcvr_table_helper = MagicMock()
+        temperature_tbl = MagicMock()
+        vector_tbl = Table("STATE_DB", TRANSCEIVER_DOM_TEMPERATURE_VECTOR_TABLE)
+        vector_tbl.hdel = MagicMock(wraps=vector_tbl.hdel)
+        task.xcvr_table_helper.get_state_db_batch_tbl = MagicMock(
+            side_effect=lambda asic_index, table_name: vector_tbl if table_name == TRANSCEIVER_DOM_TEMPERATURE_VECTOR_TABLE else temperature_tbl)
+        mock_flush = task.xcvr_table_helper.get_state_db_pipeline.return_value.flush
+        task.port_thermal_capability = {
+            1: {'asic_index': 0, 'temperature_supported': True},
+            2: {'asic_index': 0, 'temperature_supported': True},
+            3: None,
+        }
+        temperatures = {1: '40.5', 2: '55.0'}
+        task.dom_db_utils.post_port_dom_temperature_values_to_db = MagicMock(
+            side_effect=lambda lport, pport, tbl: {'temperature': temperatures[pport]})
+
+        # The temperatures of all the monitored modules are published in a single hash
+        task.update_port_dom_temperature()
+        vector = dict(vector_tbl.get(TRANSCEIVER_DOM_TEMPERATURE_VECTOR_KEY)[1])
+        assert vector['Ethernet0'] == '40.5'
+        assert vector['Ethernet8'] == '55.0'
+        assert 'Ethernet16' not in vector
+        assert 'last_update_time' in vector
+        assert mock_flush.call_count == 1
+
+        # Module removal drops the port from the hash
+        task.on_port_update_event(PortChangeEvent('Ethernet8', -1, 0, PortChangeEvent.PORT_SET))
+        task.port_thermal_capability[2] = None
+        task.update_port_dom_temperature()
+        vector_tbl.hdel.assert_called_once_with(TRANSCEIVER_DOM_TEMPERATURE_VECTOR_KEY, 'Ethernet8')
+        vector = dict(vector_tbl.get(TRANSCEIVER_DOM_TEMPERATURE_VECTOR_KEY)[1])
+        assert 'Ethernet8' not in vector
+        assert vector['Ethernet0'] == '40.5'
+        assert mock_flush.call_count == 2
+
+        # The hash is removed once no module is monitored
+        task.port_thermal_capability[1] = None
+        task.update_port_dom_temperature()
+        assert not vector_tbl.get(TRANSCEIVER_DOM_TEMPERATURE_VECTOR_KEY)[0]
+        assert mock_flush.call_count == 3
+        task.update_port_dom_temperature()
+        assert mock_flush.call_count == 3
+
+    @patch('xcvrd.xcvrd.XcvrTableHelper', MagicMock())
+    @patch('xcvrd.xcvrd_utilities.common.bulk_del_port_sfp_dom_info_from_db')
     def test_DomInfoUpdateTask_handle_port_change_event(self, mock_del_port_sfp_dom_info_from_db):
         port_mapping = PortMapping()
         mock_sfp_obj_dict = MagicMock()
@@ -6123,6 +6602,95 @@ class TestXcvrdScript(object):
         mock_sfp.get_sfp.side_effect = NotImplementedError
         assert vdm_utils.get_vdm_flags(1) == {}
 
+    def test_get_vdm_capability(self):
+        mock_sfp = MagicMock()
+        vdm_utils = VDMUtils({1 : mock_sfp}, helper_logger)
+
+        # VDM not supported is not cached
+        mock_sfp.is_transceiver_vdm_supported.return_value = False
+        assert vdm_utils.get_vdm_capability(1) == (False, False)
+        assert 1 not in vdm_utils.vdm_capability_cache
+        assert mock_sfp.is_vdm_statistic_supported.call_count == 0
+
+        # Supported capability is read once per module
+        mock_sfp.is_transceiver_vdm_supported.return_value = True
+        mock_sfp.is_vdm_statistic_supported.return_value = True
+        assert vdm_utils.get_vdm_capability(1) == (True, True)
+        assert vdm_utils.get_vdm_capability(1) == (True, True)
+        assert mock_sfp.is_transceiver_vdm_supported.call_count == 2
+        assert mock_sfp.is_vdm_statistic_supported.call_count == 1
+
+        # A new xcvr api, i.e. a replaced module, invalidates the cache
+        mock_sfp.get_xcvr_api.return_value = MagicMock()
+        mock_sfp.is_vdm_statistic_supported.return_value = False
+        assert vdm_utils.get_vdm_capability(1) == (True, False)
+        assert mock_sfp.is_vdm_statistic_supported.call_count == 2
+
+        # Nothing is cached without xcvr api
+        mock_sfp.get_xcvr_api.return_value = None
+        assert vdm_utils.get_vdm_capability(1) == (True, False)
+        assert 1 not in vdm_utils.vdm_capability_cache
+
+    @patch('xcvrd.dom.utilities.vdm.utils.time.monotonic', MagicMock(side_effect=[10.0, 10.25]))
+    def test_get_vdm_real_values(self):
+        mock_sfp = MagicMock()
+        mock_sfp.get_transceiver_vdm_real_value_basic.return_value = {'basic_key': 'basic_value'}
+        mock_sfp.get_transceiver_vdm_real_value_statistic.return_value = {'stat_key': 'stat_value'}
+        vdm_utils = VDMUtils({1 : mock_sfp}, helper_logger)
+        vdm_utils._freeze_vdm_stats_and_confirm = MagicMock(return_value=True)
+        vdm_utils._unfreeze_vdm_stats_and_confirm = MagicMock(return_value=True)
+        frozen_callback = MagicMock()
+
+        # Without freeze only the basic observables are read
+        assert vdm_utils.get_vdm_real_values(1, False, frozen_callback) == {'basic_key': 'basic_value'}
+        assert vdm_utils._freeze_vdm_stats_and_confirm.call_count == 0
+        assert frozen_callback.call_count == 0
+        assert 1 not in vdm_utils.vdm_freeze_window_msecs
+
+        # With freeze the statistic observables and the callback are handled in one freeze window
+        assert vdm_utils.get_vdm_real_values(1, True, frozen_callback) == {'basic_key': 'basic_value',
+                                                                           'stat_key': 'stat_value'}
+        assert vdm_utils._freeze_vdm_stats_and_confirm.call_count == 1
+        assert vdm_utils._unfreeze_vdm_stats_and_confirm.call_count == 1
+        assert frozen_callback.call_count == 1
+        assert vdm_utils.vdm_freeze_window_msecs[1] == 250
+
+    def test_get_vdm_real_values_statistic_error(self):
+        mock_sfp = MagicMock()
+        mock_sfp.get_transceiver_vdm_real_value_basic.return_value = {'basic_key': 'basic_value'}
+        mock_sfp.get_transceiver_vdm_real_value_statistic.side_effect = KeyError('stat_key')
+        mock_logger = MagicMock()
+        vdm_utils = VDMUtils({1 : mock_sfp}, mock_logger)
+        vdm_utils._freeze_vdm_stats_and_confirm = MagicMock(return_value=True)
+        vdm_utils._unfreeze_vdm_stats_and_confirm = MagicMock(return_value=True)
+        frozen_callback = MagicMock()
+
+        # The PM callback and the basic observables are not skipped on a statistic parse error
+        assert vdm_utils.get_vdm_real_values(1, True, frozen_callback) == {'basic_key': 'basic_value'}
+        assert frozen_callback.call_count == 1
+        assert vdm_utils._unfreeze_vdm_stats_and_confirm.call_count == 1
+        assert mock_logger.log_warning.call_count == 1
+
+        mock_sfp.get_transceiver_vdm_real_value_statistic.side_effect = TypeError
+        assert vdm_utils.get_vdm_real_values(1, True, frozen_callback) == {'basic_key': 'basic_value'}
+        assert frozen_callback.call_count == 2
+        assert mock_logger.log_warning.call_count == 2
+
+    def test_post_port_vdm_freeze_window_to_db(self):
+        port_mapping = PortMapping()
+        xcvr_table_helper = XcvrTableHelper(DEFAULT_NAMESPACE)
+        vdm_db_utils = VDMDBUtils({}, port_mapping, xcvr_table_helper, threading.Event(), helper_logger)
+        status_sw_tbl = Table("STATE_DB", TRANSCEIVER_STATUS_SW_TABLE)
+        vdm_db_utils.xcvr_table_helper.get_status_sw_tbl = MagicMock(return_value=status_sw_tbl)
+
+        port_mapping.get_asic_id_for_logical_port = MagicMock(return_value=None)
+        vdm_db_utils.post_port_vdm_freeze_window_to_db('Ethernet0', 12.5)
+        assert status_sw_tbl.get_size() == 0
+
+        port_mapping.get_asic_id_for_logical_port = MagicMock(return_value=0)
+        vdm_db_utils.post_port_vdm_freeze_window_to_db('Ethernet0', 12.5)
+        assert dict(status_sw_tbl.get('Ethernet0')[1])['vdm_freeze_window_msecs'] == '12.500'
+
     @patch('xcvrd.xcvrd_utilities.common.platform_chassis')
     @patch('xcvrd.xcvrd_utilities.common.platform_sfputil')
     def test_wrapper_get_transceiver_firmware_info(self, mock_sfputil, mock_chassis):
@@ -6365,8 +6933,9 @@ class TestXcvrdScript(object):
     @patch('sonic_py_common.device_info.get_paths_to_platform_and_hwsku_dirs', MagicMock(return_value=('/tmp', '/tmp')))
     @patch('swsscommon.swsscommon.WarmStart', MagicMock())
     @patch('xcvrd.xcvrd.DaemonXcvrd.wait_for_port_config_done', MagicMock())
-    @patch('xcvrd.xcvrd_utilities.common.del_port_sfp_dom_info_from_db')
-    def test_DaemonXcvrd_init_deinit_fastboot_enabled(self, mock_del_port_sfp_dom_info_from_db):
+    @patch('xcvrd.xcvrd.common.is_fast_reboot_enabled', MagicMock(return_value=True))
+    @patch('xcvrd.xcvrd_utilities.common.bulk_del_port_sfp_dom_info_from_db', MagicMock(return_value=0.0))
+    def test_DaemonXcvrd_init_deinit_fastboot_enabled(self):
         xcvrd = DaemonXcvrd(SYSLOG_IDENTIFIER)
         with patch("subprocess.check_output") as mock_run:
             mock_run.return_value = "true"
@@ -6397,11 +6966,16 @@ class TestXcvrdScript(object):
             xcvrd.xcvr_table_helper.get_status_flag_set_time_tbl = MagicMock()
             xcvrd.xcvr_table_helper.get_status_flag_clear_time_tbl = MagicMock()
             xcvrd.xcvr_table_helper.get_pm_tbl = MagicMock(return_value=MagicMock)
+            xcvrd.xcvr_table_helper.get_pm_interval_tbl = MagicMock(return_value=MagicMock)
             xcvrd.xcvr_table_helper.get_firmware_info_tbl = MagicMock(return_value=MagicMock)
 
             xcvrd.deinit()
 
-            assert (status_tbl, status_sw_tbl) not in mock_del_port_sfp_dom_info_from_db.call_args_list
+            mock_bulk_del = common.bulk_del_port_sfp_dom_info_from_db
+            assert mock_bulk_del.call_count == 1
+            tbl_to_del_list = mock_bulk_del.call_args[0][4]
+            assert status_tbl not in tbl_to_del_list
+            assert status_sw_tbl not in tbl_to_del_list
 
 
     @patch('xcvrd.xcvrd.DaemonXcvrd.load_platform_util', MagicMock())
@@ -6412,8 +6986,8 @@ class TestXcvrdScript(object):
     @patch('xcvrd.xcvrd.common.get_cpo_obj_dict', MagicMock(return_value={}))
     @patch('subprocess.check_output', MagicMock(return_value='false'))
     @patch('xcvrd.xcvrd.common.is_syncd_warm_restore_complete', MagicMock(return_value=False))
-    @patch('xcvrd.xcvrd_utilities.common.del_port_sfp_dom_info_from_db')
-    def test_DaemonXcvrd_init_deinit_cold(self, mock_del_port_sfp_dom_info_from_db):
+    @patch('xcvrd.xcvrd_utilities.common.bulk_del_port_sfp_dom_info_from_db', MagicMock(return_value=0.0))
+    def test_DaemonXcvrd_init_deinit_cold(self):
         xcvrd.platform_chassis = MagicMock()
 
         xcvrdaemon = DaemonXcvrd(SYSLOG_IDENTIFIER)
@@ -6446,11 +7020,19 @@ class TestXcvrdScript(object):
             xcvrdaemon.xcvr_table_helper.get_status_flag_set_time_tbl = MagicMock()
             xcvrdaemon.xcvr_table_helper.get_status_flag_clear_time_tbl = MagicMock()
             xcvrdaemon.xcvr_table_helper.get_pm_tbl = MagicMock(return_value=MagicMock)
+            xcvrdaemon.xcvr_table_helper.get_pm_interval_tbl = MagicMock(return_value=MagicMock)
             xcvrdaemon.xcvr_table_helper.get_firmware_info_tbl = MagicMock(return_value=MagicMock)
             xcvrdaemon.xcvr_table_helper.get_intf_tbl = MagicMock(return_value=MagicMock)
 
             xcvrdaemon.deinit()
-            assert mock_del_port_sfp_dom_info_from_db.call_any_with(status_tbl, status_sw_tbl)
+
+            # All the ports of an ASIC are deleted at once
+            mock_bulk_del = common.bulk_del_port_sfp_dom_info_from_db
+            assert mock_bulk_del.call_count == 1
+            logical_ports, _, _, _, tbl_to_del_list = mock_bulk_del.call_args[0]
+            assert logical_ports == self.MockPortMapping.logical_port_list
+            assert status_tbl in tbl_to_del_list
+            assert status_sw_tbl in tbl_to_del_list
 
     def test_DaemonXcvrd_signal_handler(self):
         xcvrd.platform_chassis = MagicMock()
@@ -6732,7 +7314,8 @@ class TestXcvrdScript(object):
         mock_sfp.remove_xcvr_api.assert_called_once()
 
     @patch('xcvrd.dom.dom_mgr.XcvrTableHelper', MagicMock())
-    def test_DomInfoUpdateTask_check_port_update(self):
+    @patch('xcvrd.dom.dom_mgr.time.monotonic')
+    def test_DomInfoUpdateTask_check_port_update(self, mock_monotonic):
         """Test the check_port_update method with various scenarios"""
         port_mapping = PortMapping()
         mock_sfp_obj_dict = MagicMock()
@@ -6740,6 +7323,7 @@ class TestXcvrdScript(object):
         mock_cmis_manager = MagicMock()
         task = DomInfoUpdateTask(DEFAULT_NAMESPACE, port_mapping, mock_sfp_obj_dict, stop_event, mock_cmis_manager)
         task.xcvr_table_helper = MagicMock()
+        mock_monotonic.return_value = 100
 
         # Create a mock port_change_observer
         mock_port_change_observer = MagicMock()
@@ -6749,65 +7333,86 @@ class TestXcvrdScript(object):
         task.update_port_db_diagnostics_on_link_change = MagicMock()
 
         # Test 1: No link change affected ports
-        task.link_change_affected_ports = {}
         task.check_port_update(mock_port_change_observer, 1000)
         mock_port_change_observer.handle_port_update_event.assert_called_once_with(1000)
         assert task.update_port_db_diagnostics_on_link_change.call_count == 0
 
-        # Test 2: Link change affected port with time in the past (should trigger update)
+        # Test 2: Link change affected port before its due time (should not trigger update)
         mock_port_change_observer.handle_port_update_event.reset_mock()
-        task.update_port_db_diagnostics_on_link_change.reset_mock()
-        past_time = datetime.datetime.now() - datetime.timedelta(seconds=5)
-        task.link_change_affected_ports = {0: past_time}
+        task.schedule_link_change_update(0)
+        assert task.link_change_affected_ports == {0: 100 + task.DIAG_DB_UPDATE_TIME_AFTER_LINK_CHANGE}
         task.check_port_update(mock_port_change_observer, 100)
         mock_port_change_observer.handle_port_update_event.assert_called_once_with(100)
-        task.update_port_db_diagnostics_on_link_change.assert_called_once_with(0)
-        assert 0 not in task.link_change_affected_ports
+        assert task.update_port_db_diagnostics_on_link_change.call_count == 0
+        assert 0 in task.link_change_affected_ports
 
-        # Test 3: Link change affected port with time in the future (should not trigger update)
-        mock_port_change_observer.handle_port_update_event.reset_mock()
-        task.update_port_db_diagnostics_on_link_change.reset_mock()
-        future_time = datetime.datetime.now() + datetime.timedelta(seconds=5)
-        task.link_change_affected_ports = {4: future_time}
+        # Test 3: Link change affected port after its due time (should trigger update)
+        mock_monotonic.return_value = 101
         task.check_port_update(mock_port_change_observer, 1000)
-        mock_port_change_observer.handle_port_update_event.assert_called_once_with(1000)
-        assert task.update_port_db_diagnostics_on_link_change.call_count == 0
-        assert 4 in task.link_change_affected_ports
+        task.update_port_db_diagnostics_on_link_change.assert_called_once_with(0)
+        assert 0 not in task.link_change_affected_ports
+        assert not task.link_change_schedule
 
         # Test 4: Multiple link change affected ports, some ready, some not
-        mock_port_change_observer.handle_port_update_event.reset_mock()
         task.update_port_db_diagnostics_on_link_change.reset_mock()
-        past_time1 = datetime.datetime.now() - datetime.timedelta(seconds=2)
-        past_time2 = datetime.datetime.now() - datetime.timedelta(seconds=1)
-        future_time = datetime.datetime.now() + datetime.timedelta(seconds=5)
-        task.link_change_affected_ports = {
-            0: past_time1,
-            8: past_time2,
-            12: future_time
-        }
+        task.schedule_link_change_update(8)
+        task.schedule_link_change_update(16)
+        mock_monotonic.return_value = 101.5
+        task.schedule_link_change_update(12)
+        # Link change of a port with a pending update is coalesced, the due time is kept
+        mock_monotonic.return_value = 101.8
+        task.schedule_link_change_update(8)
+        assert task.link_change_affected_ports[8] == 102
+        mock_monotonic.return_value = 102
         task.check_port_update(mock_port_change_observer, 1000)
-        mock_port_change_observer.handle_port_update_event.assert_called_once_with(1000)
-        assert task.update_port_db_diagnostics_on_link_change.call_count == 2
-        # Check that the two past ports were processed
         calls = [call[0][0] for call in task.update_port_db_diagnostics_on_link_change.call_args_list]
-        assert 0 in calls
-        assert 8 in calls
-        # Future port should still be in the dict
-        assert 12 in task.link_change_affected_ports
-        assert 0 not in task.link_change_affected_ports
-        assert 8 not in task.link_change_affected_ports
+        assert calls == [8, 16]
+        # Future port should still be pending
+        assert list(task.link_change_affected_ports) == [12]
 
         # Test 5: Stop event is set during processing
-        mock_port_change_observer.handle_port_update_event.reset_mock()
         task.update_port_db_diagnostics_on_link_change.reset_mock()
         task.task_stopping_event.set()
-        past_time = datetime.datetime.now() - datetime.timedelta(seconds=1)
-        task.link_change_affected_ports = {16: past_time}
+        mock_monotonic.return_value = 103
         task.check_port_update(mock_port_change_observer, 1000)
-        mock_port_change_observer.handle_port_update_event.assert_called_once_with(1000)
         # Should break early and not process the port
         assert task.update_port_db_diagnostics_on_link_change.call_count == 0
-        assert 16 in task.link_change_affected_ports
+        assert 12 in task.link_change_affected_ports
+
+    @patch('xcvrd.dom.dom_mgr.XcvrTableHelper', MagicMock())
+    @patch('xcvrd.dom.dom_mgr.time.monotonic')
+    def test_DomInfoUpdateTask_link_change_rate_limit(self, mock_monotonic):
+        port_mapping = PortMapping()
+        stop_event = threading.Event()
+        task = DomInfoUpdateTask(DEFAULT_NAMESPACE, port_mapping, MagicMock(), stop_event, MagicMock())
+        task.xcvr_table_helper = MagicMock()
+        task.update_port_db_diagnostics_on_link_change = MagicMock()
+        mock_port_change_observer = MagicMock()
+        link_change_event = PortChangeEvent('Ethernet0', 1, 0, PortChangeEvent.PORT_SET, db_name='APPL_DB')
+
+        # Flap storm on the port: a link change every 100ms for 60 seconds
+        now = 1000
+        for _ in range(600):
+            mock_monotonic.return_value = now
+            task.on_port_update_event(link_change_event)
+            task.check_port_update(mock_port_change_observer, 0)
+            now += 0.1
+
+        # The first flap is captured after DIAG_DB_UPDATE_TIME_AFTER_LINK_CHANGE, then the
+        # updates are bounded by the burst and the refill rate of the token bucket
+        update_count = task.update_port_db_diagnostics_on_link_change.call_count
+        max_update_count = task.LINK_CHANGE_DIAG_UPDATE_BURST + 60 // task.LINK_CHANGE_DIAG_UPDATE_REFILL_SECS
+        assert 1 < update_count <= max_update_count
+        task.update_port_db_diagnostics_on_link_change.assert_called_with(1)
+        assert len(task.link_change_schedule) <= 1
+
+        # Quiet port refills its bucket, the next flap is captured quickly again
+        now += 100
+        mock_monotonic.return_value = now
+        task.check_port_update(mock_port_change_observer, 0)
+        task.update_port_db_diagnostics_on_link_change.reset_mock()
+        task.on_port_update_event(link_change_event)
+        assert task.link_change_affected_ports[1] == now + task.DIAG_DB_UPDATE_TIME_AFTER_LINK_CHANGE
 
     @patch('xcvrd.dom.dom_mgr.XcvrTableHelper', MagicMock())
     @patch('xcvrd.xcvrd_utilities.common._wrapper_get_presence', MagicMock(return_value=True))
@@ -6857,7 +7462,7 @@ class TestXcvrdScript(object):
         task.dom_db_utils = MagicMock()
         task.status_db_utils = MagicMock()
         task.vdm_utils = MagicMock()
-        task.vdm_utils.is_transceiver_vdm_supported = MagicMock(return_value=False)
+        task.vdm_utils.get_vdm_capability = MagicMock(return_value=(False, False))
 
         # Strategy: Every call to now() advances time by 1 second.
         # When the DOM polling function is called, we advance time by 30 seconds to simulate long processing.
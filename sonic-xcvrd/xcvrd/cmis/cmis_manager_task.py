@@ -9,6 +9,7 @@ try:
     import threading
     import time
     import datetime
+    import weakref
     from swsscommon import swsscommon
     from sonic_py_common import syslogger, daemon_base
     from sonic_platform_base.sonic_xcvr.api.public.c_cmis import CmisApi
@@ -68,6 +69,15 @@ class CmisManagerTask(threading.Thread):
         self.xcvr_table_helper = XcvrTableHelper(self.namespaces)
         # Cache of gearbox line lanes dict, refreshed once per task_worker iteration.
         self._gearbox_lanes_dict = None
+        # Cache of the CONFIG_DB port configs of each ASIC grouped per physical port,
+        # rebuilt once per task_worker iteration. None when not cached.
+        self._port_configs_by_pport = None
+        # Memo of the application advertisement decode results of each module type,
+        # see get_cmis_app_memo
+        self.cmis_app_memo = {}
+        # Memo of the module type of each xcvr api, dropped along with the api once
+        # the module is removed or replaced
+        self.cmis_app_memo_by_api = weakref.WeakKeyDictionary()
         self.fast_reboot_status = self.initialize_fast_reboot_status()
 
     def initialize_fast_reboot_status(self):
@@ -191,6 +201,7 @@ class CmisManagerTask(threading.Thread):
             # remove the lport from port_dict.
             if lport in self.port_dict:
                 self.update_port_transceiver_status_table_sw_cmis_state(lport, CMIS_STATE_REMOVED)
+                self.clear_cmis_app_memo(self.port_dict[lport].get('api'))
 
             if port_change_event.db_name == 'CONFIG_DB' and port_change_event.table_name == 'PORT':
                 self.clear_decomm_pending(lport)
@@ -236,6 +247,82 @@ class CmisManagerTask(threading.Thread):
         self.log_debug("{}: Using port config lanes count: {}".format(lport, host_lane_count))
         return host_lane_count
 
+    def get_cmis_app_memo(self, api):
+        """
+        Get the memo of the application advertisement decode results of the module
+        type of api, i.e. of the modules with the same vendor, part number, revision
+        and active firmware. Modules whose type can't be read get their own memo.
+
+        Args:
+            api:
+                XcvrApi object
+
+        Returns:
+            dict, the memo of the module type, shared by the modules of the same type
+        """
+        memo = self.cmis_app_memo_by_api.get(api)
+        if memo is not None:
+            return memo
+
+        try:
+            module_type_key = (api.get_manufacturer(), api.get_model(),
+                               api.get_vendor_rev(), api.get_module_active_firmware())
+        except (AttributeError, NotImplementedError):
+            module_type_key = None
+
+        if module_type_key is None or any(value in (None, '', 'N/A') for value in module_type_key):
+            memo = {}
+        else:
+            memo = self.cmis_app_memo.setdefault(module_type_key, {})
+        self.cmis_app_memo_by_api[api] = memo
+        return memo
+
+    def clear_cmis_app_memo(self, api):
+        """
+        Drop the module type memo of api, e.g. once the module is removed
+        """
+        if api is not None:
+            self.cmis_app_memo_by_api.pop(api, None)
+
+    def get_cmis_application_desired(self, api, host_lane_count, speed):
+        """
+        Memoized common.get_cmis_application_desired, the application advertisement
+        being decoded once per module type, host lane count and speed
+        """
+        memo = self.get_cmis_app_memo(api)
+        key = ('appl', host_lane_count, speed)
+        if key not in memo:
+            appl = common.get_cmis_application_desired(api, host_lane_count, speed)
+            if appl is None:
+                # Not memoized, the advertisement may not be readable yet
+                return None
+            memo[key] = appl
+        return memo[key]
+
+    def get_cmis_host_lane_assignment_option(self, api, appl):
+        """
+        Memoized api.get_host_lane_assignment_option
+        """
+        memo = self.get_cmis_app_memo(api)
+        key = ('host_lane_assignment_option', appl)
+        if key not in memo:
+            memo[key] = api.get_host_lane_assignment_option(appl)
+        return memo[key]
+
+    def get_cmis_media_lane_info(self, api, appl):
+        """
+        Memoized media lane count and media lane assignment options of appl
+
+        Returns:
+            Tuple of integers, (media lane count, media lane assignment options)
+        """
+        memo = self.get_cmis_app_memo(api)
+        key = ('media_lane_info', appl)
+        if key not in memo:
+            memo[key] = (int(api.get_media_lane_count(appl)),
+                         int(api.get_media_lane_assignment_option(appl)))
+        return memo[key]
+
     def get_cmis_max_host_lanes_mask(self, api):
         """
         Get maximum host lanes mask based on module type
@@ -271,7 +358,7 @@ class CmisManagerTask(threading.Thread):
                             "subport {}!".format(appl, host_lane_count, subport))
             return host_lanes_mask
 
-        host_lane_assignment_option = api.get_host_lane_assignment_option(appl)
+        host_lane_assignment_option = self.get_cmis_host_lane_assignment_option(api, appl)
         host_lane_start_bit = (host_lane_count * (0 if subport == 0 else subport - 1))
         if host_lane_assignment_option & (1 << host_lane_start_bit):
             host_lanes_mask = ((1 << host_lane_count) - 1) << host_lane_start_bit
@@ -401,6 +488,8 @@ class CmisManagerTask(threading.Thread):
         """
         Fetch sibling logical port configurations sharing the same physical port
         as lport from the CONFIG_DB PORT table.
+        Within a task_worker iteration, the PORT table of each ASIC is read once
+        for all the physical ports.
 
         Args:
             lport:
@@ -411,13 +500,38 @@ class CmisManagerTask(threading.Thread):
             each with keys: 'lport' (str), 'subport' (int), 'speed' (int),
             'host_lane_count' (int).
         """
-        siblings = []
         pport = self.port_dict[lport].get('index')
+        asic_id = self.get_asic_id(lport)
+        if self._port_configs_by_pport is not None and asic_id in self._port_configs_by_pport:
+            port_configs_by_pport = self._port_configs_by_pport[asic_id]
+        else:
+            port_configs_by_pport = self.read_port_configs_by_pport(lport)
+            if port_configs_by_pport is None:
+                return []
+            if self._port_configs_by_pport is not None:
+                self._port_configs_by_pport[asic_id] = port_configs_by_pport
+
+        return list(port_configs_by_pport.get(pport, []))
+
+    def read_port_configs_by_pport(self, lport):
+        """
+        Read the port configurations of the CONFIG_DB PORT table of the ASIC of
+        lport, grouped per physical port.
+
+        Args:
+            lport:
+                String, logical port name triggering this read
+
+        Returns:
+            dict of physical port index to the list of port configurations as
+            returned by get_sibling_port_configs, None if the table is not available.
+        """
         cfg_port_tbl = self.xcvr_table_helper.get_cfg_port_tbl(self.get_asic_id(lport))
         if cfg_port_tbl is None:
             self.log_error("{}: cfg_port_tbl is None while fetching sibling port configs".format(lport))
-            return siblings
+            return None
 
+        port_configs_by_pport = {}
         for sibling_lport in cfg_port_tbl.getKeys():
             # Single read per key: use full hash and derive index from fields.
             found, port_info = cfg_port_tbl.get(sibling_lport)
@@ -430,8 +544,7 @@ class CmisManagerTask(threading.Thread):
                 continue
 
             try:
-                if int(sibling_pport) != pport:
-                    continue
+                sibling_pport = int(sibling_pport)
             except (TypeError, ValueError):
                 self.log_error("{}: invalid index value for sibling port {}: {}".format(
                     lport, sibling_lport, sibling_pport))
@@ -455,14 +568,14 @@ class CmisManagerTask(threading.Thread):
 
             sibling_host_lane_count = self.get_host_lane_count(sibling_lport, sibling_lanes)
 
-            siblings.append({
+            port_configs_by_pport.setdefault(sibling_pport, []).append({
                 'lport': sibling_lport,
                 'subport': sibling_subport,
                 'speed': sibling_speed,
                 'host_lane_count': sibling_host_lane_count,
             })
 
-        return siblings
+        return port_configs_by_pport
 
     def get_desired_app_map(self, api, lport):
         """
@@ -482,7 +595,7 @@ class CmisManagerTask(threading.Thread):
         """
         desired_map = [0] * self.CMIS_MAX_HOST_LANES
         for sibling in self.get_sibling_port_configs(lport):
-            sibling_appl = common.get_cmis_application_desired(
+            sibling_appl = self.get_cmis_application_desired(
                 api, sibling['host_lane_count'], sibling['speed'])
             if sibling_appl is None:
                 continue
@@ -879,7 +992,7 @@ class CmisManagerTask(threading.Thread):
         appl = port_info.get('appl', 0)
         is_fast_reboot = self.is_fast_reboot_enabled_for_lport(lport)
 
-        self.port_dict[lport]['appl'] = common.get_cmis_application_desired(api, host_lane_count, speed)
+        self.port_dict[lport]['appl'] = self.get_cmis_application_desired(api, host_lane_count, speed)
         if self.port_dict[lport]['appl'] is None:
             self.log_error("{}: no suitable app for the port appl {} host_lane_count {} "
                             "host_speed {}".format(lport, appl, host_lane_count, speed))
@@ -899,8 +1012,8 @@ class CmisManagerTask(threading.Thread):
         host_lanes_mask = self.port_dict[lport]['host_lanes_mask']
         self.log_notice("{}: Setting host_lanemask=0x{:x}".format(lport, host_lanes_mask))
 
-        self.port_dict[lport]['media_lane_count'] = int(api.get_media_lane_count(appl))
-        self.port_dict[lport]['media_lane_assignment_options'] = int(api.get_media_lane_assignment_option(appl))
+        self.port_dict[lport]['media_lane_count'], self.port_dict[lport]['media_lane_assignment_options'] = \
+            self.get_cmis_media_lane_info(api, appl)
         media_lane_count = self.port_dict[lport]['media_lane_count']
         media_lane_assignment_options = self.port_dict[lport]['media_lane_assignment_options']
         self.port_dict[lport]['max_media_lanes_mask'] = self.port_dict[lport]['max_host_lanes_mask']
@@ -1355,6 +1468,8 @@ class CmisManagerTask(threading.Thread):
 
             # Cache gearbox line lanes dictionary once per iteration over all ports
             self._gearbox_lanes_dict = self.xcvr_table_helper.get_gearbox_line_lanes_dict()
+            # Read the CONFIG_DB port configs at most once per iteration over all ports
+            self._port_configs_by_pport = {}
 
             for lport, info in self.port_dict.items():
                 if self.task_stopping_event.is_set():
@@ -1,7 +1,10 @@
 #!/usr/bin/env python3
 
 try:
+    import threading
+
     from ..xcvrd import SfpStateUpdateTask
+    from ..xcvrd_utilities import common
 except ImportError as e:
     raise ImportError(str(e) + " - required module not found")
 
@@ -10,3 +13,17 @@ class CpoStateUpdateTask(SfpStateUpdateTask):
     def __init__(self, namespaces, port_mapping, port_obj_dict, main_thread_stop_event, sfp_error_event):
         super().__init__(namespaces, port_mapping, port_obj_dict, main_thread_stop_event, sfp_error_event)
         self.name = "CpoStateUpdateTask"
+
+    def _init_port_sfp_status_sw_tbl(self, port_mapping, xcvr_table_helper, stop_event=threading.Event()):
+        # The presence of a CPO port is the one of its optical engine and ELSFP, so read it
+        # once per group of physical ports driven by the same devices, in parallel across the groups
+        physical_ports = [physical_port for physical_port in port_mapping.physical_to_logical
+                          if physical_port in self.port_obj_dict]
+        presence_groups = common.group_pports_by_cpo_devices(physical_ports,
+                                                             (common.get_oe_sibling_pports,
+                                                              common.get_elsfp_sibling_pports))
+        self.presence_cache = common.read_once_per_cpo_device(presence_groups, common._wrapper_get_presence, stop_event)
+        try:
+            super()._init_port_sfp_status_sw_tbl(port_mapping, xcvr_table_helper, stop_event)
+        finally:
+            self.presence_cache = None
@@ -2,9 +2,57 @@
 
 try:
     from ..dom.dom_mgr import DomInfoUpdateTask
+    from ..xcvrd_utilities import common
+    from ..xcvrd_utilities import sfp_status_helper
 except ImportError as e:
     raise ImportError(str(e) + " - required module not found")
 
 
 class CpoDomInfoUpdateTask(DomInfoUpdateTask):
     name = "CpoDomInfoUpdateTask"
+
+    def is_port_polled(self, physical_port, logical_ports):
+        """
+        Checks whether the DOM pass polls a physical port, skipping the same ports as
+        the DOM monitoring loop so that no device is read on their behalf
+        """
+        if physical_port not in self.port_obj_dict or not logical_ports:
+            return False
+
+        logical_port_name = logical_ports[0]
+        if self.is_port_dom_monitoring_disabled(logical_port_name):
+            return False
+
+        asic_index = self.port_mapping.get_asic_id_for_logical_port(logical_port_name)
+        if asic_index is None:
+            return False
+
+        return not sfp_status_helper.detect_port_in_error_status(logical_port_name,
+                                                                 self.xcvr_table_helper.get_status_sw_tbl(asic_index))
+
+    def prefetch_dom_pass(self):
+        """
+        Reads the presence and the firmware info once per group of physical ports
+        driven by the same CPO devices, in parallel across the groups, and fans them
+        out to all the physical ports of each group.
+        The presence depends on both the optical engine and the ELSFP of a port,
+        while the firmware info is the one of the optical engine.
+        """
+        physical_ports = [physical_port
+                          for physical_port, logical_ports in self.port_mapping.physical_to_logical.items()
+                          if self.is_port_polled(physical_port, logical_ports)]
+
+        presence_groups = common.group_pports_by_cpo_devices(physical_ports,
+                                                             (common.get_oe_sibling_pports,
+                                                              common.get_elsfp_sibling_pports))
+        self.presence_cache = common.read_once_per_cpo_device(presence_groups,
+                                                              common._wrapper_get_presence,
+                                                              self.task_stopping_event)
+
+        present_ports = [physical_port for physical_port in physical_ports
+                         if self.presence_cache.get(physical_port)]
+        firmware_info_groups = common.group_pports_by_cpo_devices(present_ports,
+                                                                  (common.get_oe_sibling_pports,))
+        self.firmware_info_cache = common.read_once_per_cpo_device(firmware_info_groups,
+                                                                   common._wrapper_get_transceiver_firmware_info,
+                                                                   self.task_stopping_event)
@@ -11,6 +11,7 @@ import datetime
 try:
     import threading
     import copy
+    import heapq
     import sys
     import re
     import time
@@ -27,6 +28,7 @@ try:
     from xcvrd.dom.utilities.dom_sensor.db_utils import DOMDBUtils
     from xcvrd.dom.utilities.vdm.utils import VDMUtils
     from xcvrd.dom.utilities.vdm.db_utils import VDMDBUtils
+    from xcvrd.dom.utilities.pm.db_utils import PMDBUtils
     from xcvrd.dom.utilities.status.db_utils import StatusDBUtils
     from xcvrd.xcvrd_utilities.utils import XCVRDUtils
 except ImportError as e:
@@ -143,6 +145,11 @@ class DomInfoUpdateTask(DomInfoUpdateBase):
 
     DEFAULT_DOM_INFO_UPDATE_PERIOD_SECS = 60
     DIAG_DB_UPDATE_TIME_AFTER_LINK_CHANGE = 1
+    # Diagnostic updates after link changes are rate limited per physical port by a
+    # token bucket: up to LINK_CHANGE_DIAG_UPDATE_BURST updates back to back, then
+    # one update every LINK_CHANGE_DIAG_UPDATE_REFILL_SECS while the port keeps flapping
+    LINK_CHANGE_DIAG_UPDATE_BURST = 2
+    LINK_CHANGE_DIAG_UPDATE_REFILL_SECS = 10
     DOM_PORT_CHG_OBSERVER_TBL_MAP = [
         {'APPL_DB': 'PORT_TABLE', 'FILTER': ['flap_count']},
     ]
@@ -150,13 +157,23 @@ class DomInfoUpdateTask(DomInfoUpdateBase):
     def __init__(self, namespaces, port_mapping, port_obj_dict, main_thread_stop_event, skip_cmis_mgr, dom_update_interval=None):
         super().__init__(namespaces, port_mapping, port_obj_dict, main_thread_stop_event)
         self.skip_cmis_mgr = skip_cmis_mgr
+        # Due time of the pending diagnostic update of each physical port affected by a link change
         self.link_change_affected_ports = {}
+        # Min-heap of (due time, physical port) of the pending diagnostic updates
+        self.link_change_schedule = []
+        # Token bucket of each physical port: (tokens, last refill time)
+        self.link_change_tokens = {}
+        # Presence and firmware info of the physical ports prefetched by prefetch_dom_pass,
+        # only valid during a periodic DOM pass. None when not prefetched.
+        self.presence_cache = None
+        self.firmware_info_cache = None
         self.xcvr_table_helper = XcvrTableHelper(self.namespaces)
         self.xcvrd_utils = XCVRDUtils(self.port_obj_dict, self.helper_logger)
         self.dom_db_utils = DOMDBUtils(self.port_obj_dict, self.port_mapping, self.xcvr_table_helper, self.task_stopping_event, self.helper_logger)
         self.db_utils = self.dom_db_utils
         self.vdm_utils = VDMUtils(self.port_obj_dict, self.helper_logger)
         self.vdm_db_utils = VDMDBUtils(self.port_obj_dict, self.port_mapping, self.xcvr_table_helper, self.task_stopping_event, self.helper_logger)
+        self.pm_db_utils = PMDBUtils(self.port_obj_dict, self.port_mapping, self.xcvr_table_helper, self.task_stopping_event, self.helper_logger)
         self.status_db_utils = StatusDBUtils(self.port_obj_dict, self.port_mapping, self.xcvr_table_helper, self.task_stopping_event, self.helper_logger)
         self.dom_update_interval = self.DEFAULT_DOM_INFO_UPDATE_PERIOD_SECS
         if dom_update_interval is not None:
@@ -199,6 +216,22 @@ class DomInfoUpdateTask(DomInfoUpdateBase):
         return self.get_dom_polling_from_config_db(logical_port_name) == 'disabled' or \
                 self.is_port_in_cmis_initialization_process(logical_port_name)
 
+    def get_port_presence(self, physical_port):
+        """
+        Returns the presence of a physical port, from presence_cache if prefetched
+        """
+        if self.presence_cache is not None and physical_port in self.presence_cache:
+            return self.presence_cache[physical_port]
+        return common._wrapper_get_presence(physical_port)
+
+    def prefetch_dom_pass(self):
+        """
+        Called at the start of each periodic DOM pass. Subclasses can read the values
+        shared by several physical ports once here, and serve them to the rest of
+        the pass through presence_cache and firmware_info_cache.
+        """
+        pass
+
     # Update port sfp firmware info in db
     def post_port_sfp_firmware_info_to_db(self, logical_port_name, port_mapping, table,
                                 stop_event=threading.Event(), firmware_info_cache=None):
@@ -206,7 +239,7 @@ class DomInfoUpdateTask(DomInfoUpdateBase):
             if stop_event.is_set():
                 break
 
-            if not common._wrapper_get_presence(physical_port):
+            if not self.get_port_presence(physical_port):
                 continue
 
             try:
@@ -219,14 +252,14 @@ class DomInfoUpdateTask(DomInfoUpdateBase):
                         # If cache is enabled, put firmware information to cache
                         firmware_info_cache[physical_port] = transceiver_firmware_info_dict
                 if transceiver_firmware_info_dict:
-                    fvs = swsscommon.FieldValuePairs([(k, v) for k, v in transceiver_firmware_info_dict.items()])
                     # For firmware info, we update all logical ports associated with this physical port
                     logical_port_list = self.port_mapping.get_physical_to_logical(physical_port)
                     if logical_port_list is None:
                         self.log_warning("Got unknown physical port index {} while updating firmware info".format(physical_port))
                         continue
-                    for logical_port in logical_port_list:
-                        table.set(logical_port, fvs)
+                    asic_index = self.port_mapping.get_asic_id_for_logical_port(logical_port_name)
+                    self.xcvr_table_helper.publish_rows(asic_index, table, logical_port_list,
+                                                        list(transceiver_firmware_info_dict.items()))
                 else:
                     return xcvrd.SFP_EEPROM_NOT_READY
 
@@ -240,7 +273,7 @@ class DomInfoUpdateTask(DomInfoUpdateBase):
             if stop_event.is_set():
                 break
 
-            if not common._wrapper_get_presence(physical_port):
+            if not self.get_port_presence(physical_port):
                 continue
 
             if common._wrapper_is_flat_memory(physical_port) == True:
@@ -258,28 +291,77 @@ class DomInfoUpdateTask(DomInfoUpdateBase):
                 # Skip if empty (i.e. get_transceiver_pm API is not applicable for this xcvr)
                 if not pm_info_dict:
                     continue
+                if pm_info_cache is None:
+                    # Aggregate the fresh PM snapshot into the 15-minute and 24-hour bins
+                    asic_index = port_mapping.get_asic_id_for_logical_port(logical_port_name)
+                    if asic_index is not None:
+                        self.pm_db_utils.post_port_pm_interval_info_to_db(physical_port_name, asic_index,
+                                                                          physical_port, pm_info_dict)
                 self.db_utils.beautify_info_dict(pm_info_dict)
                 fvs = swsscommon.FieldValuePairs([(k, v) for k, v in pm_info_dict.items()])
                 table.set(physical_port_name, fvs)
             else:
                 return xcvrd.SFP_EEPROM_NOT_READY
 
+    def refill_link_change_tokens(self, physical_port, now):
+        """
+        Refills the token bucket of a physical port up to the given time
+
+        Returns:
+            The number of tokens of the port, fractional while refilling
+        """
+        tokens, last_refill_time = self.link_change_tokens.get(physical_port,
+                                                               (self.LINK_CHANGE_DIAG_UPDATE_BURST, now))
+        tokens = min(self.LINK_CHANGE_DIAG_UPDATE_BURST,
+                     tokens + (now - last_refill_time) / self.LINK_CHANGE_DIAG_UPDATE_REFILL_SECS)
+        self.link_change_tokens[physical_port] = (tokens, now)
+        return tokens
+
+    def schedule_link_change_update(self, physical_port):
+        """
+        Schedules the diagnostic update of a physical port after a link change.
+        Link changes of a port with a pending update, including the ones of the other
+        subports of a breakout group, are coalesced into the pending update. Its due
+        time is kept so that the first flap is captured quickly and a flap storm
+        can't postpone the update. Once the token bucket of the port is empty the
+        update is delayed until a token is available.
+        """
+        if physical_port in self.link_change_affected_ports:
+            return
+
+        now = time.monotonic()
+        due_time = now + self.DIAG_DB_UPDATE_TIME_AFTER_LINK_CHANGE
+        tokens = self.refill_link_change_tokens(physical_port, now)
+        if tokens < 1:
+            due_time = max(due_time, now + (1 - tokens) * self.LINK_CHANGE_DIAG_UPDATE_REFILL_SECS)
+
+        self.link_change_affected_ports[physical_port] = due_time
+        heapq.heappush(self.link_change_schedule, (due_time, physical_port))
+
     def check_port_update(self, port_change_observer, timeout):
         # Process pending link change events and update diagnostic
         # information in the database. Ensures timely handling of link
         # change events and avoids duplicate updates in case of breakout ports.
         port_change_observer.handle_port_update_event(timeout)
 
-        # Process each port in the pending link change set based on the
-        # corresponding time to update the DB after the link change.
-        for link_changed_port in list(self.link_change_affected_ports.keys()):
+        # Process the ports whose diagnostic update is due, earliest first
+        now = time.monotonic()
+        while self.link_change_schedule and self.link_change_schedule[0][0] <= now:
             if self.task_stopping_event.is_set():
                 self.log_notice("Stop event generated during DOM link change event processing")
                 break
-            if self.link_change_affected_ports[link_changed_port] <= datetime.datetime.now():
-                self.log_notice(f"Updating port db diagnostics post link change for port {link_changed_port}")
-                self.update_port_db_diagnostics_on_link_change(link_changed_port)
-                del self.link_change_affected_ports[link_changed_port]
+
+            due_time, link_changed_port = heapq.heappop(self.link_change_schedule)
+            if self.link_change_affected_ports.get(link_changed_port) != due_time:
+                # The update was cancelled or rescheduled
+                continue
+            del self.link_change_affected_ports[link_changed_port]
+
+            tokens = self.refill_link_change_tokens(link_changed_port, now)
+            self.link_change_tokens[link_changed_port] = (max(0, tokens - 1), now)
+
+            self.log_notice(f"Updating port db diagnostics post link change for port {link_changed_port}")
+            self.update_port_db_diagnostics_on_link_change(link_changed_port)
 
     def task_worker(self):
         self.log_notice("Start DOM monitoring loop")
@@ -322,6 +404,7 @@ class DomInfoUpdateTask(DomInfoUpdateBase):
                 break
 
             dom_loop_start_time = datetime.datetime.now()
+            self.prefetch_dom_pass()
             for physical_port, logical_ports in self.port_mapping.physical_to_logical.items():
                 self.check_port_update(port_change_observer, PORT_UPDATE_EVENT_SELECT_TIMEOUT_FAST_MSECS)
 
@@ -346,11 +429,12 @@ class DomInfoUpdateTask(DomInfoUpdateBase):
                     continue
 
                 if not sfp_status_helper.detect_port_in_error_status(logical_port_name, self.xcvr_table_helper.get_status_sw_tbl(asic_index)):
-                    if not common._wrapper_get_presence(physical_port):
+                    if not self.get_port_presence(physical_port):
                         continue
 
                     try:
-                        self.post_port_sfp_firmware_info_to_db(logical_port_name, self.port_mapping, self.xcvr_table_helper.get_firmware_info_tbl(asic_index), self.task_stopping_event)
+                        self.post_port_sfp_firmware_info_to_db(logical_port_name, self.port_mapping, self.xcvr_table_helper.get_firmware_info_tbl(asic_index), self.task_stopping_event,
+                                                               firmware_info_cache=self.firmware_info_cache)
                     except (KeyError, TypeError) as e:
                         #continue to process next port since execption could be raised due to port reset, transceiver removal
                         self.log_warning("Got exception {} while processing firmware info for port {}, ignored".format(repr(e), logical_port_name))
@@ -381,36 +465,32 @@ class DomInfoUpdateTask(DomInfoUpdateBase):
                         self.log_warning("Got exception {} while processing transceiver status hw flags for "
                                          "port {}, ignored".format(repr(e), logical_port_name))
                         continue
-                    if self.vdm_utils.is_transceiver_vdm_supported(physical_port):
+                    vdm_supported, vdm_statistic_supported = self.vdm_utils.get_vdm_capability(physical_port)
+                    if vdm_supported:
                         # Step (a): If statistic observables are supported and not in LPMODE,
                         #           freeze VDM, capture statistic observables and PM info,
                         #           then unfreeze VDM.
-                        vdm_statistic_values = {}
-                        need_freeze = self.vdm_utils.is_vdm_statistic_supported(physical_port) and \
-                                       not self.xcvrd_utils.is_transceiver_lpmode_on(physical_port)
-                        if need_freeze:
-                            with self.vdm_utils.vdm_freeze_context(physical_port) as vdm_frozen:
-                                if not vdm_frozen:
-                                    self.log_error("Failed to freeze VDM stats for port {}".format(physical_port))
-                                else:
-                                    try:
-                                        vdm_statistic_values = self.vdm_utils.get_vdm_real_values_statistic(physical_port) or {}
-                                    except (KeyError, TypeError) as e:
-                                        self.log_warning("Got exception {} while processing vdm statistic values for port {}, ignored".format(repr(e), logical_port_name))
-                                    try:
-                                        self.post_port_pm_info_to_db(logical_port_name, self.port_mapping, self.xcvr_table_helper.get_pm_tbl(asic_index), self.task_stopping_event)
-                                    except (KeyError, TypeError) as e:
-                                        self.log_warning("Got exception {} while posting pm info to DB for port {}, ignored".format(repr(e), logical_port_name))
-
                         # Step (b): Capture basic observables, merge with statistic
                         #           observables, and post to DB
+                        need_freeze = vdm_statistic_supported and \
+                                      not self.xcvrd_utils.is_transceiver_lpmode_on(physical_port)
+
+                        def post_pm_info_while_frozen():
+                            try:
+                                self.post_port_pm_info_to_db(logical_port_name, self.port_mapping, self.xcvr_table_helper.get_pm_tbl(asic_index), self.task_stopping_event)
+                            except (KeyError, TypeError) as e:
+                                self.log_warning("Got exception {} while posting pm info to DB for port {}, ignored".format(repr(e), logical_port_name))
+
                         try:
-                            vdm_basic_values = self.vdm_utils.get_vdm_real_values_basic(physical_port) or {}
-                            vdm_merged_values = {**vdm_basic_values, **vdm_statistic_values}
+                            vdm_merged_values = self.vdm_utils.get_vdm_real_values(physical_port, need_freeze, post_pm_info_while_frozen)
                             self.vdm_db_utils.post_port_vdm_real_values_from_dict_to_db(logical_port_name, vdm_merged_values)
                         except (KeyError, TypeError) as e:
                             self.log_warning("Got exception {} while posting vdm values to DB for port {}, ignored".format(repr(e), logical_port_name))
 
+                        if need_freeze and physical_port in self.vdm_utils.vdm_freeze_window_msecs:
+                            self.vdm_db_utils.post_port_vdm_freeze_window_to_db(logical_port_name,
+                                                                                self.vdm_utils.vdm_freeze_window_msecs[physical_port])
+
                         # Step (c): Update VDM flags to DB.
                         #           Flags are COR (Clear On Read), so read them last
                         #           to capture the most recent state.
@@ -419,6 +499,10 @@ class DomInfoUpdateTask(DomInfoUpdateBase):
                         except (KeyError, TypeError) as e:
                             self.log_warning("Got exception {} while processing vdm flags for port {}, ignored".format(repr(e), logical_port_name))
 
+            # Drop the prefetched values so that they are not served outside of the pass
+            self.presence_cache = None
+            self.firmware_info_cache = None
+
             # Schedule next poll from loop start time for consistent intervals
             next_periodic_db_update_time = dom_loop_start_time + datetime.timedelta(seconds=dom_info_update_periodic_secs)
 
@@ -432,15 +516,12 @@ class DomInfoUpdateTask(DomInfoUpdateBase):
         """
         if port_change_event.event_type == port_event_helper.PortChangeEvent.PORT_SET and \
             port_change_event.db_name == 'APPL_DB':
-            # Add the port to the affected ports dictionary with the time
-            # to update the DB after the link change.
+            # Schedule the DB update after the link change with a delay.
             # This allows the module to update the real-time flag status
             # before the DB is updated.
             # Also, consolidate link change events for all affected subports of the breakout group
-            # into a single event for processing.
-            self.link_change_affected_ports[port_change_event.port_index] = (
-                            datetime.datetime.now() +
-                            datetime.timedelta(seconds=self.DIAG_DB_UPDATE_TIME_AFTER_LINK_CHANGE))
+            # into a single update of the physical port.
+            self.schedule_link_change_update(port_change_event.port_index)
 
     def update_port_db_diagnostics_on_link_change(self, physical_port):
         if self.task_stopping_event.is_set():
@@ -489,7 +570,8 @@ class DomInfoUpdateTask(DomInfoUpdateBase):
             return
 
         # Update TRANSCEIVER_VDM_XXX_FLAG and metadata tables
-        if self.vdm_utils.is_transceiver_vdm_supported(physical_port):
+        vdm_supported, _ = self.vdm_utils.get_vdm_capability(physical_port)
+        if vdm_supported:
             try:
                 # Read and post VDM flags and metadata to DB
                 self.vdm_db_utils.post_port_vdm_flags_to_db(first_logical_port)
@@ -507,8 +589,11 @@ class DomInfoUpdateTask(DomInfoUpdateBase):
         # To avoid race condition, remove the entry TRANSCEIVER_FIRMWARE_INFO, TRANSCEIVER_DOM_SENSOR, TRANSCEIVER_PM and HW section of TRANSCEIVER_STATUS table.
         # This thread only updates TRANSCEIVER_FIRMWARE_INFO, TRANSCEIVER_DOM_SENSOR, TRANSCEIVER_PM and HW section of TRANSCEIVER_STATUS table,
         # so we don't have to remove entries from TRANSCEIVER_INFO, TRANSCEIVER_DOM_THRESHOLD and VDM threshold value tables.
-        common.del_port_sfp_dom_info_from_db(port_change_event.port_name,
+        # All the tables are cleaned up with a single pipeline flush
+        common.bulk_del_port_sfp_dom_info_from_db([port_change_event.port_name],
                                       self.port_mapping,
+                                      self.xcvr_table_helper,
+                                      port_change_event.asic_id,
                                       [self.xcvr_table_helper.get_dom_tbl(port_change_event.asic_id),
                                       self.xcvr_table_helper.get_dom_temperature_tbl(port_change_event.asic_id),
                                       self.xcvr_table_helper.get_dom_flag_tbl(port_change_event.asic_id),
@@ -526,65 +611,190 @@ class DomInfoUpdateTask(DomInfoUpdateBase):
                                       self.xcvr_table_helper.get_status_flag_set_time_tbl(port_change_event.asic_id),
                                       self.xcvr_table_helper.get_status_flag_clear_time_tbl(port_change_event.asic_id),
                                       self.xcvr_table_helper.get_pm_tbl(port_change_event.asic_id),
+                                      *[self.xcvr_table_helper.get_pm_interval_tbl(port_change_event.asic_id, key) for key in PM_INTERVAL_TYPES],
                                       self.xcvr_table_helper.get_firmware_info_tbl(port_change_event.asic_id)
                                       ])
+        for physical_port_name in common.get_physical_port_name_dict(port_change_event.port_name, self.port_mapping).values():
+            self.pm_db_utils.remove_port(physical_port_name)
 
 
 class DomThermalInfoUpdateTask(DomInfoUpdateBase):
     name = 'DomThermalInfoUpdateTask'
 
+    # dom_polling updates in CONFIG_DB, and module insertion/removal and error
+    # updates in STATE_DB invalidate the cached thermal capability of a port
+    DOM_THERMAL_PORT_CHG_OBSERVER_TBL_MAP = [
+        {'CONFIG_DB': swsscommon.CFG_PORT_TABLE_NAME, 'FILTER': ['dom_polling']},
+        {'STATE_DB': TRANSCEIVER_STATUS_SW_TABLE, 'FILTER': ['status', 'error']},
+    ]
+
     def __init__(self, namespaces, port_mapping, port_obj_dict, main_thread_stop_event, poll_interval):
         super().__init__(namespaces, port_mapping, port_obj_dict, main_thread_stop_event)
         self.poll_interval = poll_interval
         self.xcvr_table_helper = XcvrTableHelper(self.namespaces)
         self.dom_db_utils = DOMDBUtils(self.port_obj_dict, self.port_mapping, self.xcvr_table_helper, self.task_stopping_event, self.helper_logger)
+        # Cached thermal capability of each physical port:
+        #   {physical_port: {'asic_index': asic_index, 'temperature_supported': bool}}
+        # A None value means the temperature of the port is not polled until
+        # a port change event invalidates the entry
+        self.port_thermal_capability = {}
+        # Logical ports in the temperature vector last published for each ASIC
+        self.temperature_vector_ports = {}
 
-    def task_worker(self):
-        self.log_notice("Start DOM thermal monitoring loop")
+    def on_port_config_change(self, port_change_event):
+        self.port_thermal_capability.pop(port_change_event.port_index, None)
+        super().on_port_config_change(port_change_event)
 
-        # Set the periodic db update time
-        dom_info_update_periodic_secs = self.poll_interval
+    def on_port_update_event(self, port_change_event):
+        """Called when dom_polling, module presence or module error of a port is changed
 
-        # Poll transceiver temperature as soon as possible
-        next_periodic_db_update_time = datetime.datetime.now()
+        Args:
+            port_change_event (object): port change event
+        """
+        physical_port_list = self.port_mapping.get_logical_to_physical(port_change_event.port_name)
+        for physical_port in physical_port_list or []:
+            self.port_thermal_capability.pop(physical_port, None)
 
-        # Start loop to update dom info in DB periodically and handle port change events
-        while not self.task_stopping_event.is_set():
-            # Check if periodic db update is needed
-            now = datetime.datetime.now()
-            if next_periodic_db_update_time > now:
-               # Sleep for 1 second or less depending on the remaining time
-               time.sleep(max(0, min(1, (next_periodic_db_update_time - now).total_seconds())))
-               continue
+    def handle_port_change_events(self, sel, asic_context, port_change_observer):
+        """
+        Reads all the pending port change events without blocking
+        """
+        while port_event_helper.handle_port_config_change(sel, asic_context, self.task_stopping_event,
+                                                          self.port_mapping, self.helper_logger,
+                                                          self.on_port_config_change, timeout=0):
+            pass
 
-            for physical_port, logical_ports in self.port_mapping.physical_to_logical.items():
-                if physical_port not in self.port_obj_dict:
-                    continue
+        while port_change_observer.handle_port_update_event(0):
+            pass
 
-                # Get the first logical port name since it corresponds to the first subport
-                # of the breakout group
-                logical_port_name = logical_ports[0]
+    def get_port_thermal_capability(self, physical_port, logical_port_name):
+        """
+        Returns the cached thermal capability of a physical port, checking
+        dom_polling, module error status and presence only on a cache miss
 
-                if self.is_port_dom_monitoring_disabled(logical_port_name):
-                    continue
+        Returns:
+            dict with the asic_index and temperature_supported of the port,
+            None if the temperature of the port shall not be polled
+        """
+        if physical_port in self.port_thermal_capability:
+            return self.port_thermal_capability[physical_port]
 
-                # Get the asic to which this port belongs
-                asic_index = self.port_mapping.get_asic_id_for_logical_port(logical_port_name)
-                if asic_index is None:
-                    self.log_warning("Got invalid asic index for {}, ignored".format(logical_port_name))
-                    continue
+        capability = None
+        asic_index = self.port_mapping.get_asic_id_for_logical_port(logical_port_name)
+        if asic_index is None:
+            self.log_warning("Got invalid asic index for {}, ignored".format(logical_port_name))
+        elif not self.is_port_dom_monitoring_disabled(logical_port_name) and \
+                not sfp_status_helper.detect_port_in_error_status(logical_port_name, self.xcvr_table_helper.get_status_sw_tbl(asic_index)) and \
+                common._wrapper_get_presence(physical_port):
+            capability = {'asic_index': asic_index, 'temperature_supported': True}
 
-                if not sfp_status_helper.detect_port_in_error_status(logical_port_name, self.xcvr_table_helper.get_status_sw_tbl(asic_index)):
-                    if not common._wrapper_get_presence(physical_port):
-                        continue
+        self.port_thermal_capability[physical_port] = capability
+        return capability
 
-                try:
-                    self.dom_db_utils.post_port_dom_temperature_info_to_db(logical_port_name)
-                except (KeyError, TypeError) as e:
-                    #continue to process next port since exception could be raised due to port reset, transceiver removal
-                    self.log_warning("Got exception {} while processing dom info for port {}, ignored".format(repr(e), logical_port_name))
+    def post_temperature_vector_to_db(self, asic_index, port_temperatures):
+        """
+        Publishes the temperatures of all the modules of an ASIC in a single
+        hash, so that thermal control reads them with one request instead of
+        reading TRANSCEIVER_DOM_TEMPERATURE per port or the modules again.
+        Ports which are no longer monitored are removed from the hash.
+
+        Args:
+            asic_index (int): ASIC index of the ports
+            port_temperatures (dict): Temperature of each monitored logical port
+        """
+        batch_tbl = self.xcvr_table_helper.get_state_db_batch_tbl(asic_index, TRANSCEIVER_DOM_TEMPERATURE_VECTOR_TABLE)
+        published_ports = self.temperature_vector_ports.get(asic_index, set())
+        if port_temperatures:
+            for logical_port_name in published_ports - set(port_temperatures):
+                batch_tbl.hdel(TRANSCEIVER_DOM_TEMPERATURE_VECTOR_KEY, logical_port_name)
+            fvs = swsscommon.FieldValuePairs(
+                list(port_temperatures.items()) +
+                [("last_update_time", self.dom_db_utils.get_current_time())]
+            )
+            batch_tbl.set(TRANSCEIVER_DOM_TEMPERATURE_VECTOR_KEY, fvs)
+            self.temperature_vector_ports[asic_index] = set(port_temperatures)
+        elif published_ports:
+            batch_tbl._del(TRANSCEIVER_DOM_TEMPERATURE_VECTOR_KEY)
+            del self.temperature_vector_ports[asic_index]
+
+    def del_temperature_vector_from_db(self):
+        for asic_index in self.temperature_vector_ports:
+            self.xcvr_table_helper.get_state_db_batch_tbl(asic_index, TRANSCEIVER_DOM_TEMPERATURE_VECTOR_TABLE)._del(
+                TRANSCEIVER_DOM_TEMPERATURE_VECTOR_KEY)
+            self.xcvr_table_helper.get_state_db_pipeline(asic_index).flush()
+        self.temperature_vector_ports = {}
+
+    def update_port_dom_temperature(self):
+        """
+        Posts the temperature of all the monitored transceivers to DB, with a
+        single pipeline flush per ASIC
+        """
+        temperature_vectors = {}
+        for physical_port, logical_ports in self.port_mapping.physical_to_logical.items():
+            if self.task_stopping_event.is_set():
+                break
+
+            if physical_port not in self.port_obj_dict:
+                continue
+
+            # Get the first logical port name since it corresponds to the first subport
+            # of the breakout group
+            logical_port_name = logical_ports[0]
 
-            # Set the periodic db update time after all the ports are processed
-            next_periodic_db_update_time = now + datetime.timedelta(seconds=dom_info_update_periodic_secs)
+            capability = self.get_port_thermal_capability(physical_port, logical_port_name)
+            if capability is None or not capability['temperature_supported']:
+                continue
+
+            asic_index = capability['asic_index']
+            try:
+                temperature_dict = self.dom_db_utils.post_port_dom_temperature_values_to_db(
+                    logical_port_name, physical_port,
+                    self.xcvr_table_helper.get_state_db_batch_tbl(asic_index, TRANSCEIVER_DOM_TEMPERATURE_TABLE))
+            except (KeyError, TypeError) as e:
+                #continue to process next port since exception could be raised due to port reset, transceiver removal
+                self.log_warning("Got exception {} while processing dom info for port {}, ignored".format(repr(e), logical_port_name))
+                self.port_thermal_capability.pop(physical_port, None)
+                continue
+
+            if temperature_dict:
+                temperature_vectors.setdefault(asic_index, {})[logical_port_name] = temperature_dict['temperature']
+            else:
+                capability['temperature_supported'] = False
+
+        for asic_index in set(temperature_vectors) | set(self.temperature_vector_ports):
+            # A pass interrupted by the stop event must not drop ports from the temperature vector
+            if not self.task_stopping_event.is_set():
+                self.post_temperature_vector_to_db(asic_index, temperature_vectors.get(asic_index, {}))
+            self.xcvr_table_helper.get_state_db_pipeline(asic_index).flush()
+
+    def task_worker(self):
+        self.log_notice("Start DOM thermal monitoring loop")
+        sel, asic_context = port_event_helper.subscribe_port_config_change(self.namespaces)
+
+        port_change_observer = port_event_helper.PortChangeObserver(self.namespaces, self.helper_logger,
+                                                  self.task_stopping_event,
+                                                  self.on_port_update_event,
+                                                  port_tbl_map=self.DOM_THERMAL_PORT_CHG_OBSERVER_TBL_MAP)
+
+        # Poll transceiver temperature as soon as possible
+        next_periodic_db_update_time = time.monotonic()
+
+        # Start loop to update dom temperature in DB periodically
+        while True:
+            # Sleep until the next periodic db update unless the task is stopped
+            if self.task_stopping_event.wait(max(0, next_periodic_db_update_time - time.monotonic())):
+                break
+
+            dom_loop_start_time = time.monotonic()
+
+            # Port change events are only needed by the next update, so they
+            # are handled right before it
+            self.handle_port_change_events(sel, asic_context, port_change_observer)
+            self.update_port_dom_temperature()
+
+            # Schedule next poll from loop start time for consistent intervals
+            next_periodic_db_update_time = dom_loop_start_time + self.poll_interval
 
+        # Thermal control must not consume the temperatures once they are no longer updated
+        self.del_temperature_vector_from_db()
         self.log_notice("Stop DOM thermal monitoring loop")
@@ -37,6 +37,34 @@ class DOMDBUtils(DBUtils):
                                                  db_cache=db_cache,
                                                  beautify_func=self._beautify_dom_info_dict)
 
+    def post_port_dom_temperature_values_to_db(self, logical_port_name, physical_port, table):
+        """
+        Reads only the temperature of an already validated transceiver and sets it
+        to the table, which can be a buffered table of a STATE_DB pipeline.
+        Unlike post_port_dom_temperature_info_to_db, the presence of the transceiver
+        is not read again.
+
+        Args:
+            logical_port_name (str): Logical port name.
+            physical_port (int): Physical port index of the transceiver.
+            table (swsscommon.Table): TRANSCEIVER_DOM_TEMPERATURE table.
+
+        Returns:
+            dict: The temperature values set to the table, empty if the transceiver
+                  doesn't support temperature monitoring.
+        """
+        temperature_dict = self.dom_utils.get_transceiver_dom_temperature(physical_port)
+        if not temperature_dict:
+            return {}
+
+        self._beautify_dom_info_dict(temperature_dict)
+        fvs = swsscommon.FieldValuePairs(
+            [(k, v) for k, v in temperature_dict.items()] +
+            [("last_update_time", self.get_current_time())]
+        )
+        table.set(logical_port_name, fvs)
+        return temperature_dict
+
     def post_port_dom_sensor_info_to_db(self, logical_port_name, db_cache=None):
         asic_index = self.port_mapping.get_asic_id_for_logical_port(logical_port_name)
         if asic_index is None:
@@ -0,0 +1,59 @@
+import datetime
+import time
+from xcvrd.dom.utilities.db.utils import DBUtils
+from xcvrd.dom.utilities.pm.utils import PMAggregator
+from swsscommon import swsscommon
+
+
+class PMDBUtils(DBUtils):
+    """
+    This class provides utility functions for managing DB operations
+    related to the PM interval aggregation on transceivers.
+    Handles data related to the following tables:
+        - TRANSCEIVER_PM_XXXX_YYYY
+            - XXXX refers to 15MIN or 24H
+            - YYYY refers to CURRENT or PREVIOUS
+    """
+    def __init__(self, sfp_obj_dict, port_mapping, xcvr_table_helper, task_stopping_event, logger):
+        super().__init__(sfp_obj_dict, port_mapping, task_stopping_event, logger)
+        self.xcvr_table_helper = xcvr_table_helper
+        self.pm_aggregator = PMAggregator(logger)
+        self.logger = logger
+
+    def post_port_pm_interval_info_to_db(self, port_name, asic_index, physical_port, pm_info_dict, now=None):
+        """
+        Aggregates the PM snapshot of a port into its 15-minute and 24-hour bins
+        and posts the bins which changed to the DB.
+        The previous bins are only posted when an interval boundary is crossed.
+
+        Args:
+            port_name (str): Name of the port the PM snapshot is posted for in TRANSCEIVER_PM.
+            asic_index (int): ASIC index of the port.
+            physical_port (int): Physical port index of the transceiver.
+            pm_info_dict (dict): PM snapshot as returned by get_transceiver_pm().
+            now (float, optional): Wall-clock time of the snapshot. Defaults to the current time.
+        """
+        try:
+            module = self.sfp_obj_dict[physical_port].get_xcvr_api()
+        except (KeyError, NotImplementedError):
+            module = None
+
+        if now is None:
+            now = time.time()
+        for interval, bin_type in self.pm_aggregator.update(port_name, pm_info_dict, now, module):
+            pm_bin = self.pm_aggregator.get_bin(port_name, interval, bin_type)
+            pm_bin_dict = pm_bin.to_dict()
+            self.beautify_info_dict(pm_bin_dict)
+            interval_start = datetime.datetime.fromtimestamp(pm_bin.start_time, datetime.timezone.utc)
+            fvs = swsscommon.FieldValuePairs(
+                [(k, v) for k, v in pm_bin_dict.items()] +
+                [("interval_start", interval_start.strftime("%a %b %d %H:%M:%S %Y")),
+                 ("last_update_time", self.get_current_time())]
+            )
+            self.xcvr_table_helper.get_pm_interval_tbl(asic_index, f'{interval}_{bin_type}').set(port_name, fvs)
+
+    def remove_port(self, port_name):
+        """
+        Drops the PM bins of a port, e.g. when the port is removed
+        """
+        self.pm_aggregator.remove_port(port_name)
@@ -0,0 +1,160 @@
+from array import array
+
+# Length of the PM intervals in seconds. The intervals are aligned to the
+# wall-clock (UTC) boundaries, i.e. quarter hours and midnight.
+PM_INTERVALS = {
+    '15min': 15 * 60,
+    '24h': 24 * 60 * 60,
+}
+
+PM_STAT_SUFFIXES = ('_min', '_max', '_avg')
+
+# Slots of a metric in the accumulator array of a bin
+PM_BIN_MIN, PM_BIN_MAX, PM_BIN_SUM, PM_BIN_COUNT = range(4)
+PM_BIN_SLOTS = 4
+
+
+class PMIntervalBin:
+    """
+    Accumulates the min/max/avg/count of PM metrics over one interval.
+    The values are kept in a fixed-size array with PM_BIN_SLOTS slots
+    per metric, the metrics of a port being known from its first sample.
+    """
+    def __init__(self, metrics, interval_index, interval_secs):
+        self.metrics = metrics
+        self.interval_index = interval_index
+        self.interval_secs = interval_secs
+        self.values = array('d', [float('inf'), float('-inf'), 0.0, 0.0] * len(metrics))
+
+    @property
+    def start_time(self):
+        return self.interval_index * self.interval_secs
+
+    def add(self, samples):
+        """
+        Adds PM samples to the bin
+        Args:
+            samples: A list, aligned with metrics, of (min, max, avg) tuples or None
+                     for the metrics missing from the PM snapshot
+        """
+        values = self.values
+        for i, sample in enumerate(samples):
+            if sample is None:
+                continue
+            base = i * PM_BIN_SLOTS
+            sample_min, sample_max, sample_avg = sample
+            if sample_min < values[base + PM_BIN_MIN]:
+                values[base + PM_BIN_MIN] = sample_min
+            if sample_max > values[base + PM_BIN_MAX]:
+                values[base + PM_BIN_MAX] = sample_max
+            values[base + PM_BIN_SUM] += sample_avg
+            values[base + PM_BIN_COUNT] += 1
+
+    def to_dict(self):
+        """
+        Returns the binned values of the metrics with at least one sample
+        """
+        result = {}
+        values = self.values
+        for i, metric in enumerate(self.metrics):
+            base = i * PM_BIN_SLOTS
+            count = int(values[base + PM_BIN_COUNT])
+            if not count:
+                continue
+            result[f'{metric}_min'] = values[base + PM_BIN_MIN]
+            result[f'{metric}_max'] = values[base + PM_BIN_MAX]
+            result[f'{metric}_avg'] = values[base + PM_BIN_SUM] / count
+            result[f'{metric}_count'] = count
+        return result
+
+
+class PMAggregator:
+    """
+    This class aggregates the PM snapshots read from the transceivers on each
+    DOM pass into the current and previous bins of the PM_INTERVALS of each port.
+    """
+    def __init__(self, logger):
+        self.logger = logger
+        # port name -> (module, metrics)
+        self.port_metrics = {}
+        # port name -> {interval: [current bin, previous bin]}
+        self.port_bins = {}
+
+    @staticmethod
+    def parse_pm_metrics(pm_info_dict):
+        """
+        Parses a PM snapshot, whose keys are <metric>_min, <metric>_max and
+        <metric>_avg, into a dict of metric -> (min, max, avg). Non-numeric
+        values are ignored and missing statistics fall back to the average.
+        """
+        parsed = {}
+        for key, value in pm_info_dict.items():
+            for suffix in PM_STAT_SUFFIXES:
+                if key.endswith(suffix):
+                    try:
+                        parsed.setdefault(key[:-len(suffix)], {})[suffix] = float(value)
+                    except (TypeError, ValueError):
+                        pass
+                    break
+
+        pm_metrics = {}
+        for metric, stats in parsed.items():
+            avg = stats.get('_avg')
+            if avg is None:
+                continue
+            pm_metrics[metric] = (stats.get('_min', avg), stats.get('_max', avg), avg)
+        return pm_metrics
+
+    def update(self, port_name, pm_info_dict, now, module=None):
+        """
+        Aggregates a PM snapshot of a port into its bins, rolling the bins over
+        when a wall-clock interval boundary is crossed.
+        The bins of the port are restarted if the module or its metrics changed.
+        Args:
+            port_name: The name of the port the PM snapshot belongs to
+            pm_info_dict: The PM snapshot as returned by get_transceiver_pm()
+            now: The wall-clock time of the snapshot, in seconds since the epoch
+            module: Identifies the module of the port, e.g. its xcvr api object
+        Returns:
+            A list of the (interval, bin type) pairs whose bins changed,
+            bin type being 'current' or 'previous'
+        """
+        pm_metrics = self.parse_pm_metrics(pm_info_dict)
+        if not pm_metrics:
+            return []
+
+        port_metrics = self.port_metrics.get(port_name)
+        if port_metrics is None or port_metrics[0] is not module or \
+                set(port_metrics[1]) != pm_metrics.keys():
+            metrics = tuple(sorted(pm_metrics))
+            self.port_metrics[port_name] = (module, metrics)
+            self.port_bins[port_name] = {interval: [None, None] for interval in PM_INTERVALS}
+        else:
+            metrics = port_metrics[1]
+
+        samples = [pm_metrics[metric] for metric in metrics]
+        updated = []
+        for interval, interval_secs in PM_INTERVALS.items():
+            bins = self.port_bins[port_name][interval]
+            interval_index = int(now // interval_secs)
+            if bins[0] is None or bins[0].interval_index != interval_index:
+                if bins[0] is not None:
+                    bins[1] = bins[0]
+                    updated.append((interval, 'previous'))
+                bins[0] = PMIntervalBin(metrics, interval_index, interval_secs)
+            bins[0].add(samples)
+            updated.append((interval, 'current'))
+        return updated
+
+    def get_bin(self, port_name, interval, bin_type):
+        """
+        Returns the 'current' or 'previous' bin of an interval of a port, None if not available
+        """
+        bins = self.port_bins.get(port_name)
+        if bins is None:
+            return None
+        return bins[interval][0 if bin_type == 'current' else 1]
+
+    def remove_port(self, port_name):
+        self.port_metrics.pop(port_name, None)
+        self.port_bins.pop(port_name, None)
@@ -15,6 +15,7 @@ class VDMDBUtils(DBUtils):
             - XXXX refers to HALARM, LALARM, HWARN or LWARN
         - TRANSCEIVER_VDM_XXXX_THRESHOLD
             - XXXX refers to HALARM, LALARM, HWARN or LWARN
+        - vdm_freeze_window_msecs field of TRANSCEIVER_STATUS_SW
     """
     def __init__(self, sfp_obj_dict, port_mapping, xcvr_table_helper, task_stopping_event, logger):
         super().__init__(sfp_obj_dict, port_mapping, task_stopping_event, logger)
@@ -55,6 +56,24 @@ class VDMDBUtils(DBUtils):
         table = self.xcvr_table_helper.get_vdm_real_value_tbl(asic_index)
         table.set(logical_port_name, fvs)
 
+    def post_port_vdm_freeze_window_to_db(self, logical_port_name, freeze_window_msecs):
+        """
+        Posts the duration of the last VDM freeze window of the port, i.e. the time
+        from the freeze request to the unfreeze confirmation, to TRANSCEIVER_STATUS_SW.
+
+        Args:
+            logical_port_name (str): Logical port name.
+            freeze_window_msecs (float): Duration of the freeze window in milliseconds.
+        """
+        asic_index = self.port_mapping.get_asic_id_for_logical_port(logical_port_name)
+        if asic_index is None:
+            self.logger.log_error(f"Post port vdm freeze window to db failed for {logical_port_name} "
+                                  "as no asic index found")
+            return
+
+        fvs = swsscommon.FieldValuePairs([('vdm_freeze_window_msecs', '{:.3f}'.format(freeze_window_msecs))])
+        self.xcvr_table_helper.get_status_sw_tbl(asic_index).set(logical_port_name, fvs)
+
     def post_port_vdm_flags_to_db(self, logical_port_name, db_cache=None):
         return self._post_port_vdm_thresholds_or_flags_to_db(logical_port_name, self.xcvr_table_helper.get_vdm_flag_tbl,
                                                             self.vdm_utils.get_vdm_flags, flag_data=True, db_cache=db_cache)
@@ -13,6 +13,10 @@ class VDMUtils:
     def __init__(self, sfp_obj_dict, logger):
         self.sfp_obj_dict = sfp_obj_dict
         self.logger = logger
+        # physical port -> (xcvr api, VDM statistic supported) of the inserted module
+        self.vdm_capability_cache = {}
+        # physical port -> duration of the last VDM freeze window in milliseconds
+        self.vdm_freeze_window_msecs = {}
 
     def is_transceiver_vdm_supported(self, physical_port):
         try:
@@ -26,6 +30,66 @@ class VDMUtils:
         except (NotImplementedError, AttributeError):
             return False
 
+    def get_vdm_capability(self, physical_port):
+        """
+        Returns whether VDM and VDM statistic observables are supported by the transceiver.
+        A positive result is cached for as long as the xcvr api object of the port
+        stays the same, i.e. until the module is replaced, so that the advertisement
+        is not read from the module on every DOM pass.
+        Args:
+            physical_port: The physical port index.
+        Returns:
+            A tuple (vdm_supported, vdm_statistic_supported).
+        """
+        try:
+            api = self.sfp_obj_dict[physical_port].get_xcvr_api()
+        except (KeyError, NotImplementedError, AttributeError):
+            api = None
+
+        cached = self.vdm_capability_cache.get(physical_port)
+        if api is not None and cached is not None and cached[0] is api:
+            return True, cached[1]
+
+        self.vdm_capability_cache.pop(physical_port, None)
+        if not self.is_transceiver_vdm_supported(physical_port):
+            return False, False
+
+        statistic_supported = self.is_vdm_statistic_supported(physical_port)
+        if api is not None:
+            self.vdm_capability_cache[physical_port] = (api, statistic_supported)
+        return True, statistic_supported
+
+    def get_vdm_real_values(self, physical_port, freeze, frozen_callback=None):
+        """
+        Acquires the VDM real values of the transceiver with at most one VDM freeze window.
+        If freeze is set, the statistic observables are read while VDM is frozen, together
+        with frozen_callback (e.g. to read PM), and the basic observables are read after unfreeze.
+        The duration of the freeze window is recorded in vdm_freeze_window_msecs.
+        Args:
+            physical_port: The physical port index.
+            freeze: True to freeze VDM and read the statistic observables.
+            frozen_callback: Optional function called while VDM is frozen.
+        Returns:
+            A dict merging the basic and statistic observables.
+        """
+        vdm_statistic_values = {}
+        if freeze:
+            with self.vdm_freeze_context(physical_port) as vdm_frozen:
+                if vdm_frozen:
+                    try:
+                        vdm_statistic_values = self.get_vdm_real_values_statistic(physical_port) or {}
+                    except (KeyError, TypeError) as e:
+                        # The statistic observables can fail to parse e.g. on a module being
+                        # removed, the rest of the frozen window and the basic observables
+                        # are still read
+                        self.logger.log_warning(f"Got exception {repr(e)} while reading VDM statistic "
+                                                f"real values for port {physical_port}, ignored")
+                    if frozen_callback is not None:
+                        frozen_callback()
+
+        vdm_basic_values = self.get_vdm_real_values_basic(physical_port) or {}
+        return {**vdm_basic_values, **vdm_statistic_values}
+
     def get_vdm_real_values_basic(self, physical_port):
         try:
             return self.sfp_obj_dict[physical_port].get_transceiver_vdm_real_value_basic()
@@ -55,6 +119,7 @@ class VDMUtils:
 
     @contextmanager
     def vdm_freeze_context(self, physical_port):
+        freeze_start_time = time.monotonic()
         try:
             if not self._freeze_vdm_stats_and_confirm(physical_port):
                 self.logger.log_error(f"Failed to freeze VDM stats in contextmanager for port {physical_port}")
@@ -64,6 +129,7 @@ class VDMUtils:
         finally:
             if not self._unfreeze_vdm_stats_and_confirm(physical_port):
                 self.logger.log_error(f"Failed to unfreeze VDM stats in contextmanager for port {physical_port}")
+            self.vdm_freeze_window_msecs[physical_port] = (time.monotonic() - freeze_start_time) * 1000
 
     def _vdm_action_and_confirm(self, physical_port, action, status_check, action_name):
         """
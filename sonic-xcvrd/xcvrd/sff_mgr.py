@@ -101,6 +101,11 @@ class SffManagerTask(threading.Thread):
         self.port_dict = {}
         # port_dict snapshot captured in the previous event update loop
         self.port_dict_prev = {}
+        # Logical ports updated by on_port_update_event since they were last
+        # processed, only these ports are processed by the event update loop
+        self.dirty_lports = set()
+        # XcvrApi of each physical port, valid until the transceiver is removed
+        self.xcvr_api_cache = {}
         self.xcvr_table_helper = XcvrTableHelper(namespaces)
         self.namespaces = namespaces
 
@@ -173,6 +178,7 @@ class SffManagerTask(threading.Thread):
         if port_change_event.event_type == port_change_event.PORT_SET:
             if lport not in self.port_dict:
                 self.port_dict[lport] = {}
+            self.dirty_lports.add(lport)
             if pport >= 0:
                 self.port_dict[lport]['index'] = pport
 
@@ -192,6 +198,9 @@ class SffManagerTask(threading.Thread):
                         port_change_event.port_dict[self.ADMIN_STATUS]
 
             if self.XCVR_TYPE in port_change_event.port_dict:
+                if self.XCVR_TYPE not in self.port_dict[lport]:
+                    # Transceiver insertion, the XcvrApi is created again
+                    self.xcvr_api_cache.pop(pport, None)
                 self.port_dict[lport][self.XCVR_TYPE] = port_change_event.port_dict[self.XCVR_TYPE]
             self.port_dict[lport]['asic_id'] = asic_id
         # CONFIG_DB PORT_TABLE DEL case:
@@ -200,6 +209,8 @@ class SffManagerTask(threading.Thread):
             # Only when port is removed from CONFIG, we consider this entry as deleted.
             if lport in self.port_dict:
                 del self.port_dict[lport]
+            self.port_dict_prev.pop(lport, None)
+            self.dirty_lports.discard(lport)
         # STATE_DB TRANSCEIVER_INFO DEL case:
         elif port_change_event.table_name and \
                 port_change_event.table_name == 'TRANSCEIVER_INFO':
@@ -208,6 +219,26 @@ class SffManagerTask(threading.Thread):
             # self.port_dict
             if lport in self.port_dict and self.XCVR_TYPE in self.port_dict[lport]:
                 del self.port_dict[lport][self.XCVR_TYPE]
+                self.dirty_lports.add(lport)
+            self.xcvr_api_cache.pop(pport, None)
+
+    def get_xcvr_api(self, sfp, pport):
+        """
+        Get the XcvrApi of a physical port, cached until the transceiver is removed.
+
+        Args:
+            sfp (SfpBase): The SFP object of the physical port.
+            pport (int): Physical port index.
+
+        Returns:
+            XcvrApi: The XcvrApi of the transceiver, None if not available.
+        """
+        api = self.xcvr_api_cache.get(pport)
+        if api is None:
+            api = sfp.get_xcvr_api()
+            if api is not None:
+                self.xcvr_api_cache[pport] = api
+        return api
 
     def get_host_tx_status(self, lport, asic_index):
         host_tx_ready = 'false'
@@ -364,170 +395,185 @@ class SffManagerTask(threading.Thread):
                 # In the case of no real update, go back to the beginning of the loop
                 continue
 
-            for lport in self.port_dict:
+            # Only the logical ports updated since the previous loop are
+            # processed, so that an event on a port doesn't cause I2C
+            # accesses on the other ports
+            dirty_lports = [lport for lport in self.port_dict if lport in self.dirty_lports]
+            self.dirty_lports.clear()
+            for lport in dirty_lports:
                 if self.task_stopping_event.is_set():
                     break
-                data = self.port_dict[lport]
-                pport = int(data.get('index', '-1'))
-                subport_idx = int(data.get(self.SUBPORT, '0'))
-                lanes_list = data.get(self.LANES_LIST, None)
-                # active_lanes is a list of boolean values, where True means the
-                # corresponding lane belongs to this logical port.
-                active_lanes = data.get('active_lanes', None)
-                xcvr_type = data.get(self.XCVR_TYPE, None)
-                xcvr_inserted = False
-                host_tx_ready_changed = False
-                admin_status_changed = False
-                if pport < 0 or lanes_list is None:
-                    continue
-
-                if xcvr_type is None:
-                    # TRANSCEIVER_INFO table's XCVR_TYPE is not ready, meaning xcvr is not present
-                    continue
-
-                # double-check the HW presence before moving forward
-                sfp = self.platform_chassis.get_sfp(pport)
-                if not sfp.get_presence():
-                    self.log_error("{}: module not present!".format(lport))
-                    del self.port_dict[lport][self.XCVR_TYPE]
-                    continue
-                try:
-                    # Skip if XcvrApi is not supported
-                    api = sfp.get_xcvr_api()
-                    if api is None:
-                        self.log_error(
-                            "{}: skipping sff_mgr since no xcvr api!".format(lport))
-                        continue
-                except (AttributeError, NotImplementedError):
-                    # Skip if these essential routines are not available
-                    continue
-
-                # Proceed only for non-cmis transceiver
-                if common.is_cmis_api(api):
-                    continue
-
-                # Handle the case that host_tx_ready value in the local cache hasn't
-                # been updated via PortChangeEvent:
-                if self.HOST_TX_READY not in data:
-                    # Fetch host_tx_ready status from STATE_DB (if not present
-                    # in DB, treat it as false), and update self.port_dict
-                    data[self.HOST_TX_READY] = self.get_host_tx_status(lport, data['asic_id'])
-                    self.log_notice("{}: fetched DB and updated host_tx_ready={} locally".format(
-                        lport, data[self.HOST_TX_READY]))
-                # Handle the case that admin_status value in the local cache hasn't
-                # been updated via PortChangeEvent:
-                if self.ADMIN_STATUS not in data:
-                    # Fetch admin_status from CONFIG_DB (if not present in DB,
-                    # treat it as false), and update self.port_dict
-                    data[self.ADMIN_STATUS] = self.get_admin_status(lport, data['asic_id'])
-                    self.log_notice("{}: fetched DB and updated admin_status={} locally".format(
-                        lport, data[self.ADMIN_STATUS]))
-
-                # Check if there's a diff between current and previous XCVR_TYPE
-                # It's a xcvr insertion case if TRANSCEIVER_INFO XCVR_TYPE doesn't exist
-                # in previous port_dict snapshot
-                if lport not in self.port_dict_prev or self.XCVR_TYPE not in self.port_dict_prev[lport]:
-                    xcvr_inserted = True
-                # Check if there's a diff between current and previous host_tx_ready
-                if (lport not in self.port_dict_prev or
-                        self.HOST_TX_READY not in self.port_dict_prev[lport] or
-                        self.port_dict_prev[lport][self.HOST_TX_READY] != data[self.HOST_TX_READY]):
-                    host_tx_ready_changed = True
-                # Check if there's a diff between current and previous admin_status
-                if (lport not in self.port_dict_prev or
-                    self.ADMIN_STATUS not in self.port_dict_prev[lport] or
-                    self.port_dict_prev[lport][self.ADMIN_STATUS] != data[self.ADMIN_STATUS]):
-                    admin_status_changed = True
-                # Skip if neither of below cases happens:
-                # 1) xcvr insertion
-                # 2) host_tx_ready getting changed
-                # 3) admin_status getting changed
-                # In addition to handle_port_update_event()'s internal filter,
-                # this check serves as additional filter to ignore irrelevant
-                # event, such as CONFIG_DB change other than admin_status field.
-                if ((not xcvr_inserted) and
-                    (not host_tx_ready_changed) and
-                    (not admin_status_changed)):
-                    continue
-                self.log_notice(("{}: xcvr=present(inserted={}), "
-                                 "host_tx_ready={}(changed={}), "
-                                 "admin_status={}(changed={})").format(
-                    lport,
-                    xcvr_inserted,
-                    data[self.HOST_TX_READY], host_tx_ready_changed,
-                    data[self.ADMIN_STATUS], admin_status_changed))
-
-                try:
-                    # Skip if it's a copper cable
-                    if api.is_copper():
-                        self.log_notice(
-                            "{}: skipping sff_mgr for copper cable".format(lport))
-                        continue
-
-                    # Skip if tx_disable action is not supported for this xcvr
-                    if not api.get_tx_disable_support():
-                        self.log_notice(
-                            "{}: skipping sff_mgr due to tx_disable not supported".format(
-                                lport))
-                        continue
-                except (AttributeError, NotImplementedError):
-                    # Skip if these essential routines are not available
-                    continue
-
-                if xcvr_inserted or (admin_status_changed and data[self.ADMIN_STATUS] == "up"):
-                    self.enable_high_power_class(api, lport)
-
-                    if api.get_lpmode_support():
-                        set_lp_success = (
-                            sfp.set_lpmode(False)
-                            if isinstance(api, Sff8472Api)
-                            else api.set_lpmode(False)
-                        )
-                        if not set_lp_success:
-                            self.log_error(
-                                "{}: Failed to take module out of low power mode.".format(
-                                    lport)
-                            )
-
-                if active_lanes is None:
-                    active_lanes = self.get_active_lanes_for_lport(lport, subport_idx,
-                                                               len(lanes_list),
-                                                               self.DEFAULT_NUM_LANES_PER_PPORT)
-                    if active_lanes is None:
-                        self.log_error("{}: skipping sff_mgr due to "
-                                       "failing to get active lanes".format(lport))
-                        continue
-                    # Save active_lanes in self.port_dict
-                    self.port_dict[lport]['active_lanes'] = active_lanes
-
-                # Only turn on TX if both host_tx_ready is true and admin_status is up
-                target_tx_disable_flag = not (data[self.HOST_TX_READY] == 'true'
-                                              and data[self.ADMIN_STATUS] == 'up')
-                # get_tx_disable API returns an array of bool, with tx_disable flag on each lane.
-                # True means tx disabled; False means tx enabled.
-                cur_tx_disable_array = api.get_tx_disable()
-                if cur_tx_disable_array is None:
-                    self.log_error("{}: Failed to get current tx_disable value".format(lport))
-                    # If reading current tx_disable/enable value failed (could be due to
-                    # read error), then set this variable to the opposite value of
-                    # target_tx_disable_flag, to let detla array to be True on
-                    # all the interested lanes, to try best-effort TX disable/enable.
-                    cur_tx_disable_array = [not target_tx_disable_flag] * self.DEFAULT_NUM_LANES_PER_PPORT
-                # Get an array of bool, where it's True only on the lanes that need change.
-                delta_array = self.calculate_tx_disable_delta_array(cur_tx_disable_array,
-                                                                    target_tx_disable_flag, active_lanes)
-                mask = self.convert_bool_array_to_bit_mask(delta_array)
-                if mask == 0:
-                    self.log_notice("{}: No change is needed for tx_disable value".format(lport))
-                    continue
-                if api.tx_disable_channel(mask, target_tx_disable_flag):
-                    self.log_notice("{}: TX was {} with lanes mask: {}".format(
-                        lport, "disabled" if target_tx_disable_flag else "enabled", bin(mask)))
-                else:
-                    self.log_error("{}: Failed to {} TX with lanes mask: {}".format(
-                        lport, "disable" if target_tx_disable_flag else "enable", bin(mask)))
-
-            # Take a snapshot for port_dict, this will be used to calculate diff
-            # later in the while loop to determine if there's really a value
-            # change on the fields related to the events we care about.
-            self.port_dict_prev = copy.deepcopy(self.port_dict)
+                self.handle_port_update(lport)
+                # Take a snapshot of the port entry, this will be used to calculate
+                # diff on the next update of the port to determine if there's really
+                # a value change on the fields related to the events we care about.
+                self.port_dict_prev[lport] = copy.deepcopy(self.port_dict[lport])
+
+    def handle_port_update(self, lport):
+        """
+        Enable or disable TX of a logical port following its xcvr insertion,
+        host_tx_ready and admin_status updates.
+
+        Args:
+            lport (str): Logical port name.
+        """
+        data = self.port_dict[lport]
+        pport = int(data.get('index', '-1'))
+        subport_idx = int(data.get(self.SUBPORT, '0'))
+        lanes_list = data.get(self.LANES_LIST, None)
+        # active_lanes is a list of boolean values, where True means the
+        # corresponding lane belongs to this logical port.
+        active_lanes = data.get('active_lanes', None)
+        xcvr_type = data.get(self.XCVR_TYPE, None)
+        xcvr_inserted = False
+        host_tx_ready_changed = False
+        admin_status_changed = False
+        if pport < 0 or lanes_list is None:
+            return
+
+        if xcvr_type is None:
+            # TRANSCEIVER_INFO table's XCVR_TYPE is not ready, meaning xcvr is not present
+            return
+
+        # double-check the HW presence before moving forward
+        sfp = self.platform_chassis.get_sfp(pport)
+        if not sfp.get_presence():
+            self.log_error("{}: module not present!".format(lport))
+            del self.port_dict[lport][self.XCVR_TYPE]
+            self.xcvr_api_cache.pop(pport, None)
+            return
+        try:
+            # Skip if XcvrApi is not supported
+            api = self.get_xcvr_api(sfp, pport)
+            if api is None:
+                self.log_error(
+                    "{}: skipping sff_mgr since no xcvr api!".format(lport))
+                return
+        except (AttributeError, NotImplementedError):
+            # Skip if these essential routines are not available
+            return
+
+        # Proceed only for non-cmis transceiver
+        if common.is_cmis_api(api):
+            return
+
+        # Handle the case that host_tx_ready value in the local cache hasn't
+        # been updated via PortChangeEvent:
+        if self.HOST_TX_READY not in data:
+            # Fetch host_tx_ready status from STATE_DB (if not present
+            # in DB, treat it as false), and update self.port_dict
+            data[self.HOST_TX_READY] = self.get_host_tx_status(lport, data['asic_id'])
+            self.log_notice("{}: fetched DB and updated host_tx_ready={} locally".format(
+                lport, data[self.HOST_TX_READY]))
+        # Handle the case that admin_status value in the local cache hasn't
+        # been updated via PortChangeEvent:
+        if self.ADMIN_STATUS not in data:
+            # Fetch admin_status from CONFIG_DB (if not present in DB,
+            # treat it as false), and update self.port_dict
+            data[self.ADMIN_STATUS] = self.get_admin_status(lport, data['asic_id'])
+            self.log_notice("{}: fetched DB and updated admin_status={} locally".format(
+                lport, data[self.ADMIN_STATUS]))
+
+        # Check if there's a diff between current and previous XCVR_TYPE
+        # It's a xcvr insertion case if TRANSCEIVER_INFO XCVR_TYPE doesn't exist
+        # in previous port_dict snapshot
+        if lport not in self.port_dict_prev or self.XCVR_TYPE not in self.port_dict_prev[lport]:
+            xcvr_inserted = True
+        # Check if there's a diff between current and previous host_tx_ready
+        if (lport not in self.port_dict_prev or
+                self.HOST_TX_READY not in self.port_dict_prev[lport] or
+                self.port_dict_prev[lport][self.HOST_TX_READY] != data[self.HOST_TX_READY]):
+            host_tx_ready_changed = True
+        # Check if there's a diff between current and previous admin_status
+        if (lport not in self.port_dict_prev or
+            self.ADMIN_STATUS not in self.port_dict_prev[lport] or
+            self.port_dict_prev[lport][self.ADMIN_STATUS] != data[self.ADMIN_STATUS]):
+            admin_status_changed = True
+        # Skip if neither of below cases happens:
+        # 1) xcvr insertion
+        # 2) host_tx_ready getting changed
+        # 3) admin_status getting changed
+        # In addition to handle_port_update_event()'s internal filter,
+        # this check serves as additional filter to ignore irrelevant
+        # event, such as CONFIG_DB change other than admin_status field.
+        if ((not xcvr_inserted) and
+            (not host_tx_ready_changed) and
+            (not admin_status_changed)):
+            return
+        self.log_notice(("{}: xcvr=present(inserted={}), "
+                         "host_tx_ready={}(changed={}), "
+                         "admin_status={}(changed={})").format(
+            lport,
+            xcvr_inserted,
+            data[self.HOST_TX_READY], host_tx_ready_changed,
+            data[self.ADMIN_STATUS], admin_status_changed))
+
+        try:
+            # Skip if it's a copper cable
+            if api.is_copper():
+                self.log_notice(
+                    "{}: skipping sff_mgr for copper cable".format(lport))
+                return
+
+            # Skip if tx_disable action is not supported for this xcvr
+            if not api.get_tx_disable_support():
+                self.log_notice(
+                    "{}: skipping sff_mgr due to tx_disable not supported".format(
+                        lport))
+                return
+        except (AttributeError, NotImplementedError):
+            # Skip if these essential routines are not available
+            return
+
+        if xcvr_inserted or (admin_status_changed and data[self.ADMIN_STATUS] == "up"):
+            self.enable_high_power_class(api, lport)
+
+            if api.get_lpmode_support():
+                set_lp_success = (
+                    sfp.set_lpmode(False)
+                    if isinstance(api, Sff8472Api)
+                    else api.set_lpmode(False)
+                )
+                if not set_lp_success:
+                    self.log_error(
+                        "{}: Failed to take module out of low power mode.".format(
+                            lport)
+                    )
+
+        if active_lanes is None:
+            active_lanes = self.get_active_lanes_for_lport(lport, subport_idx,
+                                                       len(lanes_list),
+                                                       self.DEFAULT_NUM_LANES_PER_PPORT)
+            if active_lanes is None:
+                self.log_error("{}: skipping sff_mgr due to "
+                               "failing to get active lanes".format(lport))
+                return
+            # Save active_lanes in self.port_dict
+            self.port_dict[lport]['active_lanes'] = active_lanes
+
+        # Only turn on TX if both host_tx_ready is true and admin_status is up
+        target_tx_disable_flag = not (data[self.HOST_TX_READY] == 'true'
+                                      and data[self.ADMIN_STATUS] == 'up')
+        # get_tx_disable API returns an array of bool, with tx_disable flag on each lane.
+        # True means tx disabled; False means tx enabled.
+        cur_tx_disable_array = api.get_tx_disable()
+        if cur_tx_disable_array is None:
+            self.log_error("{}: Failed to get current tx_disable value".format(lport))
+            # If reading current tx_disable/enable value failed (could be due to
+            # read error), then set this variable to the opposite value of
+            # target_tx_disable_flag, to let detla array to be True on
+            # all the interested lanes, to try best-effort TX disable/enable.
+            cur_tx_disable_array = [not target_tx_disable_flag] * self.DEFAULT_NUM_LANES_PER_PPORT
+        # Get an array of bool, where it's True only on the lanes that need change.
+        delta_array = self.calculate_tx_disable_delta_array(cur_tx_disable_array,
+                                                            target_tx_disable_flag, active_lanes)
+        mask = self.convert_bool_array_to_bit_mask(delta_array)
+        if mask == 0:
+            self.log_notice("{}: No change is needed for tx_disable value".format(lport))
+            return
+        if api.tx_disable_channel(mask, target_tx_disable_flag):
+            self.log_notice("{}: TX was {} with lanes mask: {}".format(
+                lport, "disabled" if target_tx_disable_flag else "enabled", bin(mask)))
+        else:
+            self.log_error("{}: Failed to {} TX with lanes mask: {}".format(
+                lport, "disable" if target_tx_disable_flag else "enable", bin(mask)))
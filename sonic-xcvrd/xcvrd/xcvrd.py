@@ -178,7 +178,15 @@ def _wrapper_get_sfp_error_description(physical_port):
 
 
 def post_port_sfp_info_to_db(logical_port_name, port_mapping, table, transceiver_dict,
-                             stop_event=threading.Event()):
+                             stop_event=threading.Event(), xcvr_table_helper=None, published_lports=None):
+    """
+    Posts the transceiver info of a logical port to TRANSCEIVER_INFO.
+
+    When xcvr_table_helper is given, the row of a non-ganged port is published at once to all
+    the logical ports of its physical port, e.g. the subports of a breakout, skipping those
+    already holding the same row. The logical ports published are added to published_lports
+    if given, so that posting them again with the same transceiver_dict is skipped.
+    """
     ganged_port = False
     ganged_member_num = 1
 
@@ -208,16 +216,16 @@ def post_port_sfp_info_to_db(logical_port_name, port_mapping, table, transceiver
                 port_info_dict = _wrapper_get_transceiver_info(physical_port)
                 transceiver_dict[physical_port] = port_info_dict
             if port_info_dict is not None:
+                if published_lports is not None and port_name in published_lports:
+                    continue
                 is_replaceable = _wrapper_is_replaceable(physical_port)
                 # if cmis is supported by the module
                 if 'cmis_rev' in port_info_dict:
-                    fvs = swsscommon.FieldValuePairs(
-                        [(field, str(value)) for field, value in port_info_dict.items()] +
-                        [('is_replaceable', str(is_replaceable))]
-                    )
+                    fv_list = [(field, str(value)) for field, value in port_info_dict.items()] + \
+                              [('is_replaceable', str(is_replaceable))]
                 # else cmis is not supported by the module
                 else:
-                    fvs = swsscommon.FieldValuePairs([
+                    fv_list = [
                         ('type', port_info_dict['type']),
                         ('vendor_rev', port_info_dict['vendor_rev']),
                         ('serial', port_info_dict['serial']),
@@ -238,8 +246,19 @@ def post_port_sfp_info_to_db(logical_port_name, port_mapping, table, transceiver
                         ('is_replaceable', str(is_replaceable)),
                         ('dom_capability', port_info_dict['dom_capability']
                         if 'dom_capability' in port_info_dict else 'N/A')
-                    ])
-                table.set(port_name, fvs)
+                    ]
+
+                if xcvr_table_helper is None:
+                    table.set(port_name, swsscommon.FieldValuePairs(fv_list))
+                    continue
+
+                sibling_lports = None if ganged_port else port_mapping.get_physical_to_logical(physical_port)
+                if not sibling_lports or port_name not in sibling_lports:
+                    sibling_lports = [port_name]
+                xcvr_table_helper.publish_rows(port_mapping.get_asic_id_for_logical_port(logical_port_name),
+                                               table, sibling_lports, fv_list)
+                if published_lports is not None:
+                    published_lports.update(sibling_lports)
             else:
                 return SFP_EEPROM_NOT_READY
 
@@ -276,6 +295,9 @@ class SfpStateUpdateTask(threading.Thread):
         # because _wrapper_get_presence returns the SFP presence status
         self.sfp_error_dict = {}
         self.sfp_insert_events = {}
+        # Presence of the physical ports prefetched while initializing the TRANSCEIVER_STATUS_SW table.
+        # None when not prefetched.
+        self.presence_cache = None
         self.namespaces = namespaces
         self.port_obj_dict = port_obj_dict
         self.logger = syslogger.SysLogger(SYSLOG_IDENTIFIER_SFPSTATEUPDATETASK, enable_runtime_config=True)
@@ -326,6 +348,8 @@ class SfpStateUpdateTask(threading.Thread):
     def _post_port_sfp_info_and_dom_thr_to_db_once(self, port_mapping, xcvr_table_helper, stop_event=threading.Event()):
         # Connect to STATE_DB and create transceiver dom/sfp info tables
         transceiver_dict = {}
+        # Logical ports whose TRANSCEIVER_INFO row was published along with a breakout sibling
+        published_lports = set()
         retry_eeprom_set = set()
 
         # Post all the current interface sfp/dom threshold info to STATE_DB
@@ -344,7 +368,8 @@ class SfpStateUpdateTask(threading.Thread):
             namespace = common.get_namespace_from_asic_id(asic_index)
             is_warm_fast_reboot = self.warm_fast_reboot_status.get(namespace, False)
 
-            rc = post_port_sfp_info_to_db(logical_port_name, port_mapping, xcvr_table_helper.get_intf_tbl(asic_index), transceiver_dict, stop_event)
+            rc = post_port_sfp_info_to_db(logical_port_name, port_mapping, xcvr_table_helper.get_intf_tbl(asic_index), transceiver_dict, stop_event,
+                                          xcvr_table_helper=xcvr_table_helper, published_lports=published_lports)
             if rc != SFP_EEPROM_NOT_READY:
                 if is_warm_fast_reboot == False:
                     media_settings_parser.notify_media_setting(logical_port_name, transceiver_dict, xcvr_table_helper, port_mapping)
@@ -364,6 +389,12 @@ class SfpStateUpdateTask(threading.Thread):
 
         return retry_eeprom_set
 
+    def get_port_presence(self, physical_port):
+        """Returns the presence of a physical port, from presence_cache if prefetched"""
+        if self.presence_cache is not None and physical_port in self.presence_cache:
+            return self.presence_cache[physical_port]
+        return common._wrapper_get_presence(physical_port)
+
     # Init TRANSCEIVER_STATUS_SW table
     def _init_port_sfp_status_sw_tbl(self, port_mapping, xcvr_table_helper, stop_event=threading.Event()):
         # Init TRANSCEIVER_STATUS_SW table
@@ -388,7 +419,7 @@ class SfpStateUpdateTask(threading.Thread):
                 if stop_event.is_set():
                     break
 
-                if not common._wrapper_get_presence(physical_port):
+                if not self.get_port_presence(physical_port):
                     common.update_port_transceiver_status_table_sw(logical_port_name, xcvr_table_helper.get_status_sw_tbl(asic_index), sfp_status_helper.SFP_STATUS_REMOVED)
                 else:
                     common.update_port_transceiver_status_table_sw(logical_port_name, xcvr_table_helper.get_status_sw_tbl(asic_index), sfp_status_helper.SFP_STATUS_INSERTED)
@@ -553,6 +584,8 @@ class SfpStateUpdateTask(threading.Thread):
                         if logical_port_list is None:
                             helper_logger.log_warning("Got unknown FP port index {}, ignored".format(key))
                             continue
+                        # Logical ports whose TRANSCEIVER_INFO row was published along with a breakout sibling
+                        published_lports = set()
                         for logical_port in logical_port_list:
                             logical_port_dict[logical_port] = value
                             # Get the asic to which this port belongs
@@ -567,12 +600,14 @@ class SfpStateUpdateTask(threading.Thread):
                                 common.update_port_transceiver_status_table_sw(
                                     logical_port, self.xcvr_table_helper.get_status_sw_tbl(asic_index), sfp_status_helper.SFP_STATUS_INSERTED)
                                 helper_logger.log_notice("{}: received plug in and update port sfp status table.".format(logical_port))
-                                rc = post_port_sfp_info_to_db(logical_port, self.port_mapping, self.xcvr_table_helper.get_intf_tbl(asic_index), transceiver_dict)
+                                rc = post_port_sfp_info_to_db(logical_port, self.port_mapping, self.xcvr_table_helper.get_intf_tbl(asic_index), transceiver_dict,
+                                                              xcvr_table_helper=self.xcvr_table_helper, published_lports=published_lports)
                                 # If we didn't get the sfp info, assuming the eeprom is not ready, give a try again.
                                 if rc == SFP_EEPROM_NOT_READY:
                                     helper_logger.log_warning("{}: SFP EEPROM is not ready. One more try...".format(logical_port))
                                     time.sleep(TIME_FOR_SFP_READY_SECS)
-                                    rc = post_port_sfp_info_to_db(logical_port, self.port_mapping, self.xcvr_table_helper.get_intf_tbl(asic_index), transceiver_dict)
+                                    rc = post_port_sfp_info_to_db(logical_port, self.port_mapping, self.xcvr_table_helper.get_intf_tbl(asic_index), transceiver_dict,
+                                                              xcvr_table_helper=self.xcvr_table_helper, published_lports=published_lports)
                                     if rc == SFP_EEPROM_NOT_READY:
                                         # If still failed to read EEPROM, put it to retry set
                                         self.retry_eeprom_set.add(logical_port)
@@ -618,6 +653,7 @@ class SfpStateUpdateTask(threading.Thread):
                                                               self.xcvr_table_helper.get_status_flag_set_time_tbl(asic_index),
                                                               self.xcvr_table_helper.get_status_flag_clear_time_tbl(asic_index),
                                                               self.xcvr_table_helper.get_pm_tbl(asic_index),
+                                                              *[self.xcvr_table_helper.get_pm_interval_tbl(asic_index, key) for key in PM_INTERVAL_TYPES],
                                                               self.xcvr_table_helper.get_firmware_info_tbl(asic_index)
                                                               ])
                             else:
@@ -662,6 +698,7 @@ class SfpStateUpdateTask(threading.Thread):
                                                                       self.xcvr_table_helper.get_status_flag_set_time_tbl(asic_index),
                                                                       self.xcvr_table_helper.get_status_flag_clear_time_tbl(asic_index),
                                                                       self.xcvr_table_helper.get_pm_tbl(asic_index),
+                                                                      *[self.xcvr_table_helper.get_pm_interval_tbl(asic_index, key) for key in PM_INTERVAL_TYPES],
                                                                       self.xcvr_table_helper.get_firmware_info_tbl(asic_index)
                                                                       ])
                                 except (TypeError, ValueError) as e:
@@ -773,6 +810,7 @@ class SfpStateUpdateTask(threading.Thread):
                                       self.xcvr_table_helper.get_status_flag_clear_time_tbl(port_change_event.asic_id),
                                       self.xcvr_table_helper.get_status_sw_tbl(port_change_event.asic_id),
                                       self.xcvr_table_helper.get_pm_tbl(port_change_event.asic_id),
+                                      *[self.xcvr_table_helper.get_pm_interval_tbl(port_change_event.asic_id, key) for key in PM_INTERVAL_TYPES],
                                       self.xcvr_table_helper.get_firmware_info_tbl(port_change_event.asic_id)
                                       ])
 
@@ -863,10 +901,12 @@ class SfpStateUpdateTask(threading.Thread):
         self.last_retry_eeprom_time = now
 
         transceiver_dict = {}
+        published_lports = set()
         retry_success_set = set()
         for logical_port in self.retry_eeprom_set:
             asic_index = self.port_mapping.get_asic_id_for_logical_port(logical_port)
-            rc = post_port_sfp_info_to_db(logical_port, self.port_mapping, self.xcvr_table_helper.get_intf_tbl(asic_index), transceiver_dict)
+            rc = post_port_sfp_info_to_db(logical_port, self.port_mapping, self.xcvr_table_helper.get_intf_tbl(asic_index), transceiver_dict,
+                                          xcvr_table_helper=self.xcvr_table_helper, published_lports=published_lports)
             if rc != SFP_EEPROM_NOT_READY:
                 self.dom_db_utils.post_port_dom_thresholds_to_db(logical_port)
                 self.vdm_db_utils.post_port_vdm_thresholds_to_db(logical_port)
@@ -1084,13 +1124,18 @@ class DaemonXcvrd(daemon_base.DaemonBase):
         # Delete all the information from DB and then exit
         port_mapping_data = port_event_helper.get_port_mapping(self.namespaces)
         logical_port_list = port_mapping_data.logical_port_list
+
+        # Group the ports per ASIC so that each ASIC is cleaned up with a single pipeline flush
+        asic_logical_ports = {}
         for logical_port_name in logical_port_list:
             # Get the asic to which this port belongs
             asic_index = port_mapping_data.get_asic_id_for_logical_port(logical_port_name)
             if asic_index is None:
                 helper_logger.log_warning("Got invalid asic index for {}, ignored".format(logical_port_name))
                 continue
+            asic_logical_ports.setdefault(asic_index, []).append(logical_port_name)
 
+        for asic_index, logical_ports in asic_logical_ports.items():
             # Get warm/fast reboot status for this ASIC's namespace
             namespace = common.get_namespace_from_asic_id(asic_index)
             is_warm_fast_reboot = warm_fast_reboot_status.get(namespace, False)
@@ -1099,34 +1144,40 @@ class DaemonXcvrd(daemon_base.DaemonBase):
             # due to TRANSCEIVER_INFO table deletion during xcvrd shutdown/crash
             intf_tbl = None
 
-            common.del_port_sfp_dom_info_from_db(logical_port_name, port_mapping_data, [
-                                          intf_tbl,
-                                          self.xcvr_table_helper.get_dom_tbl(asic_index),
-                                          self.xcvr_table_helper.get_dom_temperature_tbl(asic_index),
-                                          self.xcvr_table_helper.get_dom_flag_tbl(asic_index),
-                                          self.xcvr_table_helper.get_dom_flag_change_count_tbl(asic_index),
-                                          self.xcvr_table_helper.get_dom_flag_set_time_tbl(asic_index),
-                                          self.xcvr_table_helper.get_dom_flag_clear_time_tbl(asic_index),
-                                          self.xcvr_table_helper.get_dom_threshold_tbl(asic_index),
-                                          *[self.xcvr_table_helper.get_vdm_threshold_tbl(asic_index, key) for key in VDM_THRESHOLD_TYPES],
-                                          self.xcvr_table_helper.get_vdm_real_value_tbl(asic_index),
-                                          *[self.xcvr_table_helper.get_vdm_flag_tbl(asic_index, key) for key in VDM_THRESHOLD_TYPES],
-                                          *[self.xcvr_table_helper.get_vdm_flag_change_count_tbl(asic_index, key) for key in VDM_THRESHOLD_TYPES],
-                                          *[self.xcvr_table_helper.get_vdm_flag_set_time_tbl(asic_index, key) for key in VDM_THRESHOLD_TYPES],
-                                          *[self.xcvr_table_helper.get_vdm_flag_clear_time_tbl(asic_index, key) for key in VDM_THRESHOLD_TYPES],
-                                          self.xcvr_table_helper.get_status_flag_tbl(asic_index),
-                                          self.xcvr_table_helper.get_status_flag_change_count_tbl(asic_index),
-                                          self.xcvr_table_helper.get_status_flag_set_time_tbl(asic_index),
-                                          self.xcvr_table_helper.get_status_flag_clear_time_tbl(asic_index),
-                                          self.xcvr_table_helper.get_pm_tbl(asic_index),
-                                          self.xcvr_table_helper.get_firmware_info_tbl(asic_index)
-                                          ])
+            tbl_to_del_list = [
+                intf_tbl,
+                self.xcvr_table_helper.get_dom_tbl(asic_index),
+                self.xcvr_table_helper.get_dom_temperature_tbl(asic_index),
+                self.xcvr_table_helper.get_dom_flag_tbl(asic_index),
+                self.xcvr_table_helper.get_dom_flag_change_count_tbl(asic_index),
+                self.xcvr_table_helper.get_dom_flag_set_time_tbl(asic_index),
+                self.xcvr_table_helper.get_dom_flag_clear_time_tbl(asic_index),
+                self.xcvr_table_helper.get_dom_threshold_tbl(asic_index),
+                *[self.xcvr_table_helper.get_vdm_threshold_tbl(asic_index, key) for key in VDM_THRESHOLD_TYPES],
+                self.xcvr_table_helper.get_vdm_real_value_tbl(asic_index),
+                *[self.xcvr_table_helper.get_vdm_flag_tbl(asic_index, key) for key in VDM_THRESHOLD_TYPES],
+                *[self.xcvr_table_helper.get_vdm_flag_change_count_tbl(asic_index, key) for key in VDM_THRESHOLD_TYPES],
+                *[self.xcvr_table_helper.get_vdm_flag_set_time_tbl(asic_index, key) for key in VDM_THRESHOLD_TYPES],
+                *[self.xcvr_table_helper.get_vdm_flag_clear_time_tbl(asic_index, key) for key in VDM_THRESHOLD_TYPES],
+                self.xcvr_table_helper.get_status_flag_tbl(asic_index),
+                self.xcvr_table_helper.get_status_flag_change_count_tbl(asic_index),
+                self.xcvr_table_helper.get_status_flag_set_time_tbl(asic_index),
+                self.xcvr_table_helper.get_status_flag_clear_time_tbl(asic_index),
+                self.xcvr_table_helper.get_pm_tbl(asic_index),
+                *[self.xcvr_table_helper.get_pm_interval_tbl(asic_index, key) for key in PM_INTERVAL_TYPES],
+                self.xcvr_table_helper.get_firmware_info_tbl(asic_index)
+            ]
 
             if not is_warm_fast_reboot:
-                common.del_port_sfp_dom_info_from_db(logical_port_name, port_mapping_data, [
-                                          self.xcvr_table_helper.get_status_tbl(asic_index),
-                                          self.xcvr_table_helper.get_status_sw_tbl(asic_index),
-                                          ])
+                tbl_to_del_list += [
+                    self.xcvr_table_helper.get_status_tbl(asic_index),
+                    self.xcvr_table_helper.get_status_sw_tbl(asic_index),
+                ]
+
+            elapsed_time = common.bulk_del_port_sfp_dom_info_from_db(logical_ports, port_mapping_data,
+                                                                     self.xcvr_table_helper, asic_index, tbl_to_del_list)
+            self.log_info("Deleted transceiver info of {} ports of ASIC {} in {:.3f} seconds".format(
+                len(logical_ports), asic_index, elapsed_time))
 
         del globals()['platform_chassis']
 
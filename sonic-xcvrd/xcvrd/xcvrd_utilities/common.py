@@ -7,13 +7,14 @@
 
 try:
     import sys
+    import concurrent.futures
     import functools
     import subprocess
     import traceback
     import threading
     from dataclasses import dataclass
     from types import MappingProxyType
-    from typing import Any, Callable, Dict, FrozenSet, Mapping, Set
+    from typing import Any, Callable, Dict, FrozenSet, Iterable, List, Mapping, Set
     from swsscommon import swsscommon
     from sonic_py_common import syslogger, daemon_base, device_info, multi_asic
     from . import sfp_status_helper
@@ -54,6 +55,9 @@ thread_loggers = {}
 CPO_DEVICE_TYPE_OE = 'optical_engine'
 CPO_DEVICE_TYPE_ELSFP = 'external_laser_source'
 
+# Maximum number of CPO devices read in parallel
+CPO_DEVICE_READ_MAX_WORKERS = 8
+
 
 def get_syslog_identifier_common():
     """Get syslog identifier based on current thread name, fallback to 'xcvrd_common'"""
@@ -293,6 +297,72 @@ def get_elsfp_sibling_pports(physical_port: int) -> FrozenSet[int]:
     """
     return _get_sibling_pports(physical_port, CPO_DEVICE_TYPE_ELSFP)
 
+def group_pports_by_cpo_devices(physical_ports: Iterable[int],
+                                sibling_pports_funcs: Iterable[Callable[[int], FrozenSet[int]]]) -> List[List[int]]:
+    """
+    Group physical ports driven by the same CPO devices.
+
+    Two physical ports are grouped together when each of sibling_pports_funcs returns
+    the same siblings for both of them, i.e. when they share the same devices of each
+    type. Physical ports not described by the platform topology are grouped alone.
+
+    Args:
+        physical_ports (Iterable[int]): Physical port indexes to group
+        sibling_pports_funcs (Iterable[Callable[[int], FrozenSet[int]]]): Sibling getters,
+            e.g. get_oe_sibling_pports and get_elsfp_sibling_pports
+
+    Returns:
+        List[List[int]]: Groups of physical ports, in the order of physical_ports
+    """
+    sibling_pports_funcs = tuple(sibling_pports_funcs)
+    groups = {}
+    for physical_port in physical_ports:
+        key = tuple(func(physical_port) for func in sibling_pports_funcs)
+        groups.setdefault(key, []).append(physical_port)
+    return list(groups.values())
+
+def read_once_per_cpo_device(pport_groups: List[List[int]], read_func: Callable[[int], Any],
+                             stop_event: threading.Event, max_workers: int = CPO_DEVICE_READ_MAX_WORKERS) -> Dict[int, Any]:
+    """
+    Read a device-level value once per group of physical ports sharing CPO devices,
+    and fan the value out to all physical ports of the group.
+
+    The groups do not share any device, so their reads are issued in parallel.
+
+    Args:
+        pport_groups (List[List[int]]): Groups returned by group_pports_by_cpo_devices
+        read_func (Callable[[int], Any]): Reads the value through a physical port,
+            e.g. _wrapper_get_presence
+        stop_event (threading.Event): Skips the reads not started yet once set
+        max_workers (int): Maximum number of reads in flight
+
+    Returns:
+        Dict[int, Any]: {physical port: value}. The physical ports of the groups whose
+        read failed or was skipped are left out, to be read individually by the caller.
+    """
+    def read_group(pports):
+        if stop_event.is_set():
+            return None
+        try:
+            return (read_func(pports[0]),)
+        except Exception as e:
+            return e
+
+    values = {}
+    pport_groups = [pports for pports in pport_groups if pports]
+    if not pport_groups:
+        return values
+
+    with concurrent.futures.ThreadPoolExecutor(max_workers=min(max_workers, len(pport_groups))) as executor:
+        for pports, result in zip(pport_groups, executor.map(read_group, pport_groups)):
+            if isinstance(result, Exception):
+                helper_logger.log_warning("CPO: got exception {} while reading physical ports {}, "
+                                          "reading them individually".format(repr(result), pports))
+            elif result is not None:
+                for physical_port in pports:
+                    values[physical_port] = result[0]
+    return values
+
 def is_copper(physical_port):
     """Check if the transceiver on the given physical port is copper"""
     if platform_chassis:
@@ -529,6 +599,22 @@ def del_port_sfp_dom_info_from_db(logical_port_name, port_mapping, tbl_to_del_li
             helper_logger.log_error("This functionality is currently not implemented for this platform")
             sys.exit(NOT_IMPLEMENTED_ERROR)
 
+def bulk_del_port_sfp_dom_info_from_db(logical_port_names, port_mapping, xcvr_table_helper, asic_id, tbl_to_del_list):
+    """Delete dom/sfp info of several ports of an ASIC from db, with one pipeline flush
+
+    Returns:
+        The time taken in seconds
+    """
+    physical_port_names = []
+    for logical_port_name in logical_port_names:
+        physical_port_names.extend(get_physical_port_name_dict(logical_port_name, port_mapping).values())
+
+    try:
+        return xcvr_table_helper.bulk_del(asic_id, physical_port_names, tbl_to_del_list)
+    except NotImplementedError:
+        helper_logger.log_error("This functionality is currently not implemented for this platform")
+        sys.exit(NOT_IMPLEMENTED_ERROR)
+
 #
 # Utility Functions ===========================================================
 #
@@ -291,18 +291,24 @@ def subscribe_port_config_change(namespaces):
         sel.addSelectable(port_tbl)
     return sel, asic_context
 
-def handle_port_config_change(sel, asic_context, stop_event, port_mapping, logger, port_change_event_handler):
+def handle_port_config_change(sel, asic_context, stop_event, port_mapping, logger, port_change_event_handler,
+                              timeout=SELECT_TIMEOUT_MSECS):
     """Select CONFIG_DB PORT table changes, once there is a port configuration add/remove, notify observers
+
+    Returns:
+        bool: True if the PORT table changes were read; False if there was nothing to read.
     """
     if not stop_event.is_set():
-        (state, _) = sel.select(SELECT_TIMEOUT_MSECS)
+        (state, _) = sel.select(timeout)
         if state == swsscommon.Select.TIMEOUT:
-            return
+            return False
         if state != swsscommon.Select.OBJECT:
             logger.log_warning('sel.select() did not return swsscommon.Select.OBJECT')
-            return
+            return False
 
         read_port_config_change(asic_context, port_mapping, logger, port_change_event_handler)
+        return True
+    return False
 
 def read_port_config_change(asic_context, port_mapping, logger, port_change_event_handler):
     for port_tbl in asic_context.keys():
@@ -1,4 +1,6 @@
 try:
+    import time
+
     from sonic_py_common import daemon_base, logger
     from sonic_py_common import multi_asic
     from swsscommon import swsscommon
@@ -17,6 +19,9 @@ TRANSCEIVER_DOM_FLAG_SET_TIME_TABLE = 'TRANSCEIVER_DOM_FLAG_SET_TIME'
 TRANSCEIVER_DOM_FLAG_CLEAR_TIME_TABLE = 'TRANSCEIVER_DOM_FLAG_CLEAR_TIME'
 TRANSCEIVER_DOM_THRESHOLD_TABLE = 'TRANSCEIVER_DOM_THRESHOLD'
 TRANSCEIVER_DOM_TEMPERATURE_TABLE = 'TRANSCEIVER_DOM_TEMPERATURE'
+# Temperatures of all the modules of an ASIC in a single hash, field per logical port
+TRANSCEIVER_DOM_TEMPERATURE_VECTOR_TABLE = 'TRANSCEIVER_DOM_TEMPERATURE_VECTOR'
+TRANSCEIVER_DOM_TEMPERATURE_VECTOR_KEY = 'modules'
 TRANSCEIVER_STATUS_TABLE = 'TRANSCEIVER_STATUS'
 TRANSCEIVER_STATUS_FLAG_TABLE = 'TRANSCEIVER_STATUS_FLAG'
 TRANSCEIVER_STATUS_FLAG_CHANGE_COUNT_TABLE = 'TRANSCEIVER_STATUS_FLAG_CHANGE_COUNT'
@@ -45,12 +50,17 @@ TRANSCEIVER_VDM_LALARM_FLAG_CLEAR_TIME = 'TRANSCEIVER_VDM_LALARM_FLAG_CLEAR_TIME
 TRANSCEIVER_VDM_HWARN_FLAG_CLEAR_TIME = 'TRANSCEIVER_VDM_HWARN_FLAG_CLEAR_TIME'
 TRANSCEIVER_VDM_LWARN_FLAG_CLEAR_TIME = 'TRANSCEIVER_VDM_LWARN_FLAG_CLEAR_TIME'
 TRANSCEIVER_PM_TABLE = 'TRANSCEIVER_PM'
+TRANSCEIVER_PM_15MIN_CURRENT_TABLE = 'TRANSCEIVER_PM_15MIN_CURRENT'
+TRANSCEIVER_PM_15MIN_PREVIOUS_TABLE = 'TRANSCEIVER_PM_15MIN_PREVIOUS'
+TRANSCEIVER_PM_24H_CURRENT_TABLE = 'TRANSCEIVER_PM_24H_CURRENT'
+TRANSCEIVER_PM_24H_PREVIOUS_TABLE = 'TRANSCEIVER_PM_24H_PREVIOUS'
 
 NPU_SI_SETTINGS_SYNC_STATUS_KEY = 'NPU_SI_SETTINGS_SYNC_STATUS'
 NPU_SI_SETTINGS_DEFAULT_VALUE = 'NPU_SI_SETTINGS_DEFAULT'
 NPU_SI_SETTINGS_NOTIFIED_VALUE = 'NPU_SI_SETTINGS_NOTIFIED'
 
 VDM_THRESHOLD_TYPES = ['halarm', 'lalarm', 'hwarn', 'lwarn']
+PM_INTERVAL_TYPES = ['15min_current', '15min_previous', '24h_current', '24h_previous']
 
 class XcvrTableHelper:
     def __init__(self, namespaces):
@@ -76,6 +86,10 @@ class XcvrTableHelper:
         self.vdm_flag_change_count_tbl = {f'vdm_{t}_flag_change_count_tbl': {} for t in VDM_THRESHOLD_TYPES}
         self.vdm_flag_set_time_tbl = {f'vdm_{t}_flag_set_time_tbl': {} for t in VDM_THRESHOLD_TYPES}
         self.vdm_flag_clear_time_tbl = {f'vdm_{t}_flag_clear_time_tbl': {} for t in VDM_THRESHOLD_TYPES}
+        self.pm_interval_tbl = {f'pm_{t}_tbl': {} for t in PM_INTERVAL_TYPES}
+        # STATE_DB pipeline of each ASIC and the buffered tables using it, created on demand
+        self.state_db_pipeline = {}
+        self.state_db_batch_tbl = {}
         for namespace in namespaces:
             asic_id = multi_asic.get_asic_index_from_namespace(namespace)
             self.state_db[asic_id] = daemon_base.db_connect("STATE_DB", namespace)
@@ -94,6 +108,8 @@ class XcvrTableHelper:
             self.status_flag_clear_time_tbl[asic_id] = swsscommon.Table(self.state_db[asic_id], TRANSCEIVER_STATUS_FLAG_CLEAR_TIME_TABLE)
             self.status_sw_tbl[asic_id] = swsscommon.Table(self.state_db[asic_id], TRANSCEIVER_STATUS_SW_TABLE)
             self.pm_tbl[asic_id] = swsscommon.Table(self.state_db[asic_id], TRANSCEIVER_PM_TABLE)
+            for t in PM_INTERVAL_TYPES:
+                self.pm_interval_tbl[f'pm_{t}_tbl'][asic_id] = swsscommon.Table(self.state_db[asic_id], f'TRANSCEIVER_PM_{t.upper()}')
             self.firmware_info_tbl[asic_id] = swsscommon.Table(self.state_db[asic_id], TRANSCEIVER_FIRMWARE_INFO_TABLE)
             self.state_port_tbl[asic_id] = swsscommon.Table(self.state_db[asic_id], swsscommon.STATE_PORT_TABLE_NAME)
             self.appl_db[asic_id] = daemon_base.db_connect("APPL_DB", namespace)
@@ -171,6 +187,9 @@ class XcvrTableHelper:
     def get_pm_tbl(self, asic_id):
         return self.pm_tbl[asic_id]
 
+    def get_pm_interval_tbl(self, asic_id, interval_type):
+        return self.pm_interval_tbl[f'pm_{interval_type}_tbl'][asic_id]
+
     def get_firmware_info_tbl(self, asic_id):
         return self.firmware_info_tbl[asic_id]
 
@@ -186,6 +205,89 @@ class XcvrTableHelper:
     def get_state_port_tbl(self, asic_id):
         return self.state_port_tbl[asic_id]
 
+    def get_state_db_pipeline(self, asic_id):
+        if asic_id not in self.state_db_pipeline:
+            self.state_db_pipeline[asic_id] = swsscommon.RedisPipeline(self.state_db[asic_id])
+        return self.state_db_pipeline[asic_id]
+
+    def get_state_db_batch_tbl(self, asic_id, table_name):
+        """
+        Retrieves a STATE_DB table of an ASIC whose operations are buffered in
+        the pipeline of the ASIC until it is flushed
+        """
+        batch_tbl = self.state_db_batch_tbl.get((asic_id, table_name))
+        if batch_tbl is None:
+            batch_tbl = swsscommon.Table(self.get_state_db_pipeline(asic_id), table_name, True)
+            self.state_db_batch_tbl[(asic_id, table_name)] = batch_tbl
+        return batch_tbl
+
+    def bulk_del(self, asic_id, keys, tbl_list):
+        """
+        Deletes keys from several STATE_DB tables of an ASIC with a single
+        pipeline flush, instead of one round trip per key and table
+        Args:
+            asic_id:
+                ASIC index of the tables
+            keys:
+                keys to delete from each table
+            tbl_list:
+                tables to delete the keys from, None entries are skipped
+        Returns:
+            The time taken in seconds
+        """
+        start_time = time.monotonic()
+        keys = list(keys)
+        tbl_list = [tbl for tbl in tbl_list if tbl is not None]
+        if keys and tbl_list:
+            for tbl in tbl_list:
+                batch_tbl = self.get_state_db_batch_tbl(asic_id, tbl.getTableName())
+                for key in keys:
+                    batch_tbl._del(key)
+            self.get_state_db_pipeline(asic_id).flush()
+
+        return time.monotonic() - start_time
+
+    def publish_rows(self, asic_id, table, keys, fv_list):
+        """
+        Publishes the same row to several keys of a STATE_DB table of an ASIC, e.g. to
+        the sibling logical ports of a breakout. The FieldValuePairs are built once,
+        the keys whose stored row already holds the same values are skipped and the
+        other keys are written with a single pipeline flush.
+        Args:
+            asic_id:
+                ASIC index of the table
+            table:
+                STATE_DB table to publish the row to
+            keys:
+                keys to publish the row to
+            fv_list:
+                list of (field, value) tuples of the row
+        Returns:
+            The list of keys written
+        """
+        changed_keys = []
+        for key in keys:
+            found, stored_fvs = table.get(key)
+            if found:
+                stored_dict = dict(stored_fvs)
+                if all(stored_dict.get(field) == str(value) for field, value in fv_list):
+                    continue
+            changed_keys.append(key)
+
+        if not changed_keys:
+            return changed_keys
+
+        fvs = swsscommon.FieldValuePairs(fv_list)
+        if len(changed_keys) == 1 or asic_id is None:
+            for key in changed_keys:
+                table.set(key, fvs)
+        else:
+            batch_tbl = self.get_state_db_batch_tbl(asic_id, table.getTableName())
+            for key in changed_keys:
+                batch_tbl.set(key, fvs)
+            self.get_state_db_pipeline(asic_id).flush()
+        return changed_keys
+
     def get_state_db_port_table_val_by_key(self, lport, port_mapping, key):
         """
         Retrieves the value of a key from STATE_DB PORT_TABLE|<lport> for the given logical port